@@ -0,0 +1,84 @@
+"""
+This module measures the construction time of a System Data record with all its fields set, one by
+one and at once with update_fields, and the parsing time of System Data contract tuples.
+
+Run it from the repository root with: PYTHONPATH=src python benchmarks/record_construction_benchmark.py
+"""
+
+import timeit
+
+from bcubed.constants.records.fields.common_data_fields import CommonDataFields
+from bcubed.constants.records.fields.id_value_fields import IdValueFields
+from bcubed.constants.records.fields.system_data_fields import SystemDataFields
+from bcubed.records.system_data_record import SystemDataRecord
+from bcubed.utilities.compression_help import compress_value
+from bcubed.utilities.parse_help import from_contract_tuple_to_system_data_records
+
+RECORDS_NUMBER = 5000
+REPEAT = 7
+
+
+def get_fields():
+    """
+    Returns a value, which is not the default one, for each field of the System Data record.
+    """
+
+    fields = {}
+
+    for field, default_value in SystemDataRecord().items():
+        if field in (CommonDataFields.FIELD_TYP_R, CommonDataFields.FIELD_FIE_N,
+                     CommonDataFields.FIELD_REC_T):
+            continue
+
+        if isinstance(default_value, bool):
+            fields[field] = True
+        elif isinstance(default_value, int):
+            fields[field] = 1
+        elif isinstance(default_value, str):
+            fields[field] = field
+        else:
+            field_value = type(default_value)()
+            field_value[IdValueFields.FIELD_ID] = 1
+            fields[field] = field_value
+
+    return fields
+
+
+def set_fields_one_by_one(fields: dict):
+    for _ in range(RECORDS_NUMBER):
+        system_data_record = SystemDataRecord()
+
+        for field, field_value in fields.items():
+            system_data_record[field] = field_value
+
+
+def set_fields_at_once(fields: dict):
+    for _ in range(RECORDS_NUMBER):
+        SystemDataRecord().update_fields(fields)
+
+
+def parse_contract_tuples(contract_tuples: list):
+    from_contract_tuple_to_system_data_records(contract_tuples)
+
+
+def main():
+    fields = get_fields()
+    contract_tuples = [
+        (1, 1000000 + index, SystemDataFields.FIELD_SYS_X, b'', 1, compress_value("sysX"),
+         0, b'', b'', b'')
+        for index in range(RECORDS_NUMBER)]
+
+    benchmarks = [("Fields set one by one", lambda: set_fields_one_by_one(fields)),
+                  ("Parsing", lambda: parse_contract_tuples(contract_tuples))]
+
+    if hasattr(SystemDataRecord, "update_fields"):
+        benchmarks.append(("Fields set at once", lambda: set_fields_at_once(fields)))
+
+    for name, function in benchmarks:
+        seconds = min(timeit.repeat(function, number=1, repeat=REPEAT))
+
+        print(f"{name}: {seconds * 1000000 / RECORDS_NUMBER:.2f} us per record")
+
+
+if __name__ == "__main__":
+    main()
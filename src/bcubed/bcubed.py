@@ -12,6 +12,7 @@ from web3 import Web3
 from bcubed.blockchain.contract import Contract
 from bcubed.blockchain.network import Network
 from bcubed.blockchain.node import Node
+from bcubed.blockchain.system_data_record_writer import SystemDataRecordWriter
 from bcubed.config.config import Config
 from bcubed.constants.config.config_categories import ConfigCategories
 from bcubed.constants.config.config_keys import ConfigKeys
@@ -24,6 +25,8 @@ class BCubed:
     instance to interact with.
     """
 
+    __writer = None
+
     def __init__(self):
         self.__name = Config().get_property(ConfigKeys.NAME)
         self.__provider = Web3.HTTPProvider(self.__get_config_provider())
@@ -57,3 +60,26 @@ class BCubed:
         Returns Node instance.
         """
         return self.__node
+
+    def get_writer(self):
+        """
+        Returns the SystemDataRecordWriter instance, which stores System Data records without
+        blocking the caller. It is created the first time it is requested.
+        """
+        if self.__writer is None or self.__writer.is_closed():
+            queue_size = Config().get_property(
+                ConfigKeys.QUEUE_SIZE, ConfigCategories.WRITER)
+
+            self.__writer = SystemDataRecordWriter(self.__node, queue_size)
+
+        return self.__writer
+
+    def close(self):
+        """
+        Stores the remaining System Data records and closes the writer, if it was requested, and
+        the Node.
+        """
+        if self.__writer is not None:
+            self.__writer.close()
+
+        self.__node.close()
@@ -0,0 +1,155 @@
+"""
+This is a class-containing module.
+
+It contains the BucketKeyCache class, which is responsible for keeping a local copy of the bucket
+keys of the contract, so a timestamp range is looked up without downloading all the keys.
+"""
+
+import bisect
+import logging
+import struct
+
+from pathlib import Path
+
+
+KEY = struct.Struct('<Q')
+# The cache file starts with the contract address, so the keys of another contract are discarded
+ADDRESS_SIZE = 20
+
+
+class BucketKeyCache:
+    """
+    It contains the bucket keys of the contract in the contract order, which are only appended
+    until the cache is cleared, and the sorted unique keys, which are looked up with bisect. If
+    path is not None, the keys are also appended to the cache file and loaded from it when the
+    cache is created, so only the keys added to the contract since then are fetched. A torn key at
+    the end of the file is discarded.
+    """
+
+    __logger = logging.getLogger(__name__)
+
+    def __init__(self, contract_address: str, path: str = None) -> None:
+        self.__address = (bytes.fromhex(contract_address[2:])
+                          if isinstance(contract_address, str) and
+                          len(contract_address) == 2 + 2 * ADDRESS_SIZE
+                          else bytes(ADDRESS_SIZE))
+        self.__path = Path(path) if path else None
+
+        self.__keys = []
+        self.__sorted_keys = []
+        self.__is_contract_order_sorted = True
+
+        if self.__path is not None:
+            self.__load()
+
+        self.__logger.info("%s is initialized. Keys: %d", __class__.__name__, len(self.__keys))
+
+    def __load(self):
+        if self.__path.exists() is False:
+            return
+
+        with open(self.__path, 'rb') as file:
+            data = file.read()
+
+        if data[:ADDRESS_SIZE] != self.__address:
+            self.__logger.info("The key cache belongs to another contract. It is discarded.")
+            self.__path.unlink()
+
+            return
+
+        keys_size = (len(data) - ADDRESS_SIZE) // KEY.size * KEY.size
+        if ADDRESS_SIZE + keys_size != len(data):
+            self.__logger.warning(
+                "Torn key found in the key cache. Discarded bytes: %d",
+                len(data) - ADDRESS_SIZE - keys_size)
+
+            with open(self.__path, 'r+b') as file:
+                file.truncate(ADDRESS_SIZE + keys_size)
+
+        self.__add_keys([key for key, in KEY.iter_unpack(data[ADDRESS_SIZE:][:keys_size])])
+
+    def __add_keys(self, keys: list):
+        for key in keys:
+            if len(self.__keys) > 0 and key < self.__keys[-1]:
+                self.__is_contract_order_sorted = False
+
+            self.__keys.append(key)
+
+            # The keys of a live robot are appended in increasing order
+            if len(self.__sorted_keys) == 0 or key > self.__sorted_keys[-1]:
+                self.__sorted_keys.append(key)
+            else:
+                index = bisect.bisect_left(self.__sorted_keys, key)
+                if self.__sorted_keys[index] != key:
+                    self.__sorted_keys.insert(index, key)
+
+    def add_keys(self, keys: list):
+        """
+        Appends the keys fetched from the contract after the ones in the cache, and writes them to
+        the cache file, if any. A lost write only makes the keys be fetched again.
+        """
+
+        self.__add_keys(keys)
+
+        if self.__path is None or len(keys) == 0:
+            return
+
+        with open(self.__path, 'ab') as file:
+            if file.tell() == 0:
+                file.write(self.__address)
+
+            file.write(b''.join(KEY.pack(key) for key in keys))
+
+    def clear(self):
+        """
+        Removes all the keys, and the cache file, if any, so the keys are fetched again. It is
+        called when the keys of the cache are not the ones of the contract.
+        """
+
+        self.__keys = []
+        self.__sorted_keys = []
+        self.__is_contract_order_sorted = True
+
+        if self.__path is not None and self.__path.exists():
+            self.__path.unlink()
+
+    def get_first_keys(self, count: int):
+        """
+        Returns up to the first count keys in the contract order.
+        """
+
+        return self.__keys[:count]
+
+    def get_keys_count(self):
+        """
+        Returns the number of contract keys in the cache, which is the index of the next key to
+        fetch.
+        """
+
+        return len(self.__keys)
+
+    def get_keys(self, min_timestamp: int = None, max_timestamp: int = None):
+        """
+        Returns the sorted unique keys between min_timestamp and max_timestamp, or all of them if
+        they are None.
+        """
+
+        start = 0 if min_timestamp is None else bisect.bisect_left(
+            self.__sorted_keys, min_timestamp)
+        end = len(self.__sorted_keys) if max_timestamp is None else bisect.bisect_right(
+            self.__sorted_keys, max_timestamp)
+
+        return self.__sorted_keys[start:end]
+
+    def get_key_positions(self, min_timestamp: int, max_timestamp: int):
+        """
+        Returns the positions, in the contract order, of the first key and after the last key that
+        can be between min_timestamp and max_timestamp. If the contract keys are not sorted, it
+        returns the positions of all of them.
+        """
+
+        if self.__is_contract_order_sorted is False:
+            return 0, len(self.__keys)
+
+        return (bisect.bisect_left(self.__keys, min_timestamp),
+                bisect.bisect_right(self.__keys, max_timestamp))
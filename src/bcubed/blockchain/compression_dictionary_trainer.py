@@ -0,0 +1,69 @@
+"""
+This is a class-containing module.
+
+It contains the CompressionDictionaryTrainer class, which is responsible for training a compression
+dictionary per System Data field from a sample of its first values.
+"""
+
+import logging
+
+from bcubed.utilities.compression_help import train_compression_dictionary
+
+
+DEFAULT_SAMPLES = 64
+DEFAULT_DICTIONARY_SIZE = 4096
+
+
+class CompressionDictionaryTrainer:
+    """
+    It collects the first values of each trained field. Once a field has the number of samples,
+    its compression dictionary is trained and the field is not sampled anymore, so the same
+    dictionary is used for the rest of the records.
+    """
+
+    __logger = logging.getLogger(__name__)
+
+    def __init__(self, fields: list, samples: int = DEFAULT_SAMPLES,
+                 dictionary_size: int = DEFAULT_DICTIONARY_SIZE) -> None:
+        self.__samples_number = samples or DEFAULT_SAMPLES
+        self.__dictionary_size = dictionary_size or DEFAULT_DICTIONARY_SIZE
+
+        self.__samples = dict((field, []) for field in fields or [])
+
+    def is_training(self, field: str):
+        """
+        Returns True if the values of the field are still being sampled.
+        """
+
+        return field in self.__samples
+
+    def stop_training(self, field: str):
+        """
+        Stops sampling the values of the field, for example, because it already has a dictionary.
+        """
+
+        self.__samples.pop(field, None)
+
+    def add_sample(self, field: str, value: str):
+        """
+        Adds the value to the samples of the field. Returns the trained compression dictionary when
+        the field reaches the number of samples, and None otherwise.
+        """
+
+        if self.is_training(field) is False:
+            return None
+
+        samples = self.__samples[field]
+        samples.append(value)
+
+        if len(samples) < self.__samples_number:
+            return None
+
+        self.stop_training(field)
+
+        dictionary = train_compression_dictionary(samples, self.__dictionary_size)
+
+        self.__logger.info("Compression dictionary trained. Field: %s. Size: %d",
+                           field, len(dictionary))
+
+        return dictionary
@@ -0,0 +1,111 @@
+"""
+This is a class-containing module.
+
+It contains the FlushPolicy class, which is responsible for deciding when the buffered System Data
+records must be sent to the blockchain network.
+"""
+
+import logging
+import threading
+import time
+
+
+DEFAULT_TARGET_INCLUSION_TIME = 30
+DEFAULT_MIN_TARGET_GAS = 1000000
+
+# Block fullness above which the batches are shrunk and below which they can grow
+HIGH_BLOCK_FULLNESS = 0.9
+LOW_BLOCK_FULLNESS = 0.5
+
+DECREASE_FACTOR = 0.75
+INCREASE_FACTOR = 1.25
+
+
+class FlushPolicy:
+    """
+    It contains the flush triggers of the buffered System Data records: the age of the oldest
+    record, the number of records and their encoded bytes. A zero or empty trigger is disabled.
+    If it is adaptive, the target batch gas is shrunk when the batches take longer than the target
+    inclusion time or the blocks are nearly full, and grown back, up to max_target_gas, when they
+    are included quickly in blocks with room.
+    """
+
+    __logger = logging.getLogger(__name__)
+
+    def __init__(self, max_target_gas: int, max_age: float = None, max_records: int = None,
+                 max_bytes: int = None, adaptive: bool = False,
+                 target_inclusion_time: float = DEFAULT_TARGET_INCLUSION_TIME,
+                 min_target_gas: int = DEFAULT_MIN_TARGET_GAS) -> None:
+        self.__max_age = max_age or 0
+        self.__max_records = max_records or 0
+        self.__max_bytes = max_bytes or 0
+
+        self.__adaptive = adaptive is True
+        self.__target_inclusion_time = target_inclusion_time or DEFAULT_TARGET_INCLUSION_TIME
+        self.__max_target_gas = max_target_gas
+        self.__min_target_gas = min(min_target_gas or DEFAULT_MIN_TARGET_GAS, max_target_gas)
+
+        self.__lock = threading.Lock()
+        self.__target_gas = max_target_gas
+
+    def is_adaptive(self):
+        """
+        Returns True if the target batch gas depends on the observed inclusion time and block
+        fullness.
+        """
+
+        return self.__adaptive
+
+    def is_expired(self, oldest_record_time: float):
+        """
+        Returns True if the oldest buffered record, buffered at oldest_record_time (monotonic
+        time), is older than max_age.
+        """
+
+        return (self.__max_age > 0 and oldest_record_time is not None and
+                time.monotonic() - oldest_record_time >= self.__max_age)
+
+    def is_full(self, records_number: int, records_size: int):
+        """
+        Returns True if the buffer reaches max_records records or max_bytes encoded bytes.
+        """
+
+        return ((self.__max_records > 0 and records_number >= self.__max_records) or
+                (self.__max_bytes > 0 and records_size >= self.__max_bytes))
+
+    def get_target_gas(self):
+        """
+        Returns the gas limit that the batches must not exceed.
+        """
+
+        with self.__lock:
+            return self.__target_gas
+
+    def observe(self, inclusion_time: float, block_fullness: float = None):
+        """
+        Updates the target batch gas with the inclusion time of the last batch, in seconds, and the
+        fullness (used gas / gas limit) of the last block, if it is known.
+        """
+
+        if self.__adaptive is False:
+            return
+
+        with self.__lock:
+            previous_target_gas = self.__target_gas
+
+            if (inclusion_time > self.__target_inclusion_time or
+                    (block_fullness is not None and block_fullness > HIGH_BLOCK_FULLNESS)):
+                self.__target_gas = max(
+                    self.__min_target_gas, int(self.__target_gas * DECREASE_FACTOR))
+
+            elif (inclusion_time < self.__target_inclusion_time / 2 and
+                  (block_fullness is None or block_fullness < LOW_BLOCK_FULLNESS)):
+                self.__target_gas = min(
+                    self.__max_target_gas, int(self.__target_gas * INCREASE_FACTOR))
+
+            target_gas = self.__target_gas
+
+        if target_gas != previous_target_gas:
+            self.__logger.debug(
+                "Target batch gas updated: %d. Inclusion time: %.2f. Block fullness: %s",
+                target_gas, inclusion_time, block_fullness)
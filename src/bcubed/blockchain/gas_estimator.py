@@ -0,0 +1,151 @@
+"""
+This is a class-containing module.
+
+It contains the GasEstimator class, which is responsible for estimating the gas of the System Data
+records locally, so the blockchain network is only asked on cache misses or recalibrations.
+"""
+
+import logging
+import math
+
+from collections import OrderedDict
+
+from bcubed.blockchain.network import BUCKET_DIVISOR, Network
+from bcubed.constants.records.fields.generic_system_data_fields import GenericSystemDataFields
+from bcubed.constants.records.fields.system_data_fields import SystemDataFields
+from bcubed.utilities.encoding_help import get_encoded_words
+
+
+DEFAULT_SAFETY_MARGIN = 0.05
+DEFAULT_RECALIBRATION_INTERVAL = 1000
+
+MAX_KNOWN_BUCKETS = 4096
+
+VALUE_FIELDS = (
+    GenericSystemDataFields.FIELD_VAL_F,
+    GenericSystemDataFields.FIELD_VALUE_TWO,
+    GenericSystemDataFields.FIELD_VALUE_1_FOU,
+    GenericSystemDataFields.FIELD_VALUE_2_FOU,
+    GenericSystemDataFields.FIELD_VALUE_3_FOU,
+)
+
+
+class GasEstimator:
+    """
+    It contains the gas learnt for each record shape. The shape is defined by the namF value, the
+    populated value group, the encoded length of the values, in ABI words, and whether the
+    timestamp bucket is new. The estimated gas is requested to the blockchain network on cache
+    misses and every recalibration_interval hits of the same shape. The safety margin is added to
+    the batch gas limit, so batches never exceed the transaction cap when a learnt value is low.
+    """
+
+    __logger = logging.getLogger(__name__)
+
+    def __init__(self, network: Network,
+                 safety_margin: float = DEFAULT_SAFETY_MARGIN,
+                 recalibration_interval: int = DEFAULT_RECALIBRATION_INTERVAL) -> None:
+        self.__network = network
+
+        self.__safety_margin = DEFAULT_SAFETY_MARGIN if safety_margin is None else safety_margin
+        self.__recalibration_interval = (
+            DEFAULT_RECALIBRATION_INTERVAL if recalibration_interval is None
+            else recalibration_interval)
+
+        self.__estimated_gas_by_shape = {}
+        self.__hits_by_shape = {}
+        self.__known_buckets = OrderedDict()
+
+        self.__hits = 0
+        self.__misses = 0
+
+    def __is_new_bucket(self, system_timestamp: int):
+        bucket = system_timestamp // BUCKET_DIVISOR
+
+        if bucket in self.__known_buckets:
+            self.__known_buckets.move_to_end(bucket)
+            return False
+
+        self.__known_buckets[bucket] = True
+        if len(self.__known_buckets) > MAX_KNOWN_BUCKETS:
+            self.__known_buckets.popitem(last=False)
+
+        return True
+
+    def __get_populated_group(self, contract_tuple: dict):
+        if contract_tuple.get(GenericSystemDataFields.FIELD_VAL_F, b'') != b'':
+            return GenericSystemDataFields.FIELD_VAL_F
+
+        if contract_tuple.get(GenericSystemDataFields.FIELD_ID_TWO, 0) != 0:
+            return GenericSystemDataFields.FIELD_ID_TWO
+
+        if contract_tuple.get(GenericSystemDataFields.FIELD_ID_FOU, 0) != 0:
+            return GenericSystemDataFields.FIELD_ID_FOU
+
+        return None
+
+    def get_shape(self, contract_tuple: dict, is_new_bucket: bool = False):
+        """
+        Returns the shape of the contract tuple, which is used as the cache key.
+        """
+
+        encoded_words = tuple(
+            get_encoded_words(contract_tuple.get(field, b'')) for field in VALUE_FIELDS)
+
+        return (contract_tuple.get(GenericSystemDataFields.FIELD_NAM_F, ""),
+                self.__get_populated_group(contract_tuple),
+                encoded_words,
+                is_new_bucket)
+
+    def get_estimated_gas(self, contract_tuple: dict):
+        """
+        Returns the estimated gas of the contract tuple. If the shape is not known or it must be
+        recalibrated, the blockchain network is asked. Returns 0 if it cannot be estimated.
+        """
+
+        is_new_bucket = self.__is_new_bucket(
+            contract_tuple.get(SystemDataFields.FIELD_SYS_T, 0))
+        shape = self.get_shape(contract_tuple, is_new_bucket)
+
+        hits = self.__hits_by_shape.get(shape, 0)
+        if shape in self.__estimated_gas_by_shape and hits < self.__recalibration_interval:
+            self.__hits_by_shape[shape] = hits + 1
+            self.__hits += 1
+
+            return self.__estimated_gas_by_shape[shape]
+
+        gas = self.__network.get_estimated_gas([contract_tuple])
+        self.__misses += 1
+
+        self.__logger.debug("Gas estimated for shape %s: %d", shape, gas)
+
+        if gas > 0:
+            self.__estimated_gas_by_shape[shape] = gas
+            self.__hits_by_shape[shape] = 0
+
+        return gas
+
+    def get_gas_limit(self, estimated_gas: int):
+        """
+        Returns the gas limit of a transaction whose estimated gas is estimated_gas, that is, the
+        estimated gas plus the safety margin.
+        """
+
+        # Rounded before ceiling to avoid floating point errors, e.g. 100000 * 1.1
+        return math.ceil(round(estimated_gas * (1 + self.__safety_margin), 6))
+
+    def get_statistics(self):
+        """
+        Returns the number of cache hits and misses (blockchain network estimations).
+        """
+
+        return self.__hits, self.__misses
+
+    def clear(self):
+        """
+        Removes all the learnt shapes, so the next estimations are requested to the blockchain
+        network.
+        """
+
+        self.__estimated_gas_by_shape.clear()
+        self.__hits_by_shape.clear()
+        self.__known_buckets.clear()
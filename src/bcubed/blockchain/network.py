@@ -9,11 +9,14 @@ blockchain and returning records from the blockchain.
 import logging
 import math
 import sys
+import time
 
 from web3 import Web3
 from web3.exceptions import (
     BadFunctionCallOutput,
     ContractLogicError,
+    TimeExhausted,
+    TransactionNotFound,
     Web3AttributeError,
     Web3RPCError,
     Web3TypeError,
@@ -22,11 +25,19 @@ from web3.exceptions import (
 
 from eth_abi.exceptions import InsufficientDataBytes
 
+from bcubed.blockchain.bucket_key_cache import BucketKeyCache
+from bcubed.blockchain.nonce_manager import NonceManager
+from bcubed.blockchain.read_cache import OVERVIEW_KEY, ReadCache
+from bcubed.blockchain.transaction_pipeline import TransactionPipeline
 from bcubed.config.config import Config
 from bcubed.constants.config.config_categories import ConfigCategories
 from bcubed.constants.config.config_keys import ConfigKeys
 from bcubed.records.meta_data_record import MetaDataRecord
 from bcubed.records.overview_data_record import OverviewDataRecord
+from bcubed.utilities.encoding_help import (
+    SYSTEM_DATA_RECORD_ABI_TYPE,
+    decode_system_data_contract_tuple
+)
 
 from bcubed.utilities.parse_help import (
     from_contract_tuple_to_meta_data_record,
@@ -43,6 +54,44 @@ TRANSACTION_FROM = 'from'
 TRANSACTION_MAX_FEE_PER_GAS = 'maxFeePerGas'
 TRANSACTION_NONCE = 'nonce'
 
+NONCE_ERROR_RETRIES = 1
+
+DEFAULT_MAX_RESUBMISSIONS = 3
+
+# The contract stores the records in buckets of sysT / 1000000
+BUCKET_DIVISOR = 1000000
+
+LOG_ADDRESS = 'address'
+LOG_FROM_BLOCK = 'fromBlock'
+LOG_TO_BLOCK = 'toBlock'
+LOG_TOPICS = 'topics'
+LOG_DATA = 'data'
+
+SYSTEM_DATA_RECORD_LOGGED_TOPIC = Web3.keccak(
+    text=f"SystemDataRecordLogged(uint64,string,{SYSTEM_DATA_RECORD_ABI_TYPE})").to_0x_hex()
+DEFAULT_BLOCK_RANGE = 10000
+# Wider bucket ranges are filtered locally instead of by topic
+MAX_TOPIC_BUCKETS = 64
+
+RANGE_QUERY_FUNCTION = 'getSystemDataRecordsInRange'
+KEYS_COUNT_FUNCTION = 'getSystemDataRecordKeysCount'
+KEYS_FROM_FUNCTION = 'getSystemDataRecordKeysFrom'
+# The keys that are fetched in each call to update the BucketKeyCache
+KEYS_FROM_LIMIT = 4096
+# The number of keys of the BucketKeyCache compared with the contract ones when it is loaded
+KEY_CACHE_CHECK_KEYS = 16
+# The keys that are read in each call to the range query, halved when the network rejects a call
+RANGE_QUERY_LIMIT = 256
+
+LATEST_BLOCK = 'latest'
+BLOCK_GAS_USED = 'gasUsed'
+BLOCK_GAS_LIMIT = 'gasLimit'
+
+META_KEY = 'meta'
+BUCKET_KEY_PREFIX = 'bucket-'
+
+DEFAULT_FINALIZATION_CHECK_INTERVAL = 0
+
 
 class Network:
     """
@@ -56,6 +105,16 @@ class Network:
 
     __contract_address = None
     __deployed_contract = None
+    __transaction_pipeline = None
+    __event_log = False
+    __contract_functions = set()
+    __bucket_key_cache = None
+    __is_bucket_key_cache_checked = False
+    __key_cache_path = None
+    __read_cache = None
+    __read_cache_config = None
+    __read_block_number = None
+    __read_block_time = None
 
     def __init__(self, web3: Web3) -> None:
         self.__w3 = web3
@@ -85,6 +144,44 @@ class Network:
         # It is needed to support different blockchain simulators
         self.__account_address = self.__w3.to_checksum_address(account_address)
 
+        self.__nonce_manager = NonceManager(
+            self.__w3, self.__account_address)
+
+        self.__max_resubmissions = config.get_property(
+            ConfigKeys.MAX_RESUBMISSIONS, ConfigCategories.PIPELINE)
+        if self.__max_resubmissions is None:
+            self.__max_resubmissions = DEFAULT_MAX_RESUBMISSIONS
+
+        if config.get_property(ConfigKeys.ENABLED, ConfigCategories.PIPELINE) is True:
+            self.__transaction_pipeline = TransactionPipeline(
+                self.__w3,
+                self.__nonce_manager,
+                config.get_property(
+                    ConfigKeys.MAX_IN_FLIGHT, ConfigCategories.PIPELINE),
+                config.get_property(
+                    ConfigKeys.POLL_INTERVAL, ConfigCategories.PIPELINE),
+                config.get_property(
+                    ConfigKeys.RECEIPT_TIMEOUT, ConfigCategories.PIPELINE))
+
+        self.__event_log = config.get_property(
+            ConfigKeys.ENABLED, ConfigCategories.EVENT_LOG) is True
+        self.__block_range = config.get_property(
+            ConfigKeys.BLOCK_RANGE, ConfigCategories.EVENT_LOG) or DEFAULT_BLOCK_RANGE
+
+        if config.get_property(ConfigKeys.ENABLED, ConfigCategories.KEY_CACHE) is True:
+            self.__key_cache_path = config.get_property(
+                ConfigKeys.PATH, ConfigCategories.KEY_CACHE)
+
+        if config.get_property(ConfigKeys.ENABLED, ConfigCategories.READ_CACHE) is True:
+            self.__read_cache_config = (
+                config.get_property(ConfigKeys.MAX_BYTES, ConfigCategories.READ_CACHE),
+                config.get_property(ConfigKeys.PATH, ConfigCategories.READ_CACHE))
+
+            self.__finalization_check_interval = config.get_property(
+                ConfigKeys.FINALIZATION_CHECK_INTERVAL, ConfigCategories.READ_CACHE)
+            if self.__finalization_check_interval is None:
+                self.__finalization_check_interval = DEFAULT_FINALIZATION_CHECK_INTERVAL
+
         self.__private_key = config.get_property(
             ConfigKeys.PRIVATE_KEY, ConfigCategories.NETWORK
         )
@@ -126,26 +223,20 @@ class Network:
             try:
                 python_contract = self.__w3.eth.contract(
                     abi=abi, bytecode=byte_code)
-                nonce = self.__w3.eth.get_transaction_count(
-                    self.__account_address)
 
                 block = self.__w3.eth.get_block('latest')
                 next_gas_price = math.ceil(block.get('baseFeePerGas') * 1.251)
 
                 # Construct the transaction
-                transaction = python_contract.constructor().build_transaction(
+                transaction_container = self.__build_and_send_transaction(
+                    python_contract.constructor(),
                     {
                         TRANSACTION_CHAIN_ID: self.__chain_id,
                         TRANSACTION_FROM: self.__account_address,
-                        TRANSACTION_NONCE: nonce,
                         TRANSACTION_MAX_FEE_PER_GAS: next_gas_price
                     }
                 )
 
-                transaction_container = self.__sign_and_send_raw_transaction(
-                    transaction
-                )
-
                 self.__contract_address = self.__w3.to_checksum_address(
                     transaction_container.contractAddress
                 )
@@ -181,8 +272,211 @@ class Network:
             address=self.__contract_address, abi=abi
         )
 
+        # The contracts deployed before a contract method was added do not have it
+        self.__contract_functions = set(
+            abi_item.get('name') for abi_item in abi if isinstance(abi_item, dict))
+
+        # The keys are cached in memory, and on disk if the key cache is enabled
+        self.__bucket_key_cache = None
+        self.__is_bucket_key_cache_checked = False
+        if KEYS_FROM_FUNCTION in self.__contract_functions:
+            self.__bucket_key_cache = BucketKeyCache(
+                self.__contract_address, self.__key_cache_path)
+
+        self.__read_cache = None
+        self.__read_block_number = None
+        self.__read_block_time = None
+        if self.__read_cache_config is not None:
+            self.__read_cache = ReadCache(self.__contract_address, *self.__read_cache_config)
+
         self.__logger.info("Contract is deployed.")
 
+    def __get_read_block_number(self):
+        """
+        Returns the block number which the reads are pinned to while the black box is live, or
+        None once it is finalized. The black box is finalized when the Overview Data record is
+        stored, which is checked once for each new block. A live black box keeps its reads pinned
+        to the same block for the finalization check interval, 0 by default, without requesting
+        the latest block number, unless this Network confirms a transaction.
+        """
+
+        if self.__read_cache.is_finalized() is True:
+            return None
+
+        now = time.monotonic()
+        if (self.__read_block_time is not None and
+                now - self.__read_block_time < self.__finalization_check_interval):
+            return self.__read_block_number
+
+        block_number = self.__w3.eth.block_number
+        if block_number == self.__read_block_number:
+            self.__read_block_time = now
+
+            return block_number
+
+        overview_contract_tuple = self.__deployed_contract.functions.getOverviewDataRecord().call(
+            block_identifier=block_number)
+
+        if overview_contract_tuple[0] == 0:
+            self.__read_block_number = block_number
+            self.__read_block_time = now
+            self.__read_cache.put(OVERVIEW_KEY, overview_contract_tuple, block_number)
+
+            return block_number
+
+        self.__logger.info("The black box is finalized. Its reads are cached permanently.")
+
+        self.__read_cache.set_finalized()
+        self.__read_cache.put(OVERVIEW_KEY, overview_contract_tuple)
+
+        return None
+
+    def __call_cached(self, key: str, contract_function):
+        """
+        Returns the result of calling to the contract function, from the ReadCache if it is
+        enabled and the result is cached for the block which the reads are pinned to.
+        """
+
+        if self.__read_cache is None:
+            return contract_function.call()
+
+        block_number = self.__get_read_block_number()
+
+        result = self.__read_cache.get(key, block_number)
+        if result is not None:
+            return result
+
+        if block_number is None:
+            result = contract_function.call()
+        else:
+            result = contract_function.call(block_identifier=block_number)
+
+        self.__read_cache.put(key, result, block_number)
+
+        return result
+
+    def __build_and_send_transaction(self, contract_function, transaction_parameters: dict):
+        """
+        Builds the transaction with a nonce reserved by the NonceManager, signs it, sends it and
+        waits for its receipt. If the nonce is rejected, the nonces are resynchronized and the
+        transaction is sent again. If the transaction is not sent, the nonce is released.
+        """
+
+        for attempt in range(NONCE_ERROR_RETRIES + 1):
+            nonce = self.__nonce_manager.reserve()
+
+            try:
+                transaction = contract_function.build_transaction(
+                    dict(transaction_parameters, **{TRANSACTION_NONCE: nonce}))
+
+                hash_transaction, raw_transaction = self.__sign_and_send_raw_transaction(
+                    transaction)
+
+            except Web3RPCError as ex:
+                if NonceManager.is_nonce_error(ex) and attempt < NONCE_ERROR_RETRIES:
+                    self.__nonce_manager.resync()
+                    continue
+
+                self.__release_nonce(nonce, ex)
+                raise
+
+            except Exception:
+                self.__nonce_manager.release(nonce)
+                raise
+
+            receipt = self.__wait_for_transaction_receipt(hash_transaction, raw_transaction, nonce)
+
+            # The next read is pinned to a block that includes the transaction
+            self.__read_block_time = None
+
+            return receipt
+
+        return None
+
+    def __wait_for_transaction_receipt(self, hash_transaction, raw_transaction: bytes, nonce: int):
+        """
+        Waits for the receipt of the transaction until another transaction with its nonce is
+        mined, so a transaction that is mined late is never sent again with a new nonce. While its
+        nonce is not mined, the transaction is sent again as it is, in case it was dropped, up to
+        max_resubmissions times. Then the nonces are resynchronized and TimeExhausted is raised.
+        """
+
+        resubmissions = 0
+        while True:
+            try:
+                return self.__w3.eth.wait_for_transaction_receipt(
+                    hash_transaction
+                )
+
+            except TimeExhausted as ex:
+                if self.__nonce_manager.is_nonce_mined(nonce) is False:
+                    if resubmissions >= self.__max_resubmissions:
+                        self.__logger.error(
+                            "Transaction with nonce %d was not mined after %d resubmissions",
+                            nonce, resubmissions)
+
+                        self.__nonce_manager.resync()
+
+                        raise
+
+                    self.__logger.warning(
+                        "Transaction with nonce %d was not mined yet. It is sent again", nonce)
+
+                    self.__resend_raw_transaction(raw_transaction, nonce)
+                    resubmissions += 1
+
+                    continue
+
+                # The transaction may be mined after the last poll
+                try:
+                    return self.__w3.eth.get_transaction_receipt(hash_transaction)
+
+                except TransactionNotFound:
+                    self.__logger.error(
+                        "Transaction with nonce %d was replaced by another transaction", nonce)
+
+                    raise ex from None
+
+    def __submit_transaction(
+            self, contract_function, transaction_parameters: dict, callback=None):
+        """
+        Builds the transaction with a nonce reserved by the NonceManager, signs it and submits it
+        to the TransactionPipeline, without waiting for its receipt. The callback is called with
+        True or False once the transaction is confirmed or failed.
+        """
+
+        nonce = self.__nonce_manager.reserve()
+
+        try:
+            transaction = contract_function.build_transaction(
+                dict(transaction_parameters, **{TRANSACTION_NONCE: nonce}))
+
+            signed_transaction = self.__w3.eth.account.sign_transaction(
+                transaction, private_key=self.__private_key
+            )
+
+        except Exception:
+            self.__nonce_manager.release(nonce)
+            raise
+
+        self.__transaction_pipeline.submit(
+            signed_transaction.raw_transaction, nonce, callback)
+
+    def __release_nonce(self, nonce: int, ex: Exception):
+        if NonceManager.is_nonce_error(ex):
+            self.__nonce_manager.resync()
+        else:
+            self.__nonce_manager.release(nonce)
+
+    def __resend_raw_transaction(self, raw_transaction: bytes, nonce: int):
+        try:
+            self.__w3.eth.send_raw_transaction(raw_transaction)
+
+        # The transaction is usually known by the node yet
+        except Web3RPCError as ex:
+            self.__logger.debug(
+                "Transaction with nonce %d was not sent again: %s", nonce, ex)
+
     def __sign_and_send_raw_transaction(self, transaction):
         signed_transaction = self.__w3.eth.account.sign_transaction(
             transaction, private_key=self.__private_key
@@ -192,11 +486,7 @@ class Network:
             signed_transaction.raw_transaction
         )
 
-        transaction_container = self.__w3.eth.wait_for_transaction_receipt(
-            hash_transaction
-        )
-
-        return transaction_container
+        return hash_transaction, signed_transaction.raw_transaction
 
     def store_meta_data_record(self, meta_data_record: MetaDataRecord):
         """
@@ -207,20 +497,15 @@ class Network:
         contract_tuple = from_record_to_contract_tuple(meta_data_record)
 
         try:
-            transaction = self.__deployed_contract.functions.setMetaDataRecord(
-                tuple(contract_tuple.values())
-            ).build_transaction(
+            self.__build_and_send_transaction(
+                self.__deployed_contract.functions.setMetaDataRecord(
+                    tuple(contract_tuple.values())),
                 {
                     TRANSACTION_CHAIN_ID: self.__chain_id,
                     TRANSACTION_FROM: self.__account_address,
-                    TRANSACTION_NONCE: self.__w3.eth.get_transaction_count(
-                        self.__account_address
-                    ),
                 }
             )
 
-            self.__sign_and_send_raw_transaction(transaction)
-
         except Web3AttributeError as ex:
             self.__logger.error(
                 "Web3AttributeError when storing new MD record: %s", ex)
@@ -270,12 +555,12 @@ class Network:
     def get_meta_data_record(self):
         """
         Calls to the contract method getMetaDataRecord to retrieve the stored meta data record and
-        returns it.
+        returns it. The call is cached if the read cache is enabled.
         """
 
         try:
-            contract_tuple = (
-                self.__deployed_contract.functions.getMetaDataRecord().call())
+            contract_tuple = self.__call_cached(
+                META_KEY, self.__deployed_contract.functions.getMetaDataRecord())
             meta_data_record = from_contract_tuple_to_meta_data_record(
                 contract_tuple)
 
@@ -308,27 +593,88 @@ class Network:
 
         return meta_data_record
 
-    def store_system_data_records(self, system_data_records: list, estimated_gas: int):
+    def is_pipelined(self):
+        """
+        Returns True if the System Data records transactions are sent through the
+        TransactionPipeline, so they are confirmed asynchronously.
+        """
+
+        return self.__transaction_pipeline is not None
+
+    def is_event_log(self):
+        """
+        Returns True if the System Data records are emitted as contract events instead of being
+        stored in the contract storage.
+        """
+
+        return self.__event_log
+
+    def __get_store_function(self, system_data_records: list):
+        if self.__event_log is True:
+            return self.__deployed_contract.functions.logSystemDataRecords(
+                tuple(system_data_records))
+
+        return self.__deployed_contract.functions.addSystemDataRecords(
+            tuple(system_data_records))
+
+    def wait_for_pending_transactions(self, timeout: float = None):
+        """
+        Waits until all the pipelined transactions are confirmed or failed.
+        Returns True if there are no pending transactions, and False if the timeout expires.
+        """
+
+        if self.__transaction_pipeline is None:
+            return True
+
+        return self.__transaction_pipeline.wait(timeout)
+
+    def __get_confirmation_callback(self, system_data_records: list, estimated_gas: int, callback):
+        def confirmation_callback(stored: bool):
+            if stored:
+                self.__logger.info("New %d SD records were stored Estimated gas: %d",
+                                   len(system_data_records), estimated_gas)
+
+                self.__read_block_time = None
+            else:
+                self.__logger.error(
+                    "The transaction of %d SD records failed", len(system_data_records))
+
+            if callback is not None:
+                callback(stored)
+
+        return confirmation_callback
+
+    def store_system_data_records(
+            self, system_data_records: list, estimated_gas: int, callback=None):
         """
         Initiates the transaction with the blockchain network using the addSystemDataRecords smart
         contract function in order to store the System Data records.
+        If the network is pipelined, it returns True once the transaction is submitted and the
+        callback is called with True or False once the transaction is confirmed or failed.
         """
 
         try:
-            transaction = self.__deployed_contract.functions.addSystemDataRecords(
-                tuple(system_data_records)
-            ).build_transaction(
-                {
-                    TRANSACTION_CHAIN_ID: self.__chain_id,
-                    TRANSACTION_FROM: self.__account_address,
-                    TRANSACTION_NONCE: self.__w3.eth.get_transaction_count(
-                        self.__account_address
-                    ),
-                    TRANSACTION_GAS: estimated_gas,
-                }
-            )
+            contract_function = self.__get_store_function(system_data_records)
+            transaction_parameters = {
+                TRANSACTION_CHAIN_ID: self.__chain_id,
+                TRANSACTION_FROM: self.__account_address,
+                TRANSACTION_GAS: estimated_gas,
+            }
 
-            self.__sign_and_send_raw_transaction(transaction)
+            if self.__transaction_pipeline is not None:
+                self.__submit_transaction(
+                    contract_function,
+                    transaction_parameters,
+                    self.__get_confirmation_callback(
+                        system_data_records, estimated_gas, callback))
+
+                self.__logger.debug("New %d SD records were submitted",
+                                    len(system_data_records))
+
+                return True
+
+            self.__build_and_send_transaction(
+                contract_function, transaction_parameters)
 
         except Web3AttributeError as ex:
             self.__logger.error(
@@ -374,15 +720,120 @@ class Network:
 
         return True
 
-    def get_system_data_records_timestamps(self):
+    def __is_bucket_key_cache_stale(self, keys_count: int):
+        """
+        Returns True if the BucketKeyCache has keys that are not the ones of the contract, which
+        happens with a cache file of another chain or after a redeployment at the same address. The
+        cache cannot have more keys than the contract, and its first keys are compared with the
+        contract ones the first time it is updated.
+        """
+
+        cached_keys_count = self.__bucket_key_cache.get_keys_count()
+        if cached_keys_count == 0:
+            return False
+
+        if keys_count is not None and keys_count < cached_keys_count:
+            return True
+
+        if self.__is_bucket_key_cache_checked is True:
+            return False
+
+        first_keys = self.__bucket_key_cache.get_first_keys(KEY_CACHE_CHECK_KEYS)
+
+        return list(self.__deployed_contract.functions.getSystemDataRecordKeysFrom(
+            0, len(first_keys)).call()) != first_keys
+
+    def __update_bucket_key_cache(self):
+        """
+        Fetches the keys added to the contract since the last update of the BucketKeyCache, in
+        calls of up to KEYS_FROM_LIMIT keys. If the cached keys are not the ones of the contract,
+        they are discarded and fetched again.
+        """
+
+        keys_count = self.get_system_data_record_keys_count()
+
+        try:
+            if self.__is_bucket_key_cache_stale(keys_count):
+                self.__logger.warning(
+                    "The key cache does not match the contract keys. It is rebuilt. Keys: %d",
+                    self.__bucket_key_cache.get_keys_count())
+
+                self.__bucket_key_cache.clear()
+
+        except Web3AttributeError as ex:
+            self.__logger.error(
+                "Web3AttributeError when checking the key cache: %s", ex)
+
+            return
+
+        except Web3TypeError as ex:
+            self.__logger.error(
+                "Web3TypeError when checking the key cache: %s", ex)
+
+            return
+
+        self.__is_bucket_key_cache_checked = True
+
+        while keys_count is None or self.__bucket_key_cache.get_keys_count() < keys_count:
+            try:
+                keys = self.__deployed_contract.functions.getSystemDataRecordKeysFrom(
+                    self.__bucket_key_cache.get_keys_count(), KEYS_FROM_LIMIT).call()
+
+            except Web3AttributeError as ex:
+                self.__logger.error(
+                    "Web3AttributeError when getting SD record keys: %s", ex)
+
+                return
+
+            except Web3TypeError as ex:
+                self.__logger.error(
+                    "Web3TypeError when getting SD record keys: %s", ex)
+
+                return
+
+            self.__bucket_key_cache.add_keys(keys)
+
+            if len(keys) < KEYS_FROM_LIMIT and (keys_count is None or len(keys) == 0):
+                return
+
+    def get_system_data_records_timestamps(
+        self, min_timestamp: int = None, max_timestamp: int = None
+    ):
         """
         Calls to the contract method getSystemDataRecordKeys to retrieve the systemDataRecord keys
-        (timestamps) of the stored system data records.
+        (timestamps) of the stored system data records, sorted and unique, between min_timestamp
+        and max_timestamp, or all of them if they are None.
+        If the contract has the method getSystemDataRecordKeysFrom, only the keys added since the
+        last call are retrieved, and the range is looked up in the BucketKeyCache.
         """
 
+        if self.__event_log is True:
+            system_data_record_keys = sorted(set(
+                contract_tuple[1] // BUCKET_DIVISOR for contract_tuple in
+                self.__get_logged_contract_tuples(None, None)))
+
+        elif self.__bucket_key_cache is not None:
+            self.__update_bucket_key_cache()
+
+            return self.__bucket_key_cache.get_keys(min_timestamp, max_timestamp)
+
+        else:
+            system_data_record_keys = self.__get_contract_system_data_records_timestamps()
+
+        return [timestamp for timestamp in system_data_record_keys
+                if (min_timestamp is None or timestamp >= min_timestamp) and
+                (max_timestamp is None or timestamp <= max_timestamp)]
+
+    def __get_contract_system_data_records_timestamps(self):
         try:
             system_data_record_keys = self.__deployed_contract.functions.getSystemDataRecordKeys().call()
-            unique_timestamps_sorted = sorted(set(system_data_record_keys))
+
+            # The keys are unique and sorted, unless the contract was deployed before the keys
+            # were unique or the records were not stored in sysT order
+            unique_timestamps_sorted = list(system_data_record_keys)
+            if any(previous_key >= key for previous_key, key in
+                   zip(unique_timestamps_sorted, unique_timestamps_sorted[1:])):
+                unique_timestamps_sorted = sorted(set(unique_timestamps_sorted))
 
         except Web3AttributeError as ex:
             self.__logger.error(
@@ -399,20 +850,27 @@ class Network:
         return unique_timestamps_sorted
 
     def get_system_data_records_by_timestamp(
-        self, timestamp: int
+        self, timestamp: int, raw_fragments: bool = False, compact: bool = False
     ):
         """
         Calls to the contract method getSystemDataRecordsByTimestamp to retrieve the field
         values of the stored system data records, which have their timestamp between min_timestamp
-        and max_timestamp.
+        and max_timestamp. The split records are reassembled unless raw_fragments is True. If
+        compact is True, the records are returned as CompactSystemDataRecord. The call is cached
+        if the read cache is enabled.
         """
 
+        if self.__event_log is True:
+            return self.get_logged_system_data_records(
+                timestamp, timestamp, raw_fragments, compact)
+
         try:
-            contract_tuples = (
-                self.__deployed_contract.functions.getSystemDataRecordsByTimestamp(timestamp).call())
+            contract_tuples = self.__call_cached(
+                BUCKET_KEY_PREFIX + str(timestamp),
+                self.__deployed_contract.functions.getSystemDataRecordsByTimestamp(timestamp))
 
             system_data_records = from_contract_tuple_to_system_data_records(
-                contract_tuples)
+                contract_tuples, raw_fragments, compact)
 
         except Web3AttributeError as ex:
             self.__logger.error(
@@ -428,6 +886,402 @@ class Network:
 
         return system_data_records
 
+    def get_system_data_record_keys_count(self):
+        """
+        Calls to the contract method getSystemDataRecordKeysCount to retrieve the number of
+        systemDataRecord keys, that is, the number of timestamp buckets. Returns None if the
+        contract does not have the method.
+        """
+
+        if KEYS_COUNT_FUNCTION not in self.__contract_functions:
+            return None
+
+        try:
+            keys_count = self.__deployed_contract.functions.getSystemDataRecordKeysCount().call()
+
+        except Web3AttributeError as ex:
+            self.__logger.error(
+                "Web3AttributeError when getting SD record keys count: %s", ex)
+
+            return None
+
+        except Web3TypeError as ex:
+            self.__logger.error(
+                "Web3TypeError when getting SD record keys count: %s", ex)
+
+            return None
+
+        return keys_count
+
+    def is_range_query(self):
+        """
+        Returns True if the deployed contract has the getSystemDataRecordsInRange method, so the
+        records of a timestamp range are read with paginated calls instead of one call per
+        timestamp.
+        """
+
+        return RANGE_QUERY_FUNCTION in self.__contract_functions
+
+    def iter_system_data_records_in_range(
+        self, min_timestamp: int, max_timestamp: int, raw_fragments: bool = False,
+        compact: bool = False
+    ):
+        """
+        Yields the stored System Data records whose bucket timestamp is between min_timestamp and
+        max_timestamp, a list for each call to the contract method getSystemDataRecordsInRange,
+        walking its cursor until the keys are exhausted. Each call reads up to RANGE_QUERY_LIMIT
+        keys. If the network rejects a call, for example because it exceeds the eth_call gas or
+        size limit, it is repeated with half the keys. The buckets whose key is repeated in several
+        calls are only returned once. The split records are reassembled unless raw_fragments is
+        True. If compact is True, the records are returned as CompactSystemDataRecord.
+        """
+
+        cursor = 0
+        limit = RANGE_QUERY_LIMIT
+        returned_buckets = set()
+
+        # With the BucketKeyCache, only the keys that can be in the range are read
+        if self.__bucket_key_cache is not None:
+            self.__update_bucket_key_cache()
+
+            cursor, keys_count = self.__bucket_key_cache.get_key_positions(
+                min_timestamp, max_timestamp)
+        else:
+            keys_count = self.get_system_data_record_keys_count()
+
+        while keys_count is None or cursor < keys_count:
+            try:
+                range_query = self.__deployed_contract.functions.getSystemDataRecordsInRange(
+                    min_timestamp, max_timestamp, cursor, limit)
+                contract_tuples, next_cursor = range_query.call()
+
+            except Web3AttributeError as ex:
+                self.__logger.error(
+                    "Web3AttributeError when getting SD records in range: %s", ex)
+
+                return
+
+            except Web3TypeError as ex:
+                self.__logger.error(
+                    "Web3TypeError when getting SD records in range: %s", ex)
+
+                return
+
+            except Web3RPCError as ex:
+                if limit == 1:
+                    self.__logger.error(
+                        "Web3RPCError when getting SD records in range: %s", ex.message)
+
+                    return
+
+                self.__logger.debug(
+                    "Web3RPCError when getting SD records in range, the limit is halved: %s",
+                    ex.message)
+
+                limit //= 2
+
+                continue
+
+            page_buckets = set(
+                contract_tuple[1] // BUCKET_DIVISOR for contract_tuple in contract_tuples)
+            contract_tuples = [tuple(contract_tuple) for contract_tuple in contract_tuples
+                               if contract_tuple[1] // BUCKET_DIVISOR not in returned_buckets]
+            returned_buckets.update(page_buckets)
+
+            if len(contract_tuples) > 0:
+                yield from_contract_tuple_to_system_data_records(
+                    contract_tuples, raw_fragments, compact)
+
+            # Without the keys count, fewer keys than the limit are read only when they are exhausted
+            if keys_count is None and next_cursor - cursor < limit:
+                return
+
+            cursor = next_cursor
+
+    def get_system_data_contract_tuples_by_timestamp(self, timestamp: int):
+        """
+        Calls to the contract method getSystemDataRecordsByTimestamp to retrieve the contract
+        tuples of the stored system data records, without parsing them, in order to compare them
+        with the records that are waiting to be stored.
+        """
+
+        if self.__event_log is True:
+            return [tuple(contract_tuple) for contract_tuple in
+                    self.__get_logged_contract_tuples(timestamp, timestamp)]
+
+        try:
+            contract_tuples = self.__call_cached(
+                BUCKET_KEY_PREFIX + str(timestamp),
+                self.__deployed_contract.functions.getSystemDataRecordsByTimestamp(timestamp))
+
+        except Web3AttributeError as ex:
+            self.__logger.error(
+                "Web3AttributeError when getting SD records by timestamp: %s", ex
+            )
+            return []
+
+        except Web3TypeError as ex:
+            self.__logger.error(
+                "Web3TypeError when getting SD records by timestamp: %s", ex
+            )
+            return []
+
+        return [tuple(contract_tuple) for contract_tuple in contract_tuples]
+
+    def __get_bucket_topics(self, min_timestamp: int, max_timestamp: int):
+        if (min_timestamp is None or max_timestamp is None or
+                max_timestamp - min_timestamp >= MAX_TOPIC_BUCKETS):
+            return None
+
+        return ['0x' + bucket.to_bytes(32, 'big').hex()
+                for bucket in range(min_timestamp, max_timestamp + 1)]
+
+    def __get_logs(self, from_block: int, to_block: int, bucket_topics: list):
+        """
+        Returns the SystemDataRecordLogged logs between from_block and to_block. If the network
+        rejects the query, for example because it returns too many logs, the block range is split
+        in halves.
+        """
+
+        logs = []
+        block_ranges = [(from_block, to_block)]
+
+        while len(block_ranges) > 0:
+            range_from_block, range_to_block = block_ranges.pop()
+
+            try:
+                logs.extend(self.__w3.eth.get_logs({
+                    LOG_ADDRESS: self.__deployed_contract.address,
+                    LOG_FROM_BLOCK: range_from_block,
+                    LOG_TO_BLOCK: range_to_block,
+                    LOG_TOPICS: [SYSTEM_DATA_RECORD_LOGGED_TOPIC, bucket_topics],
+                }))
+
+            except Web3RPCError as ex:
+                if range_from_block == range_to_block:
+                    raise
+
+                self.__logger.debug(
+                    "Web3RPCError when getting logs, the block range is split: %s", ex.message)
+
+                middle_block = (range_from_block + range_to_block) // 2
+                block_ranges.append((middle_block + 1, range_to_block))
+                block_ranges.append((range_from_block, middle_block))
+
+        return logs
+
+    def __get_logged_contract_tuples(self, min_timestamp: int, max_timestamp: int):
+        """
+        Returns the contract tuples of the logged System Data records whose bucket timestamp is
+        between min_timestamp and max_timestamp, or all of them if they are None. The logs are
+        read in chunks of block_range blocks, from the block of the first logged record.
+        """
+
+        try:
+            first_log_block = self.__deployed_contract.functions.getFirstLogBlock().call()
+            if first_log_block == 0:
+                return []
+
+            last_block = self.__w3.eth.block_number
+            bucket_topics = self.__get_bucket_topics(min_timestamp, max_timestamp)
+
+            contract_tuples = []
+            for from_block in range(first_log_block, last_block + 1, self.__block_range):
+                to_block = min(from_block + self.__block_range - 1, last_block)
+
+                for log in self.__get_logs(from_block, to_block, bucket_topics):
+                    contract_tuple = decode_system_data_contract_tuple(bytes(log[LOG_DATA]))
+                    bucket = contract_tuple[1] // BUCKET_DIVISOR
+
+                    if ((min_timestamp is None or bucket >= min_timestamp) and
+                            (max_timestamp is None or bucket <= max_timestamp)):
+                        contract_tuples.append(contract_tuple)
+
+        except Web3AttributeError as ex:
+            self.__logger.error(
+                "Web3AttributeError when getting logged SD records: %s", ex)
+
+            return []
+
+        except Web3TypeError as ex:
+            self.__logger.error(
+                "Web3TypeError when getting logged SD records: %s", ex)
+
+            return []
+
+        except Web3RPCError as ex:
+            self.__logger.error(
+                "Web3RPCError when getting logged SD records: %s", ex.message)
+
+            return []
+
+        return contract_tuples
+
+    def get_logged_system_data_records(
+            self, min_timestamp: int, max_timestamp: int, raw_fragments: bool = False,
+            compact: bool = False):
+        """
+        Returns the System Data records emitted by the contract method logSystemDataRecords whose
+        bucket timestamp is between min_timestamp and max_timestamp. Unlike the records in the
+        contract storage, the whole range is read with eth_getLogs instead of one call per
+        timestamp. The split records are reassembled unless raw_fragments is True. If compact is
+        True, the records are returned as CompactSystemDataRecord.
+        """
+
+        return from_contract_tuple_to_system_data_records(
+            self.__get_logged_contract_tuples(min_timestamp, max_timestamp), raw_fragments, compact)
+
+    def store_compression_dictionary(self, dictionary_id: int, field: str, dictionary: bytes):
+        """
+        Initiates the transaction with the blockchain network using the addCompressionDictionary
+        smart contract function in order to store the compression dictionary of the field.
+        """
+
+        try:
+            self.__build_and_send_transaction(
+                self.__deployed_contract.functions.addCompressionDictionary(
+                    (dictionary_id, field, dictionary)),
+                {
+                    TRANSACTION_CHAIN_ID: self.__chain_id,
+                    TRANSACTION_FROM: self.__account_address,
+                }
+            )
+
+        except Web3AttributeError as ex:
+            self.__logger.error(
+                "Web3AttributeError when storing compression dictionary: %s", ex)
+
+            return False
+
+        except Web3TypeError as ex:
+            self.__logger.error(
+                "Web3TypeError when storing compression dictionary: %s", ex)
+
+            return False
+
+        except Web3RPCError as ex:
+            if 'Insufficient funds for gas * price + value' in ex.args[0]:
+                self.__logger.critical(
+                    "Web3RPCError when storing compression dictionary: %s", ex)
+                sys.exit()
+
+            else:
+                self.__logger.error(
+                    "Web3RPCError when storing compression dictionary: %s", ex)
+
+                return False
+
+        except ContractLogicError as ex:
+            self.__logger.error(
+                "ContractLogicError when storing compression dictionary: %s", ex.message)
+
+            return False
+
+        self.__logger.info(
+            "New compression dictionary was stored. Id: %d. Field: %s", dictionary_id, field)
+
+        return True
+
+    def get_compression_dictionaries(self):
+        """
+        Calls to the contract method getCompressionDictionaries to retrieve the stored compression
+        dictionaries and returns them as (id, field, dictionary) tuples.
+        """
+
+        try:
+            contract_tuples = (
+                self.__deployed_contract.functions.getCompressionDictionaries().call())
+
+        except Web3AttributeError as ex:
+            self.__logger.error(
+                "Web3AttributeError when getting compression dictionaries: %s", ex)
+
+            return []
+
+        except Web3TypeError as ex:
+            self.__logger.error(
+                "Web3TypeError when getting compression dictionaries: %s", ex)
+
+            return []
+
+        return [tuple(contract_tuple) for contract_tuple in contract_tuples]
+
+    def store_batch_anchor(
+            self, root: bytes, records_number: int, min_sys_t: int, max_sys_t: int):
+        """
+        Initiates the transaction with the blockchain network using the addBatchAnchor smart
+        contract function in order to store the Merkle root, the number of records and the time
+        range of a batch of System Data records.
+        """
+
+        try:
+            self.__build_and_send_transaction(
+                self.__deployed_contract.functions.addBatchAnchor(
+                    (root, records_number, min_sys_t, max_sys_t)),
+                {
+                    TRANSACTION_CHAIN_ID: self.__chain_id,
+                    TRANSACTION_FROM: self.__account_address,
+                }
+            )
+
+        except Web3AttributeError as ex:
+            self.__logger.error(
+                "Web3AttributeError when storing new batch anchor: %s", ex)
+
+            return False
+
+        except Web3TypeError as ex:
+            self.__logger.error(
+                "Web3TypeError when storing new batch anchor: %s", ex)
+
+            return False
+
+        except Web3RPCError as ex:
+            if 'Insufficient funds for gas * price + value' in ex.args[0]:
+                self.__logger.critical(
+                    "Web3RPCError when storing new batch anchor: %s", ex)
+                sys.exit()
+
+            else:
+                self.__logger.error(
+                    "Web3RPCError when storing new batch anchor: %s", ex)
+
+                return False
+
+        except ContractLogicError as ex:
+            self.__logger.error(
+                "ContractLogicError when storing new batch anchor: %s", ex.message)
+
+            return False
+
+        self.__logger.info("New batch anchor of %d SD records was stored. Root: %s",
+                           records_number, root.hex())
+
+        return True
+
+    def get_batch_anchors(self):
+        """
+        Calls to the contract method getBatchAnchors to retrieve the stored batch anchors and
+        returns them as (root, count, minSysT, maxSysT) tuples.
+        """
+
+        try:
+            contract_tuples = self.__deployed_contract.functions.getBatchAnchors().call()
+
+        except Web3AttributeError as ex:
+            self.__logger.error(
+                "Web3AttributeError when getting batch anchors: %s", ex)
+
+            return []
+
+        except Web3TypeError as ex:
+            self.__logger.error(
+                "Web3TypeError when getting batch anchors: %s", ex)
+
+            return []
+
+        return [tuple(contract_tuple) for contract_tuple in contract_tuples]
+
     def store_overview_data_record(self, overview_data_record: OverviewDataRecord):
         """
         Initiates the transaction with the blockchain network using the setOverviewDataRecord smart
@@ -438,19 +1292,15 @@ class Network:
 
         try:
             tuple_values = tuple(contract_tuple.values())
-            transaction = self.__deployed_contract.functions.setOverviewDataRecord(
-                tuple_values).build_transaction(
+            self.__build_and_send_transaction(
+                self.__deployed_contract.functions.setOverviewDataRecord(
+                    tuple_values),
                 {
                     TRANSACTION_CHAIN_ID: self.__chain_id,
                     TRANSACTION_FROM: self.__account_address,
-                    TRANSACTION_NONCE: self.__w3.eth.get_transaction_count(
-                        self.__account_address
-                    ),
                 }
             )
 
-            self.__sign_and_send_raw_transaction(transaction)
-
         except Web3AttributeError as ex:
             self.__logger.error(
                 "Web3AttributeError when storing new OD record: %s", ex)
@@ -489,12 +1339,12 @@ class Network:
     def get_overview_data_record(self):
         """
         Calls to the contract method getOverviewDataRecord to retrieve the stored overview data
-        record and returns it.
+        record and returns it. The call is cached if the read cache is enabled.
         """
 
         try:
-            contract_tuple = (
-                self.__deployed_contract.functions.getOverviewDataRecord().call())
+            contract_tuple = self.__call_cached(
+                OVERVIEW_KEY, self.__deployed_contract.functions.getOverviewDataRecord())
             overview_data_record = from_contract_tuple_to_overview_data_record(
                 contract_tuple)
 
@@ -524,11 +1374,12 @@ class Network:
 
     def get_estimated_gas(self, system_data_records: list):
         """
-        Returns the estimated gas for the addSystemDataRecords call.
+        Returns the estimated gas for the addSystemDataRecords call, or the logSystemDataRecords
+        call if the records are logged.
         """
 
         try:
-            gas = self.__deployed_contract.functions.addSystemDataRecords(tuple(system_data_records)).estimate_gas({
+            gas = self.__get_store_function(system_data_records).estimate_gas({
                 TRANSACTION_CHAIN_ID: self.__chain_id,
                 TRANSACTION_FROM: self.__account_address,
             })
@@ -607,3 +1458,30 @@ class Network:
         self.__logger.debug("First timestamp: %d", final_timestamp)
 
         return final_timestamp
+
+    def get_block_fullness(self):
+        """
+        Returns the fullness of the latest block, that is, its used gas divided by its gas limit.
+        Returns None if it cannot be retrieved.
+        """
+
+        try:
+            block = self.__w3.eth.get_block(LATEST_BLOCK)
+            block_fullness = block[BLOCK_GAS_USED] / block[BLOCK_GAS_LIMIT]
+
+        except Web3AttributeError as ex:
+            self.__logger.error(
+                "Web3AttributeError when getting the block fullness: %s", ex)
+
+            return None
+
+        except Web3TypeError as ex:
+            self.__logger.error(
+                "Web3TypeError when getting the block fullness: %s", ex)
+
+            return None
+
+        except ZeroDivisionError:
+            return None
+
+        return block_fullness
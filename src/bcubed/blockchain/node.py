@@ -6,30 +6,81 @@ transactions.
 """
 
 import logging
+import math
 import os
 import sys
+import threading
+import time
 
+from collections import Counter, deque
 from pathlib import Path
 
-from zlib import decompressobj
-
-from bcubed.blockchain.network import Network
+from bcubed.blockchain.compression_dictionary_trainer import CompressionDictionaryTrainer
+from bcubed.blockchain.flush_policy import FlushPolicy
+from bcubed.blockchain.gas_estimator import BUCKET_DIVISOR, GasEstimator
+from bcubed.blockchain.network import DEFAULT_MAX_RESUBMISSIONS, Network
 from bcubed.blockchain.contract import Contract
+from bcubed.blockchain.record_packer import RecordPacker
+from bcubed.blockchain.sample_packer import SamplePacker
+from bcubed.blockchain.segment_store import SegmentStore
+from bcubed.blockchain.system_data_record_spool import SystemDataRecordSpool
 from bcubed.config.config import Config
 from bcubed.constants.config.config_categories import ConfigCategories
 from bcubed.constants.config.config_keys import ConfigKeys
 from bcubed.constants.records.fields.generic_system_data_fields import GenericSystemDataFields
+from bcubed.constants.records.fields.id_value_fields import IdValueFields
+from bcubed.constants.records.fields.system_data_fields import SystemDataFields
 from bcubed.records.meta_data_record import MetaDataRecord
 from bcubed.records.system_data_record import SystemDataRecord
 from bcubed.records.generic_system_data_record import GenericSystemDataRecord
 from bcubed.records.overview_data_record import OverviewDataRecord
 
-from bcubed.utilities.parse_help import from_record_to_contract_tuple
+from bcubed.utilities.columnar_help import from_columns_to_contract_tuples
+from bcubed.utilities.compression_help import (
+    CHUNK_HEADER,
+    clear_compression_dictionaries,
+    compression_dictionary_scope,
+    decompress_value,
+    get_chunk_value,
+    get_compression_dictionary_ids,
+    register_compression_dictionary
+)
+from bcubed.utilities.encoding_help import (
+    ABI_WORD_SIZE,
+    decode_system_data_contract_tuple,
+    encode_system_data_contract_tuple,
+    from_system_data_record_to_contract_tuple,
+    get_encoded_size
+)
+from bcubed.utilities.merkle_help import (
+    PROOF_HASHES,
+    PROOF_INDEX,
+    PROOF_LEAVES_NUMBER,
+    PROOF_RECORD,
+    PROOF_ROOT,
+    get_leaf_hash,
+    get_merkle_proof,
+    get_merkle_root,
+    get_merkle_tree
+)
+from bcubed.utilities.multi_field_help import MULTI_FIELD_NAM_F
+from bcubed.utilities.parse_help import (
+    from_contract_tuple_to_system_data_records,
+    from_record_to_contract_tuple
+)
+from bcubed.utilities.sample_packing_help import PACKABLE_FIELDS
+from bcubed.utilities.timeline_help import (
+    from_system_data_records_to_table,
+    merge_system_data_records
+)
 
 
 # EIP-7825: 16777216-5000=16772216 (to ensure the transaction)
 LIMIT_TRANSACTION_CAP = 16772216
-LIMIT_INDIVIDUAL_SIZE = 25000
+# The ABI encoded size of a record, and of each chunk of a split record, which keeps its gas
+# under the cap
+LIMIT_INDIVIDUAL_SIZE = 15000
+LIMIT_CHUNK_SIZE = LIMIT_INDIVIDUAL_SIZE
 
 BCUBED_DEBUG_MODE = 'BCUBED_DEBUG_MODE'
 DEBUG_MODE = os.getenv(
@@ -46,16 +97,56 @@ class Node:
     __logger = logging.getLogger(__name__)
 
     __system_data_records = []
+    __system_data_records_callbacks = []
+    __system_data_records_sequences = []
+    __system_data_records_gases = []
     __total_estimated_gas = 0
+    __total_size = 0
+    __oldest_record_time = None
+    __spool = None
+    __record_packer = None
+    __sample_packer = None
+    __segment_store = None
+    __dictionary_trainer = None
+    __next_dictionary_id = 0
+    __multi_field = False
+    __contract_address = None
+
+    __closed = False
 
     def __init__(self, network: Network, smart_contract: Contract) -> None:
         self.__network = network
         self.__smart_contract = smart_contract
 
+        # The buffer can be filled from the SystemDataRecordWriter worker and flushed from the
+        # caller thread at the same time.
+        self.__lock = threading.RLock()
+        self.__system_data_records = []
+        self.__system_data_records_callbacks = []
+        self.__system_data_records_sequences = []
+        self.__system_data_records_gases = []
+
+        # The failed pipelined batches are appended by the TransactionPipeline worker and
+        # resubmitted from the caller thread, under the lock.
+        self.__failed_batches = deque()
+        self.__confirmation_failed = False
+
         self.__setup_configuration()
 
         self.__setup()
 
+        # The compression dictionaries are registered for the contract of the Node, since the
+        # dictionary identifiers of two contracts can be the same
+        self.__contract_address = self.__network.get_contract_address()
+
+        with compression_dictionary_scope(self.__contract_address):
+            # The registered dictionaries belong to a previous Node of the contract, if any
+            clear_compression_dictionaries()
+            self.__load_compression_dictionaries()
+
+            if self.__spool is not None:
+                self.__replay_spooled_system_data_records()
+
         self.__logger.info("%s is initialized", __class__.__name__)
 
         if DEBUG_MODE is True:
@@ -63,7 +154,14 @@ class Node:
             self.__sum = 0
 
     def __del__(self):
-        self.__store_remaining_system_data_records()
+        if self.__closed is False:
+            self.__store_remaining_system_data_records()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
 
     def __setup_configuration(self):
         config = Config()
@@ -79,6 +177,51 @@ class Node:
             os.path.join(
                 os.path.dirname(__file__), contract_json_path + contract_name + ".json"))
 
+        self.__gas_estimator = GasEstimator(
+            self.__network,
+            config.get_property(ConfigKeys.SAFETY_MARGIN, ConfigCategories.GAS),
+            config.get_property(ConfigKeys.RECALIBRATION_INTERVAL, ConfigCategories.GAS))
+
+        self.__max_resubmissions = config.get_property(
+            ConfigKeys.MAX_RESUBMISSIONS, ConfigCategories.PIPELINE)
+        if self.__max_resubmissions is None:
+            self.__max_resubmissions = DEFAULT_MAX_RESUBMISSIONS
+
+        self.__flush_policy = FlushPolicy(
+            LIMIT_TRANSACTION_CAP,
+            config.get_property(ConfigKeys.MAX_AGE, ConfigCategories.FLUSH),
+            config.get_property(ConfigKeys.MAX_RECORDS, ConfigCategories.FLUSH),
+            config.get_property(ConfigKeys.MAX_BYTES, ConfigCategories.FLUSH),
+            config.get_property(ConfigKeys.ADAPTIVE, ConfigCategories.FLUSH),
+            config.get_property(ConfigKeys.TARGET_INCLUSION_TIME, ConfigCategories.FLUSH),
+            config.get_property(ConfigKeys.MIN_TARGET_GAS, ConfigCategories.FLUSH))
+
+        window = config.get_property(ConfigKeys.WINDOW, ConfigCategories.PACKING)
+        if window is not None and window > 1:
+            self.__record_packer = RecordPacker(self.__gas_estimator, window)
+
+        self.__multi_field = config.get_property(
+            ConfigKeys.MULTI_FIELD, ConfigCategories.PACKING) is True
+
+        samples = config.get_property(ConfigKeys.SAMPLES, ConfigCategories.PACKING)
+        if samples is not None and samples > 1:
+            self.__sample_packer = SamplePacker(samples)
+
+        if config.get_property(ConfigKeys.ENABLED, ConfigCategories.COMPRESSION) is True:
+            self.__dictionary_trainer = CompressionDictionaryTrainer(
+                config.get_property(ConfigKeys.FIELDS, ConfigCategories.COMPRESSION),
+                config.get_property(ConfigKeys.SAMPLES, ConfigCategories.COMPRESSION),
+                config.get_property(ConfigKeys.DICTIONARY_SIZE, ConfigCategories.COMPRESSION))
+
+        if config.get_property(ConfigKeys.ENABLED, ConfigCategories.ANCHORING) is True:
+            self.__segment_store = SegmentStore(
+                config.get_property(ConfigKeys.PATH, ConfigCategories.ANCHORING))
+
+        if config.get_property(ConfigKeys.ENABLED, ConfigCategories.SPOOL) is True:
+            self.__spool = SystemDataRecordSpool(
+                config.get_property(ConfigKeys.PATH, ConfigCategories.SPOOL),
+                config.get_property(ConfigKeys.SYNC_INTERVAL, ConfigCategories.SPOOL))
+
     def __is_contract_compiled(self):
         if (self.json_path.exists() is False or
                 self.__network.get_contract_address() is None or
@@ -105,7 +248,135 @@ class Node:
             is_contract_compiled, abi, byte_code
         )
 
+    def __load_compression_dictionaries(self):
+        """
+        Registers the compression dictionaries stored on the blockchain, so the records compressed
+        with them can be read. The fields that already have a dictionary are not trained again.
+        """
+
+        compression_dictionaries = self.__network.get_compression_dictionaries()
+        registered_dictionary_ids = get_compression_dictionary_ids()
+
+        for dictionary_id, field, dictionary in compression_dictionaries:
+            if dictionary_id not in registered_dictionary_ids:
+                register_compression_dictionary(dictionary_id, field, dictionary)
+
+            if self.__dictionary_trainer is not None:
+                self.__dictionary_trainer.stop_training(field)
+
+        self.__next_dictionary_id = max(self.__next_dictionary_id, len(compression_dictionaries))
+
+    def __train_compression_dictionary(self, generic_sd_record: GenericSystemDataRecord):
+        """
+        Adds the values of the record to the samples of its field. When the dictionary of the field
+        is trained, it is stored on the blockchain before any record is compressed with it.
+        """
+
+        field = generic_sd_record[GenericSystemDataFields.FIELD_NAM_F]
+        if self.__dictionary_trainer.is_training(field) is False:
+            return
+
+        for value in self.__get_data_to_split(generic_sd_record).values():
+            if not isinstance(value, bytes) or value == b'':
+                continue
+
+            dictionary = self.__dictionary_trainer.add_sample(field, decompress_value(value))
+            if dictionary is None:
+                continue
+
+            if self.__network.store_compression_dictionary(
+                    self.__next_dictionary_id, field, dictionary) is True:
+                register_compression_dictionary(self.__next_dictionary_id, field, dictionary)
+                self.__next_dictionary_id += 1
+
+            break
+
+    def __get_replay_keys(self, contract_tuple: tuple):
+        """
+        Returns the keys which a contract tuple is matched with when the spool is replayed. The
+        samples of the packable fields are spooled one by one but may be stored packed, with the
+        recT of the first sample, so they are matched by their sysT, field, id and values, one key
+        for each sample.
+        """
+
+        nam_f = contract_tuple[2]
+        if nam_f not in PACKABLE_FIELDS:
+            return [contract_tuple]
+
+        value_keys = (IdValueFields.FIELD_ID,) + PACKABLE_FIELDS[nam_f][0]
+
+        return [(system_data_record[SystemDataFields.FIELD_SYS_T], nam_f) +
+                tuple(system_data_record[nam_f][value_key] for value_key in value_keys)
+                for system_data_record in from_contract_tuple_to_system_data_records(
+                    [contract_tuple])]
+
+    def __replay_spooled_system_data_records(self):
+        """
+        Buffers again the spooled records that were not confirmed before BCubed stopped. The
+        records that are already stored on the blockchain are committed instead of buffered, so
+        they are not duplicated, including the samples stored in a packed record.
+        """
+
+        pending_records = self.__spool.get_pending_records()
+        if len(pending_records) == 0:
+            return
+
+        buckets = sorted(set(contract_tuple[SystemDataFields.FIELD_SYS_T] // BUCKET_DIVISOR
+                             for _, contract_tuple in pending_records))
+
+        stored_keys = Counter()
+        for bucket in buckets:
+            if self.__segment_store is not None:
+                contract_tuples = [contract_tuple for contract_tuple, _ in
+                                   self.__get_anchored_contract_tuples(bucket, bucket, False)]
+            else:
+                contract_tuples = self.__network.get_system_data_contract_tuples_by_timestamp(
+                    bucket)
+
+            for contract_tuple in contract_tuples:
+                stored_keys.update(self.__get_replay_keys(tuple(contract_tuple)))
+
+        stored_sequences = []
+        replayed_records = 0
+        for sequence, contract_tuple in pending_records:
+            keys = self.__get_replay_keys(tuple(contract_tuple.values()))
+
+            if all(stored_keys[key] > 0 for key in keys):
+                stored_keys.subtract(keys)
+                stored_sequences.append(sequence)
+
+                continue
+
+            gas = self.__gas_estimator.get_estimated_gas(contract_tuple)
+            if gas == 0 or gas > LIMIT_TRANSACTION_CAP:
+                self.__logger.error(
+                    "Spooled SD record cannot be replayed. Invalid gas: %d", gas)
+
+                continue
+
+            self.__manage_system_data_record_storage_depending_on_gas(
+                gas, contract_tuple, None, sequence)
+            replayed_records += 1
+
+        self.__spool.commit(stored_sequences)
+
+        self.__logger.info("Spooled SD records replayed. Records: %d. Already stored: %d",
+                           replayed_records, len(stored_sequences))
+
+    def __commit_spooled_system_data_records(self, sequences: list, stored: bool):
+        if self.__spool is not None and stored is True:
+            # The record of packed samples has the sequences of all its samples
+            self.__spool.commit([
+                sequence for record_sequences in sequences
+                for sequence in (record_sequences if isinstance(record_sequences, tuple)
+                                 else (record_sequences,))])
+
     def __store_remaining_system_data_records(self):
+        stored = True
+
+        if self.__sample_packer is not None:
+            self.__store_packed_groups(self.__sample_packer.drain())
+
         if len(self.__system_data_records) > 0:
             self.__logger.info(
                 "Storing remaining SD records. Records: %d. Estimated gas: %d",
@@ -114,17 +385,331 @@ class Node:
             )
 
             try:
-                self.__network.store_system_data_records(
-                    self.__system_data_records, self.__total_estimated_gas
-                )
-
-                self.__system_data_records.clear()
-                self.__total_estimated_gas = 0
+                stored = self.__send_system_data_records()
 
             except SystemExit:
                 self.__logger.critical(
                     "SystemExit when trying to store remaining SD records")
 
+                stored = False
+
+        return stored
+
+    def __send_system_data_records(self, keep_remainder: bool = False):
+        """
+        Sends the buffered records in one transaction or, if the RecordPacker is enabled, in the
+        packed transactions. If keep_remainder is True, the least filled transaction is kept in
+        the buffer to be packed with the next records.
+        """
+
+        entries = list(zip(self.__system_data_records,
+                           self.__system_data_records_callbacks,
+                           self.__system_data_records_sequences,
+                           self.__system_data_records_gases))
+
+        if self.__record_packer is None:
+            transactions, remaining_indexes = [list(range(len(entries)))], []
+        else:
+            transactions, remaining_indexes = self.__record_packer.pack(
+                self.__system_data_records_gases,
+                self.__flush_policy.get_target_gas(),
+                keep_remainder)
+
+        self.__system_data_records.clear()
+        self.__system_data_records_callbacks.clear()
+        self.__system_data_records_sequences.clear()
+        self.__system_data_records_gases.clear()
+        self.__total_estimated_gas = 0
+        self.__total_size = 0
+
+        # The remaining records keep the time of the oldest record, so they are not delayed more
+        # than max_age.
+        if len(remaining_indexes) == 0:
+            self.__oldest_record_time = None
+
+        for index in remaining_indexes:
+            self.__buffer_system_data_record(*entries[index])
+
+        stored = True
+        for transaction in transactions:
+            stored = self.__send_system_data_records_transaction(
+                [entries[index] for index in transaction]) and stored
+
+        return stored
+
+    def __buffer_system_data_record(
+            self, contract_tuple: dict, callback, sequence: int, gas: int):
+        self.__total_estimated_gas = self.__total_estimated_gas + gas
+        self.__total_size = self.__total_size + get_encoded_size(contract_tuple)
+
+        if self.__oldest_record_time is None:
+            self.__oldest_record_time = time.monotonic()
+
+        self.__system_data_records.append(contract_tuple)
+        self.__system_data_records_callbacks.append(callback)
+        self.__system_data_records_sequences.append(sequence)
+        self.__system_data_records_gases.append(gas)
+
+    def __send_system_data_records_transaction(self, entries: list):
+        system_data_records = [entry[0] for entry in entries]
+        callbacks = [entry[1] for entry in entries]
+        sequences = [entry[2] for entry in entries]
+        total_estimated_gas = sum(entry[3] for entry in entries)
+
+        # The safety margin covers the records whose gas is learnt instead of estimated
+        gas_limit = min(LIMIT_TRANSACTION_CAP,
+                        self.__gas_estimator.get_gas_limit(total_estimated_gas))
+
+        if self.__segment_store is not None:
+            return self.__anchor_system_data_records(system_data_records, callbacks, sequences)
+
+        if self.__network.is_pipelined():
+            return self.__submit_system_data_records(
+                system_data_records, callbacks, sequences, gas_limit, 0)
+
+        stored = False
+        try:
+            submit_time = time.monotonic()
+            stored = self.__network.store_system_data_records(
+                system_data_records, gas_limit)
+
+            self.__commit_spooled_system_data_records(sequences, stored)
+
+            if stored is True:
+                self.__observe_inclusion(submit_time)
+
+        finally:
+            # The callbacks are notified even if the network forces an exit, so nobody waits
+            # forever for a record that is never going to be stored.
+            self.__notify_callbacks(callbacks, stored)
+
+        return stored
+
+    def __anchor_system_data_records(
+            self, system_data_records: list, callbacks: list, sequences: list):
+        """
+        Writes the encoded records to the SegmentStore and stores only the Merkle root, the number
+        of records and the time range of the batch on the blockchain.
+        """
+
+        stored = False
+        try:
+            encoded_records = [encode_system_data_contract_tuple(contract_tuple)
+                               for contract_tuple in system_data_records]
+            root = get_merkle_root(
+                [get_leaf_hash(encoded_record) for encoded_record in encoded_records])
+
+            # The segment is written before the anchor, so an anchored batch is always readable
+            self.__segment_store.write(root, encoded_records)
+
+            system_timestamps = [contract_tuple[SystemDataFields.FIELD_SYS_T]
+                                 for contract_tuple in system_data_records]
+            stored = self.__network.store_batch_anchor(
+                root, len(encoded_records), min(system_timestamps), max(system_timestamps))
+
+            self.__commit_spooled_system_data_records(sequences, stored)
+
+        finally:
+            self.__notify_callbacks(callbacks, stored)
+
+        return stored
+
+    def __get_anchored_contract_tuples(
+            self, min_timestamp: int, max_timestamp: int, with_proofs: bool):
+        """
+        Returns the (contract tuple, inclusion proof) tuples of the anchored records whose
+        timestamp is between min_timestamp and max_timestamp. The segments that are missing or do
+        not match their on-chain anchor are skipped. The inclusion proof is None if with_proofs is
+        False.
+        """
+
+        anchored_contract_tuples = []
+
+        for root, records_number, min_sys_t, max_sys_t in self.__network.get_batch_anchors():
+            if (max_sys_t // BUCKET_DIVISOR < min_timestamp or
+                    min_sys_t // BUCKET_DIVISOR > max_timestamp):
+                continue
+
+            encoded_records = self.__segment_store.read(root)
+            if encoded_records is None:
+                self.__logger.error("Segment of the batch anchor %s is missing", root.hex())
+
+                continue
+
+            levels = get_merkle_tree(
+                [get_leaf_hash(encoded_record) for encoded_record in encoded_records])
+            if len(encoded_records) != records_number or levels[-1][0] != root:
+                self.__logger.critical(
+                    "Segment of the batch anchor %s does not match the anchor", root.hex())
+
+                continue
+
+            for index, encoded_record in enumerate(encoded_records):
+                contract_tuple = decode_system_data_contract_tuple(encoded_record)
+
+                bucket = contract_tuple[1] // BUCKET_DIVISOR
+                if bucket < min_timestamp or bucket > max_timestamp:
+                    continue
+
+                inclusion_proof = None
+                if with_proofs is True:
+                    inclusion_proof = {
+                        PROOF_RECORD: encoded_record,
+                        PROOF_INDEX: index,
+                        PROOF_LEAVES_NUMBER: records_number,
+                        PROOF_HASHES: get_merkle_proof(levels, index),
+                        PROOF_ROOT: root
+                    }
+
+                anchored_contract_tuples.append((contract_tuple, inclusion_proof))
+
+        return anchored_contract_tuples
+
+    def get_anchored_system_data_records(self, min_timestamp: int, max_timestamp: int):
+        """
+        Returns the (System Data record, inclusion proof) tuples of the anchored records whose
+        timestamp is between min_timestamp and max_timestamp. The inclusion proof can be verified
+        against the on-chain Merkle root with verify_inclusion_proof. The samples packed in one
+        record share its inclusion proof.
+        """
+
+        if self.__segment_store is None:
+            self.__logger.error("The SD records are not anchored")
+
+            return []
+
+        anchored_system_data_records = []
+        with compression_dictionary_scope(self.__contract_address):
+            self.__load_compression_dictionaries()
+
+            for contract_tuple, inclusion_proof in self.__get_anchored_contract_tuples(
+                    min_timestamp, max_timestamp, True):
+                anchored_system_data_records.extend(
+                    (system_data_record, inclusion_proof) for system_data_record in
+                    from_contract_tuple_to_system_data_records([contract_tuple]))
+
+        return anchored_system_data_records
+
+    def __submit_system_data_records(
+            self, system_data_records: list, callbacks: list, sequences: list, gas_limit: int,
+            resubmissions: int):
+        submitted = False
+        try:
+            submit_time = time.monotonic()
+            submitted = self.__network.store_system_data_records(
+                system_data_records,
+                gas_limit,
+                self.__get_confirmation_callback(
+                    system_data_records, callbacks, sequences, gas_limit, resubmissions,
+                    submit_time))
+
+        finally:
+            if submitted is False:
+                self.__notify_callbacks(callbacks, False)
+
+        return submitted
+
+    def __get_confirmation_callback(
+            self, system_data_records: list, callbacks: list, sequences: list, gas_limit: int,
+            resubmissions: int, submit_time: float):
+        """
+        Returns the callback of a pipelined batch. If the transaction fails, the batch is queued to
+        be resubmitted until max_resubmissions is reached, and then the callbacks are notified.
+        """
+
+        def confirmation_callback(stored: bool):
+            if stored is False and resubmissions < self.__max_resubmissions:
+                self.__logger.warning(
+                    "The transaction of %d SD records will be resubmitted. Resubmissions: %d",
+                    len(system_data_records), resubmissions + 1)
+
+                self.__failed_batches.append(
+                    (system_data_records, callbacks, sequences, gas_limit, resubmissions + 1))
+
+                return
+
+            if stored is False:
+                self.__confirmation_failed = True
+
+            self.__commit_spooled_system_data_records(sequences, stored)
+
+            if stored is True:
+                self.__observe_inclusion(submit_time)
+
+            self.__notify_callbacks(callbacks, stored)
+
+        return confirmation_callback
+
+    def __observe_inclusion(self, submit_time: float):
+        if self.__flush_policy.is_adaptive() is False:
+            return
+
+        self.__flush_policy.observe(
+            time.monotonic() - submit_time, self.__network.get_block_fullness())
+
+    def __resubmit_failed_batches(self):
+        stored = True
+
+        while len(self.__failed_batches) > 0:
+            system_data_records, callbacks, sequences, gas_limit, resubmissions = \
+                self.__failed_batches.popleft()
+
+            stored = self.__submit_system_data_records(
+                system_data_records, callbacks, sequences, gas_limit, resubmissions) and stored
+
+        return stored
+
+    def __wait_for_pipelined_system_data_records(self):
+        stored = True
+
+        while True:
+            self.__network.wait_for_pending_transactions()
+
+            if len(self.__failed_batches) == 0:
+                break
+
+            stored = self.__resubmit_failed_batches() and stored
+
+        stored = stored and self.__confirmation_failed is False
+        self.__confirmation_failed = False
+
+        return stored
+
+    def __notify_callbacks(self, callbacks: list, stored: bool):
+        for callback in callbacks:
+            if callback is None:
+                continue
+
+            try:
+                callback(stored)
+
+            except Exception as ex:  # pylint: disable=broad-exception-caught
+                self.__logger.error(
+                    "Exception when notifying a stored SD record: %s", ex)
+
+    def __get_split_callback(self, callback, chunk_length: int):
+        """
+        Returns a callback that notifies the original callback once all the split records have
+        been notified. The record is only stored if all its split records are stored.
+        """
+
+        if callback is None:
+            return None
+
+        state = {"pending": chunk_length, "stored": True}
+        lock = threading.Lock()
+
+        def split_callback(stored: bool):
+            with lock:
+                state["pending"] -= 1
+                state["stored"] = state["stored"] and stored
+                notify = state["pending"] == 0
+
+            if notify:
+                callback(state["stored"])
+
+        return split_callback
+
     def __get_data_to_split(self, system_data_record: GenericSystemDataRecord):
 
         # Get the information
@@ -140,34 +725,53 @@ class Node:
 
         return data
 
+    def __get_chunk_length(self, contract_tuple: dict, values: dict):
+        """
+        Returns the number of chunks needed to keep the ABI encoded size of each chunk under
+        LIMIT_CHUNK_SIZE. Each sliced value adds its chunk header and up to a word of padding.
+        """
+
+        base_contract_tuple = dict(contract_tuple)
+        for field in values:
+            base_contract_tuple[field] = b''
+
+        chunk_budget = (LIMIT_CHUNK_SIZE - get_encoded_size(base_contract_tuple) -
+                        len(values) * (CHUNK_HEADER.size + ABI_WORD_SIZE))
+
+        return max(1, math.ceil(sum(len(value) for value in values.values()) / chunk_budget))
+
     def split_system_data_record(
-            self, system_data_record: GenericSystemDataRecord, chunk_length: int):
+            self, system_data_record: GenericSystemDataRecord, chunk_length: int = None):
+        """
+        Splits the System Data record into chunk_length records or, if it is None, into the records
+        needed to keep each one under LIMIT_CHUNK_SIZE encoded bytes. The encoded values are sliced
+        as they are, and each slice is preceded by the chunk header, with the group identifier of
+        the record, the chunk index and the total of chunks.
+        """
 
-        data = self.__get_data_to_split(system_data_record)
+        values = dict(
+            (field, memoryview(value))
+            for field, value in self.__get_data_to_split(system_data_record).items()
+            if isinstance(value, bytes) and value != b'')
 
-        # Get the longest string
-        longest_str = 0
-        for field, value in data.items():
-            if isinstance(value, bytes) and len(value) > longest_str:
-                longest_str = len(value)
+        if chunk_length is None:
+            with compression_dictionary_scope(self.__contract_address):
+                chunk_length = self.__get_chunk_length(
+                    from_record_to_contract_tuple(system_data_record), values)
 
-        chunk_size = (longest_str // chunk_length) + 1
+        group_id = int.from_bytes(os.urandom(8), 'big')
 
         system_data_records = []
         for index in range(chunk_length):
-            system_data_records.append(
-                GenericSystemDataRecord(system_data_record))
+            split_record = GenericSystemDataRecord(system_data_record)
 
-        for field, value in data.items():
-            dco = decompressobj()
-            for index in range(chunk_length):
-                if isinstance(value, bytes) and value != b'':
-                    raw_chunk = value[(index * chunk_size):((index + 1) * chunk_size)]
-                    decompress_decoded_value = dco.decompress(
-                        raw_chunk).decode()
+            for field, value in values.items():
+                slice_size = math.ceil(len(value) / chunk_length)
+                split_record[field] = get_chunk_value(
+                    group_id, index, chunk_length,
+                    value[(index * slice_size):((index + 1) * slice_size)])
 
-                    system_data_records[index][field] = f"{index};" + \
-                        decompress_decoded_value
+            system_data_records.append(split_record)
 
         return system_data_records
 
@@ -194,25 +798,37 @@ class Node:
         return self.__network.get_meta_data_record()
 
     def __split_huge_record_and_send_new_sd_records_to_store(
-            self, generic_sd_record: GenericSystemDataRecord, record_size: int):
+            self, generic_sd_record: GenericSystemDataRecord, callback=None):
 
-        # It is necessary to add one because if it returns 4.97, it is rounded down to 4 when
-        # it should be rounded up to 5. To ensure the chunks are the correct size, they are
-        # multiplied by 2. If not multiplied by 2, then Exception is raised: 'execution
-        # reverted: transaction gas limit (<gas>) is greater than the cap (16777216)'.
-        chunk_length = (
-            (record_size // (LIMIT_INDIVIDUAL_SIZE - 10000)) + 1) * 2
+        split_records = self.split_system_data_record(generic_sd_record)
 
-        split_records = self.split_system_data_record(
-            generic_sd_record, chunk_length)
+        split_callback = self.__get_split_callback(
+            callback, len(split_records))
 
         stored = True
         for record in split_records:
-            stored = stored and self.store_system_data_record(record)
+            if stored:
+                stored = self.__store_contract_tuple(
+                    from_record_to_contract_tuple(record), split_callback)
+
+            if stored is False and split_callback is not None:
+                split_callback(False)
 
         return stored
 
-    def __manage_system_data_record_storage_depending_on_gas(self, gas: int, contract_tuple: dict):
+    def __store_contract_tuple(self, contract_tuple: dict, callback=None, sequence=None):
+        gas = self.__gas_estimator.get_estimated_gas(contract_tuple)
+
+        if gas > LIMIT_TRANSACTION_CAP:
+            self.__logger.critical("Invalid gas: %d", gas)
+
+            return False
+
+        return self.__manage_system_data_record_storage_depending_on_gas(
+            gas, contract_tuple, callback, sequence)
+
+    def __manage_system_data_record_storage_depending_on_gas(
+            self, gas: int, contract_tuple: dict, callback=None, sequence: int = None):
         stored = False
 
         if gas == 0:
@@ -221,48 +837,146 @@ class Node:
 
             return stored
 
-        if gas + self.__total_estimated_gas > LIMIT_TRANSACTION_CAP:
-            self.__network.store_system_data_records(
-                self.__system_data_records, self.__total_estimated_gas
-            )
+        if self.__record_packer is not None:
+            # The records are held until they fill the packing window
+            batch_gas_limit = (self.__flush_policy.get_target_gas() *
+                               self.__record_packer.get_window())
+        else:
+            batch_gas_limit = self.__flush_policy.get_target_gas()
+
+        is_expired = self.__flush_policy.is_expired(self.__oldest_record_time)
+
+        if (len(self.__system_data_records) > 0 and
+                (is_expired or
+                 self.__gas_estimator.get_gas_limit(gas + self.__total_estimated_gas) >
+                 batch_gas_limit)):
+            debug_sd_records = list(self.__system_data_records)
+
+            self.__send_system_data_records(keep_remainder=not is_expired)
 
             if DEBUG_MODE is True:
                 self.__sum = self.__sum + \
-                    len(self.__system_data_records)
+                    len(debug_sd_records)
 
                 tmp_sd_records = self.get_system_data_records_by_timestamp(
                     TIMESTAMP_START_DEBUG, TIMESTAMP_END_DEBUG)
 
                 if len(tmp_sd_records) != self.__sum:
-                    for record in self.__system_data_records:
+                    for record in debug_sd_records:
                         self.__logger.critical(
                             "Missing record: %s", str(record)[:200])
 
                         sys.exit(1)
 
-            self.__system_data_records.clear()
-            self.__total_estimated_gas = gas
-
-        else:
-            self.__total_estimated_gas = self.__total_estimated_gas + gas
+        # The record is written to the spool before it is acknowledged
+        if self.__spool is not None and sequence is None:
+            sequence = self.__spool.append(contract_tuple)
 
-        self.__system_data_records.append(contract_tuple)
+        self.__buffer_system_data_record(contract_tuple, callback, sequence, gas)
         stored = True
 
+        if self.__flush_policy.is_full(len(self.__system_data_records), self.__total_size):
+            self.__send_system_data_records()
+
         return stored
 
-    def store_system_data_record(self, system_data_record: SystemDataRecord):
+    def store_system_data_record(self, system_data_record: SystemDataRecord, callback=None):
         """
         Appends the System Data record to the __system_data_records list. When the list size reaches
         the LIMIT_TRANSACTION_CAP, it sends the list to the blockchain network for storage.
         Returns True if it is stored on the list or on the blockchain, and False if the block is not
         stored in the blockchain.
+        The optional callback is called with True or False once the blockchain network has stored,
+        or failed to store, the transaction that contains the record.
+        If the samples are packed, the samples of the numeric fields are held until their record is
+        packed.
+        """
+
+        with self.__lock, compression_dictionary_scope(self.__contract_address):
+            self.__resubmit_failed_batches()
+
+            stored = self.__store_system_data_record(
+                system_data_record, callback)
+
+        return stored
+
+    def store_system_data_columns(self, columns: dict, callback=None):
         """
+        Appends the System Data contract tuples of the columnar data, one for each row and field,
+        to the __system_data_records list with one call. See from_columns_to_contract_tuples for
+        the columns format. All the columns are validated before any value is stored, and a
+        ValueError raises if one is not valid. The values bigger than LIMIT_INDIVIDUAL_SIZE are
+        split.
+        Returns True if all the values are stored on the list or on the blockchain, and False if
+        not. The optional callback is called once with True, if all the values are stored on the
+        blockchain, or False.
+        """
+
+        with compression_dictionary_scope(self.__contract_address):
+            contract_tuples = from_columns_to_contract_tuples(columns)
+
+        if len(contract_tuples) == 0:
+            if callback is not None:
+                callback(True)
+
+            return True
+
+        columns_callback = self.__get_split_callback(callback, len(contract_tuples))
+
+        stored = True
+        with self.__lock, compression_dictionary_scope(self.__contract_address):
+            self.__resubmit_failed_batches()
+
+            for contract_tuple in contract_tuples:
+                if stored is False:
+                    if columns_callback is not None:
+                        columns_callback(False)
+
+                elif get_encoded_size(contract_tuple) > LIMIT_INDIVIDUAL_SIZE:
+                    stored = self.__split_huge_record_and_send_new_sd_records_to_store(
+                        GenericSystemDataRecord(contract_tuple), columns_callback)
+
+                else:
+                    stored = self.__store_contract_tuple(contract_tuple, columns_callback)
+
+                    if stored is False and columns_callback is not None:
+                        columns_callback(False)
+
+        return stored
 
+    def __store_system_data_record(self, system_data_record: SystemDataRecord, callback):
         stored = False
 
-        generic_sd_record = GenericSystemDataRecord(system_data_record)
-        record_size = generic_sd_record.get_size()
+        contract_tuple = from_system_data_record_to_contract_tuple(
+            system_data_record, self.__multi_field)
+        record_size = get_encoded_size(contract_tuple)
+
+        # The multi-field records are never trained or packed
+        is_single_field = contract_tuple[GenericSystemDataFields.FIELD_NAM_F] != MULTI_FIELD_NAM_F
+        dictionary_trainer = self.__dictionary_trainer if is_single_field else None
+        sample_packer = self.__sample_packer if is_single_field else None
+
+        # The GenericSystemDataRecord is only built when the record is trained, packed or split
+        if (dictionary_trainer is None and sample_packer is None and
+                record_size <= LIMIT_INDIVIDUAL_SIZE):
+            return self.__store_individual_contract_tuple(contract_tuple, callback)
+
+        generic_sd_record = GenericSystemDataRecord(contract_tuple)
+
+        if dictionary_trainer is not None:
+            self.__train_compression_dictionary(generic_sd_record)
+
+        if sample_packer is not None and sample_packer.is_packable(
+                system_data_record, generic_sd_record):
+            # The held sample is acknowledged, so it is spooled before it is packed
+            sequence = None
+            if self.__spool is not None:
+                sequence = self.__spool.append(from_record_to_contract_tuple(generic_sd_record))
+
+            self.__store_packed_groups(sample_packer.add(
+                system_data_record, generic_sd_record, callback, sequence))
+
+            return True
 
         if record_size > LIMIT_INDIVIDUAL_SIZE:
             self.__logger.info(
@@ -270,57 +984,199 @@ class Node:
             self.__logger.info(system_data_record.to_string()[:200])
 
             stored = self.__split_huge_record_and_send_new_sd_records_to_store(
-                generic_sd_record, record_size)
+                generic_sd_record, callback)
 
         else:
-            contract_tuple = from_record_to_contract_tuple(generic_sd_record)
-            gas = self.__network.get_estimated_gas([contract_tuple])
+            stored = self.__store_individual_contract_tuple(
+                from_record_to_contract_tuple(generic_sd_record), callback)
+
+        return stored
+
+    def __store_individual_contract_tuple(self, contract_tuple: dict, callback):
+        """
+        Buffers the contract tuple of a record that is not split or packed. If it is not buffered,
+        the callback is notified with False, since it is not handed to any other callback.
+        """
+
+        gas = self.__gas_estimator.get_estimated_gas(contract_tuple)
+
+        if gas > LIMIT_TRANSACTION_CAP:
+            self.__logger.critical("Invalid gas: %d", gas)
+
+            if DEBUG_MODE is True:
+                sys.exit(1)
 
-            if gas > LIMIT_TRANSACTION_CAP:
-                self.__logger.critical("Invalid gas: %d", gas)
+            self.__notify_callbacks([callback], False)
 
-                if DEBUG_MODE is True:
-                    sys.exit(1)
+            return False
 
-                return stored
+        stored = self.__manage_system_data_record_storage_depending_on_gas(
+            gas, contract_tuple, callback)
 
-            stored = self.__manage_system_data_record_storage_depending_on_gas(
-                gas, contract_tuple)
+        if stored is False:
+            self.__notify_callbacks([callback], False)
 
         return stored
 
-    def get_system_data_records_by_timestamp(
-        self, min_timestamp: int, max_timestamp: int
+    def __store_packed_groups(self, packed_groups: list):
+        """
+        Buffers the records of the packed groups. The callbacks of the samples of a group are
+        notified with the result of its record, and their spooled samples are committed with it.
+        """
+
+        for generic_sd_record, callbacks, sequences in packed_groups:
+            spool_sequences = tuple(sequences) if self.__spool is not None else None
+
+            stored = self.__store_contract_tuple(
+                from_record_to_contract_tuple(generic_sd_record),
+                self.__get_packed_callback(callbacks), spool_sequences)
+
+            if stored is False:
+                # The samples are notified as not stored, so they are not replayed
+                if self.__spool is not None:
+                    self.__spool.commit(list(sequences))
+
+                self.__notify_callbacks(callbacks, False)
+
+    def __get_packed_callback(self, callbacks: list):
+        if all(callback is None for callback in callbacks):
+            return None
+
+        def packed_callback(stored: bool):
+            self.__notify_callbacks(callbacks, stored)
+
+        return packed_callback
+
+    def iter_system_data_records_by_timestamp(
+        self, min_timestamp: int, max_timestamp: int, raw_fragments: bool = False,
+        compact: bool = False
     ):
         """
-        Returns the field values, specified in fields list, of the System Data records stored on
-        the blockchain and whose timestamp is between min_timestamp and max_timestamp.
+        Yields the System Data records stored on the blockchain whose timestamp is between
+        min_timestamp and max_timestamp, in lists, so a long range is not kept in memory at once.
+        If the contract has the range query, each list is the result of one paginated call,
+        instead of one call per timestamp. The raw_fragments and compact values are the ones of
+        get_system_data_records_by_timestamp.
         """
 
-        system_data_records = []
+        system_data_records_lists = self.__iter_system_data_records_by_timestamp(
+            min_timestamp, max_timestamp, raw_fragments, compact)
+
+        # The scope is only selected while each list is read, so it is not left selected for the
+        # caller between two lists
+        while True:
+            with compression_dictionary_scope(self.__contract_address):
+                system_data_records = next(system_data_records_lists, None)
+
+            if system_data_records is None:
+                return
 
+            yield system_data_records
+
+    def __iter_system_data_records_by_timestamp(
+        self, min_timestamp: int, max_timestamp: int, raw_fragments: bool, compact: bool
+    ):
         if min_timestamp >= max_timestamp:
             self.__logger.error(
                 "MAX timestamp must be greater than MIN timestamp")
-            return system_data_records
+            return
+
+        if self.__segment_store is not None:
+            self.__load_compression_dictionaries()
+
+            yield from_contract_tuple_to_system_data_records(
+                [contract_tuple for contract_tuple, _ in
+                 self.__get_anchored_contract_tuples(min_timestamp, max_timestamp, False)],
+                raw_fragments, compact)
+
+            return
+
+        if self.__network.is_event_log():
+            self.__load_compression_dictionaries()
+
+            yield self.__network.get_logged_system_data_records(
+                min_timestamp, max_timestamp, raw_fragments, compact)
+
+            return
+
+        if self.__network.is_range_query():
+            # The records can be compressed with dictionaries stored by another Node
+            self.__load_compression_dictionaries()
 
-        system_data_records_timestamps = self.__network.get_system_data_records_timestamps()
+            yield from self.__network.iter_system_data_records_in_range(
+                min_timestamp, max_timestamp, raw_fragments, compact)
 
-        filtered_timestamps = [timestamp for timestamp in system_data_records_timestamps if timestamp >=
-                               min_timestamp and timestamp <= max_timestamp]
+            return
+
+        filtered_timestamps = self.__network.get_system_data_records_timestamps(
+            min_timestamp, max_timestamp)
+
+        # The records can be compressed with dictionaries stored by another Node
+        if len(filtered_timestamps) > 0:
+            self.__load_compression_dictionaries()
 
         for timestamp in filtered_timestamps:
             new_sd_records = self.__network.get_system_data_records_by_timestamp(
-                timestamp)
+                timestamp, raw_fragments, compact)
 
             if len(new_sd_records) != 0:
-                system_data_records.extend(new_sd_records)
+                yield new_sd_records
+
+    def get_system_data_records_by_timestamp(
+        self, min_timestamp: int, max_timestamp: int, raw_fragments: bool = False,
+        compact: bool = False
+    ):
+        """
+        Returns the field values, specified in fields list, of the System Data records stored on
+        the blockchain and whose timestamp is between min_timestamp and max_timestamp.
+        If the records are anchored, they are read from the SegmentStore and only the segments that
+        match their on-chain anchor are returned.
+        The records split by split_system_data_record are returned as one record, unless
+        raw_fragments is True, which returns each stored chunk, for forensic use.
+        If compact is True, the records are returned as read-only CompactSystemDataRecord, which
+        keep the mapping API of SystemDataRecord with a fraction of its memory.
+        """
+
+        system_data_records = []
 
-        self.__logger.info("%s SD records were retrieved.",
-                           len(system_data_records))
+        for new_sd_records in self.iter_system_data_records_by_timestamp(
+                min_timestamp, max_timestamp, raw_fragments, compact):
+            system_data_records.extend(new_sd_records)
+
+        if min_timestamp < max_timestamp:
+            self.__logger.info("%s SD records were retrieved.",
+                               len(system_data_records))
 
         return system_data_records
 
+    def get_merged_system_data_records_by_timestamp(
+        self, min_timestamp: int, max_timestamp: int, tolerance: int = 0, compact: bool = False
+    ):
+        """
+        Returns the System Data records whose timestamp is between min_timestamp and max_timestamp
+        merged by sysT, so each record has all the fields known at its sysT. The records whose sysT
+        is at most tolerance after the sysT of the first record of a group are merged into one.
+        If compact is True, the records are returned as read-only CompactSystemDataRecord.
+        """
+
+        return merge_system_data_records(
+            self.get_system_data_records_by_timestamp(
+                min_timestamp, max_timestamp, compact=compact),
+            tolerance, compact)
+
+    def get_system_data_table_by_timestamp(
+        self, min_timestamp: int, max_timestamp: int, tolerance: int = 0
+    ):
+        """
+        Returns the System Data records whose timestamp is between min_timestamp and max_timestamp
+        merged by sysT, as get_merged_system_data_records_by_timestamp does, in a table with a row
+        for each sysT and a column for each field.
+        """
+
+        return from_system_data_records_to_table(
+            self.get_system_data_records_by_timestamp(min_timestamp, max_timestamp, compact=True),
+            tolerance)
+
     def store_overview_data_record(self, overview_data_record: OverviewDataRecord):
         """
         Sends the Overview Data record to the blockchain network in order to be stored.
@@ -329,10 +1185,61 @@ class Node:
         Returns True if it is stored on the blockchain or False if not.
         """
 
-        self.__store_remaining_system_data_records()
+        self.flush()
 
         return self.__network.store_overview_data_record(overview_data_record)
 
+    def flush(self):
+        """
+        Sends the buffered System Data records to the blockchain network in order to be stored.
+        If the network is pipelined, it also waits until all the submitted transactions are
+        confirmed, resubmitting the failed ones.
+        Returns True if there are no buffered records or they are stored, and False if not.
+        """
+
+        with self.__lock, compression_dictionary_scope(self.__contract_address):
+            stored = self.__store_remaining_system_data_records()
+
+            if self.__network.is_pipelined():
+                stored = self.__wait_for_pipelined_system_data_records() and stored
+
+            return stored
+
+    def flush_expired(self):
+        """
+        Sends the buffered System Data records to the blockchain network if the oldest one is older
+        than the flush max_age. The SystemDataRecordWriter calls it periodically, so the records of
+        a quiet robot are not buffered for hours. When the Node is used directly, the age is only
+        checked when the next record is buffered, and the held samples are never expired, so the
+        caller must call it periodically for max_age to take effect.
+        Returns True if there are no expired records or they are stored, and False if not.
+        """
+
+        with self.__lock, compression_dictionary_scope(self.__contract_address):
+            if self.__sample_packer is not None:
+                self.__store_packed_groups(
+                    self.__sample_packer.drain(self.__flush_policy.is_expired))
+
+            if self.__flush_policy.is_expired(self.__oldest_record_time) is False:
+                return True
+
+            return self.__store_remaining_system_data_records()
+
+    def close(self):
+        """
+        Flushes the buffered System Data records and closes the Node. It is called when leaving the
+        Node context manager, so the records are not only stored when the Node is garbage collected.
+        Returns True if the buffered records are stored, and False if not.
+        """
+
+        stored = self.flush()
+        self.__closed = True
+
+        if self.__spool is not None:
+            self.__spool.close()
+
+        return stored
+
     def get_overview_data_record(self):
         """
         Returns the Overview Data record that is stored on the blockchain.
@@ -0,0 +1,109 @@
+"""
+This is a class-containing module.
+
+It contains the NonceManager class, which is responsible for reserving the transaction nonces
+locally, so the blockchain network is not asked for the transaction count on every transaction.
+"""
+
+import heapq
+import logging
+import threading
+
+from web3 import Web3
+
+
+PENDING_BLOCK = 'pending'
+LATEST_BLOCK = 'latest'
+
+NONCE_ERROR_MESSAGES = (
+    'nonce too low',
+    'nonce too high',
+    'correct nonce',
+    'invalid nonce',
+)
+
+
+class NonceManager:
+    """
+    It contains the next nonce of the account and the nonces that were reserved but never sent.
+    The released nonces are reserved again before new ones, so the gaps left by transactions that
+    were not sent are recovered. It is synchronized with the blockchain network the first time and
+    whenever a nonce error is detected and no transaction is in flight.
+    """
+
+    __logger = logging.getLogger(__name__)
+
+    def __init__(self, web3: Web3, account_address: str) -> None:
+        self.__w3 = web3
+        self.__account_address = account_address
+
+        self.__lock = threading.Lock()
+        self.__next_nonce = None
+        self.__released_nonces = []
+
+    def __synchronize(self):
+        self.__next_nonce = self.__w3.eth.get_transaction_count(
+            self.__account_address, PENDING_BLOCK)
+        self.__released_nonces.clear()
+
+    def reserve(self):
+        """
+        Returns the nonce to be used by the next transaction and reserves it.
+        """
+
+        with self.__lock:
+            if len(self.__released_nonces) > 0:
+                return heapq.heappop(self.__released_nonces)
+
+            if self.__next_nonce is None:
+                self.__synchronize()
+
+            nonce = self.__next_nonce
+            self.__next_nonce = nonce + 1
+
+            return nonce
+
+    def release(self, nonce: int):
+        """
+        Releases a reserved nonce whose transaction was not sent, so it is reserved again by the
+        next transaction and no gap is left.
+        """
+
+        with self.__lock:
+            if self.__next_nonce is not None and nonce == self.__next_nonce - 1:
+                self.__next_nonce = nonce
+
+            elif nonce not in self.__released_nonces:
+                heapq.heappush(self.__released_nonces, nonce)
+
+    def resync(self):
+        """
+        Synchronizes the next nonce with the pending transaction count of the blockchain network.
+        It must be called after a nonce error, once no transaction is in flight.
+        """
+
+        with self.__lock:
+            previous_nonce = self.__next_nonce
+            self.__synchronize()
+
+        self.__logger.warning(
+            "Nonce resynchronized. Previous nonce: %s. Next nonce: %s",
+            previous_nonce, self.__next_nonce)
+
+    def is_nonce_mined(self, nonce: int):
+        """
+        Returns True if a transaction with the nonce is mined, that is, the transaction count of
+        the account at the latest block has passed it.
+        """
+
+        return self.__w3.eth.get_transaction_count(self.__account_address, LATEST_BLOCK) > nonce
+
+    @staticmethod
+    def is_nonce_error(ex: Exception):
+        """
+        Returns True if the exception was raised because the nonce was not valid.
+        """
+
+        message = str(ex).lower()
+
+        return any(error_message in message for error_message in NONCE_ERROR_MESSAGES)
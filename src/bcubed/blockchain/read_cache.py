@@ -0,0 +1,172 @@
+"""
+This is a class-containing module.
+
+It contains the ReadCache class, which is responsible for keeping the contract tuples read from a
+contract, so the reads that are repeated do not call to the network again.
+"""
+
+import ast
+import logging
+import os
+
+from collections import OrderedDict
+from pathlib import Path
+
+
+ENTRY_SUFFIX = '.entry'
+TEMPORARY_SUFFIX = '.tmp'
+# The entry whose file marks the black box as finalized
+OVERVIEW_KEY = 'overview'
+
+
+class ReadCache:
+    """
+    It contains an in-memory LRU tier, limited to max_bytes, and, if path is not None, an on-disk
+    tier with a directory per contract address. While the black box is live, each entry belongs to
+    the block it was read at, and it is only returned for that block. Once the black box is
+    finalized, the contract rejects any write, so the entries are permanent and they are also
+    written to the disk tier, where they are read from after a restart without calling to the
+    network. The entries are stored as Python literals, so loading them does not run any code.
+    """
+
+    __logger = logging.getLogger(__name__)
+
+    def __init__(self, contract_address: str, max_bytes: int, path: str = None) -> None:
+        self.__max_bytes = max_bytes
+        self.__path = Path(path) / str(contract_address) if path else None
+
+        self.__entries = OrderedDict()
+        self.__size = 0
+        self.__is_finalized = False
+
+        if self.__path is not None:
+            self.__path.mkdir(parents=True, exist_ok=True)
+            self.__is_finalized = self.__get_entry_path(OVERVIEW_KEY).exists()
+
+        self.__logger.info("%s is initialized. Finalized: %s", __class__.__name__,
+                           self.__is_finalized)
+
+    def __get_entry_path(self, key: str):
+        return self.__path / (key + ENTRY_SUFFIX)
+
+    def __read_entry(self, key: str):
+        entry_path = self.__get_entry_path(key)
+        if entry_path.exists() is False:
+            return None
+
+        with open(entry_path, 'r', encoding='utf-8') as file:
+            serialized_value = file.read()
+
+        try:
+            return serialized_value, ast.literal_eval(serialized_value)
+
+        except (SyntaxError, ValueError) as ex:
+            self.__logger.warning("Corrupted read cache entry %s is discarded: %s", key, ex)
+            entry_path.unlink()
+
+            return None
+
+    def __write_entry(self, key: str, serialized_value: str):
+        """
+        Writes the entry to a temporary file, fsynced and renamed, so it is complete or missing.
+        """
+
+        entry_path = self.__get_entry_path(key)
+        temporary_path = entry_path.with_suffix(TEMPORARY_SUFFIX)
+
+        with open(temporary_path, 'w', encoding='utf-8') as file:
+            file.write(serialized_value)
+
+            file.flush()
+            os.fsync(file.fileno())
+
+        os.replace(temporary_path, entry_path)
+
+    def __to_literal(self, value):
+        """
+        Returns the value with plain Python types, so its representation is a Python literal. For
+        example, the HexBytes returned by Web3 are returned as bytes.
+        """
+
+        if isinstance(value, (list, tuple)):
+            return type(value)(self.__to_literal(item) for item in value)
+
+        if isinstance(value, (bytes, bytearray)):
+            return bytes(value)
+
+        return value
+
+    def __add_entry(self, key: str, value, size: int, block_number: int):
+        if key in self.__entries:
+            self.__size -= self.__entries.pop(key)[1]
+
+        # An entry larger than the budget is not kept in memory
+        if size > self.__max_bytes:
+            return
+
+        self.__entries[key] = (value, size, block_number)
+        self.__size += size
+
+        while self.__size > self.__max_bytes:
+            _, (_, evicted_size, _) = self.__entries.popitem(last=False)
+            self.__size -= evicted_size
+
+    def is_finalized(self):
+        """
+        Returns True if the black box is finalized, so the entries are permanent.
+        """
+
+        return self.__is_finalized
+
+    def set_finalized(self):
+        """
+        Marks the black box as finalized. The entries read at a block are discarded, since they are
+        read again once, without a block.
+        """
+
+        self.__is_finalized = True
+
+        for key in [key for key, (_, _, block_number) in self.__entries.items()
+                    if block_number is not None]:
+            self.__size -= self.__entries.pop(key)[1]
+
+    def get(self, key: str, block_number: int = None):
+        """
+        Returns the value of the entry, or None if it is not in the cache. While the black box is
+        live, only the entry read at block_number is returned.
+        """
+
+        entry = self.__entries.get(key)
+        if entry is not None and entry[2] == block_number:
+            self.__entries.move_to_end(key)
+
+            return entry[0]
+
+        if self.__is_finalized is False or self.__path is None:
+            return None
+
+        serialized_entry = self.__read_entry(key)
+        if serialized_entry is None:
+            return None
+
+        serialized_value, value = serialized_entry
+        self.__add_entry(key, value, len(serialized_value), None)
+
+        return value
+
+    def put(self, key: str, value, block_number: int = None):
+        """
+        Adds the value of the entry, read at block_number while the black box is live, or without
+        a block once it is finalized, when it is also written to the disk tier, if any.
+        """
+
+        value = self.__to_literal(value)
+        serialized_value = repr(value)
+
+        if self.__is_finalized is True:
+            block_number = None
+
+            if self.__path is not None:
+                self.__write_entry(key, serialized_value)
+
+        self.__add_entry(key, value, len(serialized_value), block_number)
@@ -0,0 +1,93 @@
+"""
+This is a class-containing module.
+
+It contains the RecordPacker class, which is responsible for packing the buffered System Data
+records into the fewest transactions under the batch gas limit.
+"""
+
+import logging
+
+from bcubed.blockchain.gas_estimator import GasEstimator
+
+
+DEFAULT_WINDOW = 4
+
+
+class RecordPacker:
+    """
+    It packs the estimated gas of the buffered records into transactions with the
+    first-fit-decreasing algorithm. The Node holds up to window transactions of records before
+    packing them, so the small records fill the headroom left by the big ones instead of being cut
+    in arrival order. The records keep their arrival order inside each transaction. The fill ratio
+    of each packed transaction is logged.
+    """
+
+    __logger = logging.getLogger(__name__)
+
+    def __init__(self, gas_estimator: GasEstimator, window: int = DEFAULT_WINDOW) -> None:
+        self.__gas_estimator = gas_estimator
+        self.__window = window or DEFAULT_WINDOW
+
+        self.__transactions = 0
+        self.__total_fill_ratio = 0
+
+    def get_window(self):
+        """
+        Returns the number of transactions of records that are held before packing them.
+        """
+
+        return self.__window
+
+    def __get_fill_ratio(self, estimated_gas: int, capacity: int):
+        return self.__gas_estimator.get_gas_limit(estimated_gas) / capacity
+
+    def pack(self, gases: list, capacity: int, keep_remainder: bool = False):
+        """
+        Packs the records, given by their estimated gas, into transactions whose gas limit does not
+        exceed capacity. Returns a tuple with the list of transactions, each one a list of record
+        indexes, and the list of record indexes that are not packed. If keep_remainder is True, the
+        least filled transaction is not packed, so it can be filled with the next records.
+        """
+
+        bins = []
+        for index in sorted(range(len(gases)), key=lambda index: gases[index], reverse=True):
+            for gas_bin in bins:
+                if self.__gas_estimator.get_gas_limit(gas_bin[0] + gases[index]) <= capacity:
+                    gas_bin[0] += gases[index]
+                    gas_bin[1].append(index)
+
+                    break
+            else:
+                bins.append([gases[index], [index]])
+
+        remaining_indexes = []
+        if keep_remainder is True and len(bins) > 1:
+            least_filled_bin = min(bins, key=lambda gas_bin: gas_bin[0])
+            bins.remove(least_filled_bin)
+
+            remaining_indexes = sorted(least_filled_bin[1])
+
+        transactions = sorted((sorted(gas_bin[1]) for gas_bin in bins),
+                              key=lambda transaction: transaction[0])
+
+        for gas_bin in bins:
+            fill_ratio = self.__get_fill_ratio(gas_bin[0], capacity)
+
+            self.__transactions += 1
+            self.__total_fill_ratio += fill_ratio
+
+            self.__logger.info(
+                "SD records packed. Records: %d. Estimated gas: %d. Fill ratio: %.2f",
+                len(gas_bin[1]), gas_bin[0], fill_ratio)
+
+        return transactions, remaining_indexes
+
+    def get_statistics(self):
+        """
+        Returns the number of packed transactions and their average fill ratio.
+        """
+
+        if self.__transactions == 0:
+            return 0, 0
+
+        return self.__transactions, self.__total_fill_ratio / self.__transactions
@@ -0,0 +1,131 @@
+"""
+This is a class-containing module.
+
+It contains the SamplePacker class, which is responsible for accumulating consecutive samples of
+the numeric System Data fields and packing them into one record.
+"""
+
+import logging
+import time
+
+from bcubed.blockchain.gas_estimator import BUCKET_DIVISOR
+from bcubed.constants.records.fields.generic_system_data_fields import GenericSystemDataFields
+from bcubed.constants.records.fields.system_data_fields import SystemDataFields, TWO_V_FIELDS
+from bcubed.records.generic_system_data_record import GenericSystemDataRecord
+from bcubed.records.system_data_record import SystemDataRecord
+from bcubed.utilities.sample_packing_help import PACKABLE_FIELDS, is_packable_value, pack_samples
+
+
+class SamplePacker:
+    """
+    It accumulates the samples of each packable field and id. A group is packed when it reaches
+    the number of samples or when a sample of another timestamp bucket arrives, so all the packed
+    samples are retrieved with the bucket of the record. The packed record keeps the recT and sysT
+    of its first sample.
+    """
+
+    __logger = logging.getLogger(__name__)
+
+    def __init__(self, samples: int) -> None:
+        self.__samples_number = samples
+
+        # (field, id) -> [first GenericSystemDataRecord, monotonic time, samples, callbacks,
+        # spool sequences]
+        self.__groups = {}
+
+    def __get_field_and_values(
+            self, system_data_record: SystemDataRecord, generic_sd_record: GenericSystemDataRecord):
+        field = generic_sd_record[GenericSystemDataFields.FIELD_NAM_F]
+        if field not in PACKABLE_FIELDS:
+            return None, None
+
+        value_keys, _ = PACKABLE_FIELDS[field]
+        values = [system_data_record[field][value_key] for value_key in value_keys]
+        if not all(is_packable_value(value) for value in values):
+            return None, None
+
+        return field, values
+
+    def is_packable(
+            self, system_data_record: SystemDataRecord, generic_sd_record: GenericSystemDataRecord):
+        """
+        Returns True if the sample of the record can be packed, so add holds it.
+        """
+
+        field, _ = self.__get_field_and_values(system_data_record, generic_sd_record)
+
+        return field is not None
+
+    def add(self, system_data_record: SystemDataRecord, generic_sd_record: GenericSystemDataRecord,
+            callback=None, sequence: int = None):
+        """
+        Adds the sample of the record, with its spool sequence, if it is spooled. Returns None if
+        the record cannot be packed. Otherwise, returns the list of groups that are complete, each
+        one a tuple with the record to store, the callbacks of its samples and their sequences.
+        """
+
+        field, values = self.__get_field_and_values(system_data_record, generic_sd_record)
+        if field is None:
+            return None
+
+        if field in TWO_V_FIELDS:
+            key = (field, generic_sd_record[GenericSystemDataFields.FIELD_ID_TWO])
+        else:
+            key = (field, generic_sd_record[GenericSystemDataFields.FIELD_ID_FOU])
+
+        sys_t = generic_sd_record[SystemDataFields.FIELD_SYS_T]
+
+        completed_groups = []
+
+        group = self.__groups.get(key)
+        if (group is not None and
+                group[0][SystemDataFields.FIELD_SYS_T] // BUCKET_DIVISOR != sys_t // BUCKET_DIVISOR):
+            completed_groups.append(self.__pack_group(self.__groups.pop(key)))
+            group = None
+
+        if group is None:
+            group = [generic_sd_record, time.monotonic(), [], [], []]
+            self.__groups[key] = group
+
+        group[2].append((sys_t, values))
+        group[3].append(callback)
+        group[4].append(sequence)
+
+        if len(group[2]) >= self.__samples_number:
+            completed_groups.append(self.__pack_group(self.__groups.pop(key)))
+
+        return completed_groups
+
+    def drain(self, is_expired=None):
+        """
+        Returns the groups that are not complete, as add does, and removes them. If is_expired is
+        given, only the groups for which it returns True, given the monotonic time of their first
+        sample, are returned.
+        """
+
+        keys = [key for key, group in self.__groups.items()
+                if is_expired is None or is_expired(group[1])]
+
+        return [self.__pack_group(self.__groups.pop(key)) for key in keys]
+
+    def __pack_group(self, group: list):
+        generic_sd_record, _, samples, callbacks, sequences = group
+
+        # A single sample is stored as it is
+        if len(samples) == 1:
+            return generic_sd_record, callbacks, sequences
+
+        field = generic_sd_record[GenericSystemDataFields.FIELD_NAM_F]
+        packed_value = pack_samples(generic_sd_record[SystemDataFields.FIELD_SYS_T], samples)
+
+        if field in TWO_V_FIELDS:
+            generic_sd_record[GenericSystemDataFields.FIELD_VALUE_TWO] = packed_value
+        else:
+            generic_sd_record[GenericSystemDataFields.FIELD_VALUE_1_FOU] = packed_value
+            generic_sd_record[GenericSystemDataFields.FIELD_VALUE_2_FOU] = b''
+            generic_sd_record[GenericSystemDataFields.FIELD_VALUE_3_FOU] = b''
+
+        self.__logger.debug("SD samples packed. Field: %s. Samples: %d. Size: %d",
+                            field, len(samples), len(packed_value))
+
+        return generic_sd_record, callbacks, sequences
@@ -0,0 +1,82 @@
+"""
+This is a class-containing module.
+
+It contains the SegmentStore class, which is responsible for keeping the encoded System Data
+records of the anchored batches in a local content-addressed store.
+"""
+
+import logging
+import os
+import struct
+
+from pathlib import Path
+
+
+# Each encoded record is preceded by its length
+RECORD_LENGTH = struct.Struct('<I')
+
+SEGMENT_SUFFIX = '.seg'
+TEMPORARY_SUFFIX = '.tmp'
+
+
+class SegmentStore:
+    """
+    It contains a directory with a segment file per anchored batch. The segment is named by the
+    Merkle root of its records, so the on-chain anchor is enough to find it and to detect if it has
+    been modified. A segment is written to a temporary file, fsynced and renamed, so it is complete
+    or missing, never torn.
+    """
+
+    __logger = logging.getLogger(__name__)
+
+    def __init__(self, path: str) -> None:
+        self.__path = Path(path)
+        self.__path.mkdir(parents=True, exist_ok=True)
+
+        self.__logger.info("%s is initialized. Path: %s", __class__.__name__, self.__path)
+
+    def __get_segment_path(self, root: bytes):
+        return self.__path / (root.hex() + SEGMENT_SUFFIX)
+
+    def write(self, root: bytes, encoded_records: list):
+        """
+        Writes the encoded records of the batch whose Merkle root is root.
+        """
+
+        segment_path = self.__get_segment_path(root)
+        temporary_path = segment_path.with_suffix(TEMPORARY_SUFFIX)
+
+        with open(temporary_path, 'wb') as file:
+            for encoded_record in encoded_records:
+                file.write(RECORD_LENGTH.pack(len(encoded_record)))
+                file.write(encoded_record)
+
+            file.flush()
+            os.fsync(file.fileno())
+
+        os.replace(temporary_path, segment_path)
+
+    def read(self, root: bytes):
+        """
+        Returns the list of encoded records of the batch whose Merkle root is root, or None if the
+        segment is not in the store.
+        """
+
+        segment_path = self.__get_segment_path(root)
+        if segment_path.exists() is False:
+            return None
+
+        with open(segment_path, 'rb') as file:
+            data = file.read()
+
+        encoded_records = []
+        offset = 0
+
+        while offset + RECORD_LENGTH.size <= len(data):
+            length, = RECORD_LENGTH.unpack_from(data, offset)
+            offset += RECORD_LENGTH.size
+
+            encoded_records.append(data[offset:offset + length])
+            offset += length
+
+        return encoded_records
@@ -19,6 +19,8 @@ contract BCubedContract {
         string      sysP;
     }
 
+    // A record with several fields is stored in one entry with the "mulF" namF, and all its fields
+    // encoded in valF
     struct SystemDataRecord {
         uint64  recT;
         uint64  sysT;
@@ -41,12 +43,33 @@ contract BCubedContract {
         uint64      finT;
     }
 
+    struct CompressionDictionary {
+        uint16  id;
+        string  namF;
+        bytes   dictionary;
+    }
+
+    struct BatchAnchor {
+        bytes32 root;
+        uint32  count;
+        uint64  minSysT;
+        uint64  maxSysT;
+    }
+
     MetaDataRecord private metaDataRecord;
     OverviewDataRecord private overviewDataRecord;
     mapping(uint64 => SystemDataRecord[]) private systemDataRecords;
 
     uint64[] private systemDataRecordKeys;
 
+    CompressionDictionary[] private compressionDictionaries;
+
+    BatchAnchor[] private batchAnchors;
+
+    // The logged records are not in the contract storage, they are read from the event logs
+    event SystemDataRecordLogged(uint64 indexed bucket, string indexed namF, SystemDataRecord record);
+    uint64 private firstLogBlock = 0;
+
     uint256 nStoredRecords = 0;
     
     uint64 initialTimestamp = 2051226000000; // 1/1/2035 - 01:00:00:00
@@ -100,7 +123,31 @@ contract BCubedContract {
         return systemDataRecordKeys;
     }
 
-    function addSystemDataRecord(SystemDataRecord memory newSystemDataRecord) private 
+    function getSystemDataRecordKeysCount() public view returns (uint256) {
+        return systemDataRecordKeys.length;
+    }
+
+    // Returns up to limit keys from the index one, so the keys added since the last call are
+    // read without reading all of them again
+    function getSystemDataRecordKeysFrom(uint256 index, uint256 limit) public view returns (uint64[] memory) {
+        uint256 end = systemDataRecordKeys.length;
+        if (index >= end) {
+            return new uint64[](0);
+        }
+
+        if (limit < end - index) {
+            end = index + limit;
+        }
+
+        uint64[] memory keys = new uint64[](end - index);
+        for (uint256 i = index; i < end; i++) {
+            keys[i - index] = systemDataRecordKeys[i];
+        }
+
+        return keys;
+    }
+
+    function checkSystemDataRecord(SystemDataRecord memory newSystemDataRecord) private view 
                 commonRequires(newSystemDataRecord.recT) {
 
         require(metaDataRecord.recT != 0, "MD record does not exist. The Black Box cannot add information until it is initialized.");
@@ -124,11 +171,20 @@ contract BCubedContract {
                 newSystemDataRecord.idTwo == 0 && newSystemDataRecord.valueTwo.length == 0,
                 "If fouV is filled, then valF and twoV fields cannot be filled.");
         }
+    }
+
+    function addSystemDataRecord(SystemDataRecord memory newSystemDataRecord) private {
+
+        checkSystemDataRecord(newSystemDataRecord);
 
         uint64 systemTimestamp = newSystemDataRecord.sysT/1000000;
-        systemDataRecords[systemTimestamp].push(newSystemDataRecord);
 
-        systemDataRecordKeys.push(systemTimestamp);
+        // The key of a bucket is only added when the bucket is created
+        if (systemDataRecords[systemTimestamp].length == 0) {
+            systemDataRecordKeys.push(systemTimestamp);
+        }
+
+        systemDataRecords[systemTimestamp].push(newSystemDataRecord);
 
         nStoredRecords += 1;
 
@@ -144,10 +200,135 @@ contract BCubedContract {
         }
     }
 
+    function addCompressionDictionary(CompressionDictionary calldata newCompressionDictionary) public 
+                onlyOwner() {
+
+        require(overviewDataRecord.recT == 0, 
+            "OD record is already created. The Black Box cannot add more information. It is needed to create a new one.");
+
+        require(newCompressionDictionary.id == compressionDictionaries.length, "The id field must be the next dictionary id.");
+        require(bytes(newCompressionDictionary.namF).length != 0, "The namF field is required.");
+        require(newCompressionDictionary.dictionary.length != 0, "The dictionary field is required.");
+
+        compressionDictionaries.push(newCompressionDictionary);
+    }
+
+    function getCompressionDictionaries() public view returns (CompressionDictionary[] memory) {
+        return compressionDictionaries;
+    }
+
+    function addBatchAnchor(BatchAnchor calldata newBatchAnchor) public 
+                onlyOwner() {
+
+        require(overviewDataRecord.recT == 0, 
+            "OD record is already created. The Black Box cannot add more information. It is needed to create a new one.");
+        require(metaDataRecord.recT != 0, "MD record does not exist. The Black Box cannot add information until it is initialized.");
+
+        require(newBatchAnchor.root != bytes32(0), "The root field is required.");
+        require(newBatchAnchor.count != 0, "The count field is required.");
+        require(newBatchAnchor.minSysT != 0 && newBatchAnchor.minSysT <= newBatchAnchor.maxSysT, 
+            "The minSysT and maxSysT fields must be a valid time range.");
+
+        batchAnchors.push(newBatchAnchor);
+
+        nStoredRecords += newBatchAnchor.count;
+
+        uint64 minSystemTimestamp = newBatchAnchor.minSysT/1000000;
+        uint64 maxSystemTimestamp = newBatchAnchor.maxSysT/1000000;
+
+        initialTimestamp = minSystemTimestamp < initialTimestamp ? minSystemTimestamp : initialTimestamp;
+        finalTimestamp = finalTimestamp < maxSystemTimestamp ? maxSystemTimestamp : finalTimestamp;
+    }
+
+    function getBatchAnchors() public view returns (BatchAnchor[] memory) {
+        return batchAnchors;
+    }
+
+    function logSystemDataRecords(SystemDataRecord[] calldata newSystemDataRecords) public 
+                onlyOwner() {
+
+        if (firstLogBlock == 0) {
+            firstLogBlock = uint64(block.number);
+        }
+
+        for (uint256 i = 0; i < newSystemDataRecords.length; i++) {
+            checkSystemDataRecord(newSystemDataRecords[i]);
+
+            uint64 systemTimestamp = newSystemDataRecords[i].sysT/1000000;
+            emit SystemDataRecordLogged(systemTimestamp, newSystemDataRecords[i].namF, newSystemDataRecords[i]);
+
+            nStoredRecords += 1;
+
+            initialTimestamp = systemTimestamp < initialTimestamp ? systemTimestamp : initialTimestamp;
+            finalTimestamp = finalTimestamp < systemTimestamp ? systemTimestamp : finalTimestamp;
+        }
+    }
+
+    function getFirstLogBlock() public view returns (uint64) {
+        return firstLogBlock;
+    }
+
     function getSystemDataRecordsByTimestamp(uint64 _timestamp) public view returns (SystemDataRecord[] memory) {
         return systemDataRecords[_timestamp];
     }
 
+    // Returns the records of the buckets between minTimestamp and maxTimestamp whose keys are
+    // between the cursor and cursor + limit, and the cursor of the next call, which is the number
+    // of keys when the range is exhausted. The contracts deployed before the keys were unique
+    // can repeat a key, so a bucket whose key is repeated in the page is only returned once.
+    function getSystemDataRecordsInRange(uint64 minTimestamp, uint64 maxTimestamp, uint256 cursor, uint256 limit) 
+                public view returns (SystemDataRecord[] memory, uint256) {
+
+        uint256 end = systemDataRecordKeys.length;
+        if (cursor >= end) {
+            return (new SystemDataRecord[](0), end);
+        }
+
+        if (limit < end - cursor) {
+            end = cursor + limit;
+        }
+
+        uint64[] memory buckets = new uint64[](end - cursor);
+        uint256 bucketsNumber = 0;
+        uint256 recordsNumber = 0;
+
+        for (uint256 i = cursor; i < end; i++) {
+            uint64 bucket = systemDataRecordKeys[i];
+
+            if (bucket < minTimestamp || bucket > maxTimestamp || isBucketInPage(buckets, bucketsNumber, bucket)) {
+                continue;
+            }
+
+            buckets[bucketsNumber] = bucket;
+            bucketsNumber += 1;
+            recordsNumber += systemDataRecords[bucket].length;
+        }
+
+        SystemDataRecord[] memory records = new SystemDataRecord[](recordsNumber);
+        uint256 recordIndex = 0;
+
+        for (uint256 i = 0; i < bucketsNumber; i++) {
+            SystemDataRecord[] storage bucketRecords = systemDataRecords[buckets[i]];
+
+            for (uint256 j = 0; j < bucketRecords.length; j++) {
+                records[recordIndex] = bucketRecords[j];
+                recordIndex += 1;
+            }
+        }
+
+        return (records, end);
+    }
+
+    function isBucketInPage(uint64[] memory buckets, uint256 bucketsNumber, uint64 bucket) private pure returns (bool) {
+        for (uint256 i = 0; i < bucketsNumber; i++) {
+            if (buckets[i] == bucket) {
+                return true;
+            }
+        }
+
+        return false;
+    }
+
     function setOverviewDataRecord(OverviewDataRecord calldata newOverviewDataRecord) public 
                 onlyOwner() 
                 commonRequires(newOverviewDataRecord.recT) {
@@ -0,0 +1,223 @@
+"""
+This is a class-containing module.
+
+It contains the SystemDataRecordSpool class, which is responsible for writing the buffered System
+Data records to disk, so they are not lost if BCubed stops before their batch is confirmed.
+"""
+
+import json
+import logging
+import os
+import struct
+import threading
+import zlib
+
+from pathlib import Path
+
+
+DEFAULT_SYNC_INTERVAL = 32
+DEFAULT_COMPACT_SIZE = 16 * 1024 * 1024
+
+# Entry header: type, sequence number, payload length and payload CRC32
+ENTRY_HEADER = struct.Struct('<cQII')
+ENTRY_RECORD = b'R'
+ENTRY_COMMIT = b'C'
+
+SEQUENCE_FORMAT = '<%dQ'
+SEQUENCE_SIZE = 8
+
+ENCODED_TUPLE = 'tuple'
+ENCODED_BYTES_FIELDS = 'bytes'
+
+TEMPORARY_SUFFIX = '.tmp'
+
+
+class SystemDataRecordSpool:
+    """
+    It contains an append-only file of System Data contract tuples. Every tuple is appended with a
+    sequence number before the Node acknowledges it, and a commit entry is appended once its batch
+    is confirmed. The file is fsynced every sync_interval records and truncated when every record
+    is committed, or compacted when it grows over compact_size. A torn entry at the end of the file,
+    written during a power cut, is discarded when the spool is opened.
+    """
+
+    __logger = logging.getLogger(__name__)
+
+    def __init__(self, path: str, sync_interval: int = DEFAULT_SYNC_INTERVAL,
+                 compact_size: int = DEFAULT_COMPACT_SIZE) -> None:
+        self.__path = Path(path)
+        self.__sync_interval = sync_interval or DEFAULT_SYNC_INTERVAL
+        self.__compact_size = compact_size or DEFAULT_COMPACT_SIZE
+
+        self.__lock = threading.Lock()
+        self.__pending_records = {}
+        self.__next_sequence = 0
+        self.__unsynced_records = 0
+
+        self.__recover()
+
+        self.__file = open(self.__path, 'ab')  # pylint: disable=consider-using-with
+
+        self.__logger.info("%s is initialized. Pending records: %d",
+                           __class__.__name__, len(self.__pending_records))
+
+    def __recover(self):
+        if self.__path.exists() is False:
+            return
+
+        with open(self.__path, 'rb') as file:
+            data = file.read()
+
+        committed_sequences = set()
+        offset = 0
+
+        while offset + ENTRY_HEADER.size <= len(data):
+            entry_type, sequence, length, crc = ENTRY_HEADER.unpack_from(data, offset)
+            payload = data[offset + ENTRY_HEADER.size:offset + ENTRY_HEADER.size + length]
+
+            if len(payload) != length or zlib.crc32(payload) != crc:
+                break
+
+            if entry_type == ENTRY_RECORD:
+                self.__pending_records[sequence] = self.__decode_contract_tuple(payload)
+                self.__next_sequence = max(self.__next_sequence, sequence + 1)
+
+            elif entry_type == ENTRY_COMMIT:
+                committed_sequences.update(
+                    struct.unpack(SEQUENCE_FORMAT % (length // SEQUENCE_SIZE), payload))
+
+            offset += ENTRY_HEADER.size + length
+
+        if offset != len(data):
+            self.__logger.warning(
+                "Torn entry found in the spool. Discarded bytes: %d", len(data) - offset)
+
+            with open(self.__path, 'r+b') as file:
+                file.truncate(offset)
+                os.fsync(file.fileno())
+
+        for sequence in committed_sequences:
+            self.__pending_records.pop(sequence, None)
+
+    def __encode_contract_tuple(self, contract_tuple: dict):
+        bytes_fields = [field for field, value in contract_tuple.items()
+                        if isinstance(value, bytes)]
+
+        return json.dumps({
+            ENCODED_TUPLE: dict(
+                (field, value.hex() if field in bytes_fields else value)
+                for field, value in contract_tuple.items()),
+            ENCODED_BYTES_FIELDS: bytes_fields,
+        }).encode()
+
+    def __decode_contract_tuple(self, payload: bytes):
+        encoded = json.loads(payload)
+        bytes_fields = encoded[ENCODED_BYTES_FIELDS]
+
+        return dict(
+            (field, bytes.fromhex(value) if field in bytes_fields else value)
+            for field, value in encoded[ENCODED_TUPLE].items())
+
+    def __write_entry(self, file, entry_type: bytes, sequence: int, payload: bytes):
+        file.write(ENTRY_HEADER.pack(entry_type, sequence, len(payload), zlib.crc32(payload)))
+        file.write(payload)
+
+    def __sync(self):
+        self.__file.flush()
+        os.fsync(self.__file.fileno())
+        self.__unsynced_records = 0
+
+    def append(self, contract_tuple: dict):
+        """
+        Appends the contract tuple to the spool and returns its sequence number. The spool is
+        fsynced every sync_interval records.
+        """
+
+        with self.__lock:
+            sequence = self.__next_sequence
+            self.__next_sequence += 1
+
+            self.__write_entry(
+                self.__file, ENTRY_RECORD, sequence, self.__encode_contract_tuple(contract_tuple))
+            self.__pending_records[sequence] = contract_tuple
+
+            self.__unsynced_records += 1
+            if self.__unsynced_records >= self.__sync_interval:
+                self.__sync()
+
+        return sequence
+
+    def commit(self, sequences: list):
+        """
+        Marks the records as confirmed on the blockchain network. The spool is truncated when no
+        record is pending, and compacted when it is bigger than compact_size.
+        """
+
+        sequences = [sequence for sequence in sequences if sequence is not None]
+        if len(sequences) == 0:
+            return
+
+        with self.__lock:
+            for sequence in sequences:
+                self.__pending_records.pop(sequence, None)
+
+            if len(self.__pending_records) == 0:
+                self.__file.truncate(0)
+                self.__file.seek(0)
+                self.__sync()
+
+                return
+
+            # A lost commit entry only makes the record be checked against the blockchain network
+            # on the next startup, so it is not fsynced.
+            self.__write_entry(self.__file, ENTRY_COMMIT, 0,
+                               struct.pack(SEQUENCE_FORMAT % len(sequences), *sequences))
+
+            if self.__file.tell() > self.__compact_size:
+                self.__compact()
+
+    def __compact(self):
+        temporary_path = self.__path.with_name(self.__path.name + TEMPORARY_SUFFIX)
+
+        with open(temporary_path, 'wb') as file:
+            for sequence, contract_tuple in self.__pending_records.items():
+                self.__write_entry(
+                    file, ENTRY_RECORD, sequence, self.__encode_contract_tuple(contract_tuple))
+
+            file.flush()
+            os.fsync(file.fileno())
+
+        self.__file.close()
+        os.replace(temporary_path, self.__path)
+        self.__file = open(self.__path, 'ab')  # pylint: disable=consider-using-with
+        self.__unsynced_records = 0
+
+        self.__logger.info("Spool compacted. Pending records: %d", len(self.__pending_records))
+
+    def get_pending_records(self):
+        """
+        Returns a list of (sequence number, contract tuple) with the records that are not confirmed,
+        sorted by sequence number.
+        """
+
+        with self.__lock:
+            return sorted(self.__pending_records.items())
+
+    def sync(self):
+        """
+        Writes the appended records to disk.
+        """
+
+        with self.__lock:
+            if self.__file.closed is False:
+                self.__sync()
+
+    def close(self):
+        """
+        Writes the appended records to disk and closes the spool file.
+        """
+
+        with self.__lock:
+            if self.__file.closed is False:
+                self.__sync()
+                self.__file.close()
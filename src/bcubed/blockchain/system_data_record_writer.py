@@ -0,0 +1,185 @@
+"""
+This is a class-containing module.
+
+It contains the SystemDataRecordWriter class, which is responsible for storing System Data records
+asynchronously, so the callers are not blocked while the Node waits for the blockchain network.
+"""
+
+import logging
+import queue
+import threading
+
+from concurrent.futures import Future
+
+from bcubed.blockchain.node import Node
+from bcubed.records.system_data_record import SystemDataRecord
+
+
+DEFAULT_QUEUE_SIZE = 10000
+
+# Seconds without records after which the Node is asked to flush the expired records
+EXPIRATION_POLL_INTERVAL = 1
+
+FLUSH_REQUEST = object()
+CLOSE_REQUEST = object()
+
+
+class SystemDataRecordWriter:
+    """
+    It contains a bounded queue in front of the Node and a dedicated worker thread, which converts,
+    batches and sends the System Data records to the Node. Each stored record returns a Future that
+    is resolved with True or False once the transaction that contains the record is stored or
+    fails. It can be used as a context manager to flush and close it explicitly.
+    """
+
+    __logger = logging.getLogger(__name__)
+
+    def __init__(self, node: Node, queue_size: int = DEFAULT_QUEUE_SIZE) -> None:
+        self.__node = node
+
+        if queue_size is None or queue_size <= 0:
+            queue_size = DEFAULT_QUEUE_SIZE
+
+        self.__queue = queue.Queue(maxsize=queue_size)
+        self.__closed = False
+        self.__close_lock = threading.Lock()
+
+        self.__worker = threading.Thread(
+            target=self.__run, name=__class__.__name__, daemon=True)
+        self.__worker.start()
+
+        self.__logger.info(
+            "%s is initialized. Queue size: %d", __class__.__name__, queue_size)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __run(self):
+        while True:
+            try:
+                item, future = self.__queue.get(timeout=EXPIRATION_POLL_INTERVAL)
+
+            except queue.Empty:
+                self.__flush_expired()
+
+                continue
+
+            try:
+                if item is FLUSH_REQUEST:
+                    future.set_result(self.__node.flush())
+
+                elif item is CLOSE_REQUEST:
+                    future.set_result(self.__node.flush())
+                    return
+
+                else:
+                    self.__node.store_system_data_record(
+                        item, self.__get_future_callback(future))
+
+            except Exception as ex:  # pylint: disable=broad-exception-caught
+                self.__logger.error(
+                    "Exception when writing SD record: %s", ex)
+
+                if not future.done():
+                    future.set_result(False)
+
+            except SystemExit:
+                self.__logger.critical(
+                    "SystemExit when writing SD record")
+
+                if not future.done():
+                    future.set_result(False)
+
+            finally:
+                self.__queue.task_done()
+
+    def __flush_expired(self):
+        try:
+            self.__node.flush_expired()
+
+        except Exception as ex:  # pylint: disable=broad-exception-caught
+            self.__logger.error(
+                "Exception when flushing expired SD records: %s", ex)
+
+    def __get_future_callback(self, future: Future):
+        def future_callback(stored: bool):
+            if not future.done():
+                future.set_result(stored)
+
+        return future_callback
+
+    def __put(self, item, block: bool = True, timeout: float = None):
+        future = Future()
+
+        if self.__closed is True:
+            self.__logger.error("%s is closed.", __class__.__name__)
+            future.set_result(False)
+
+            return future
+
+        try:
+            self.__queue.put((item, future), block, timeout)
+
+        except queue.Full:
+            self.__logger.error(
+                "The queue is full. The SD record cannot be stored.")
+            future.set_result(False)
+
+        return future
+
+    def store_system_data_record(
+            self, system_data_record: SystemDataRecord, callback=None,
+            block: bool = True, timeout: float = None):
+        """
+        Queues the System Data record to be stored by the worker and returns a Future, which is
+        resolved with True when the record is stored on the blockchain or with False if not.
+        The optional callback is called with the same value. If the queue is full, it waits until
+        timeout, unless block is False, and then the Future is resolved with False.
+        """
+
+        future = self.__put(system_data_record, block, timeout)
+
+        if callback is not None:
+            future.add_done_callback(
+                lambda done_future: callback(done_future.result()))
+
+        return future
+
+    def flush(self, timeout: float = None):
+        """
+        Waits until all the queued System Data records are sent to the Node and then flushes it.
+        Returns True if the buffered records are stored, and False if not.
+        """
+
+        return self.__put(FLUSH_REQUEST).result(timeout)
+
+    def close(self, timeout: float = None):
+        """
+        Flushes the queued System Data records and stops the worker. No more records can be stored
+        once it is closed.
+        Returns True if the remaining records are stored, and False if not.
+        """
+
+        with self.__close_lock:
+            if self.__closed is True:
+                return True
+
+            future = self.__put(CLOSE_REQUEST)
+            self.__closed = True
+
+        stored = future.result(timeout)
+        self.__worker.join(timeout)
+
+        self.__logger.info("%s is closed.", __class__.__name__)
+
+        return stored
+
+    def is_closed(self):
+        """
+        Returns True if the writer is closed, and False if not.
+        """
+
+        return self.__closed
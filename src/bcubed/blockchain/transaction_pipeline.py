@@ -0,0 +1,339 @@
+"""
+This is a class-containing module.
+
+It contains the TransactionPipeline class, which is responsible for sending signed transactions
+without waiting for their receipts, so several transactions can be in flight at the same time.
+"""
+
+import logging
+import threading
+import time
+
+from web3 import Web3
+
+from bcubed.blockchain.nonce_manager import NonceManager
+
+
+DEFAULT_MAX_IN_FLIGHT = 4
+DEFAULT_POLL_INTERVAL = 0.5
+DEFAULT_RECEIPT_TIMEOUT = 120
+
+RPC_SEND_RAW_TRANSACTION = 'eth_sendRawTransaction'
+RPC_GET_TRANSACTION_RECEIPT = 'eth_getTransactionReceipt'
+
+RPC_RESULT = 'result'
+RPC_ERROR = 'error'
+RECEIPT_STATUS = 'status'
+
+ENTRY_NONCE = 'nonce'
+ENTRY_CALLBACK = 'callback'
+ENTRY_RAW_TRANSACTION = 'raw_transaction'
+ENTRY_SENT_TIME = 'sent_time'
+
+
+class TransactionPipeline:
+    """
+    It contains the signed transactions waiting to be sent and the transactions in flight. A
+    background worker sends all the waiting transactions in one JSON-RPC batch request and polls
+    the receipts of the transactions in flight, also in one batch request. Each transaction
+    callback is called with True when its receipt is successful, and with False when it is
+    reverted, rejected or replaced. A transaction that is not mined before the receipt timeout is
+    sent again, with the same nonce, so it is never stored twice, and it is only failed once
+    another transaction with its nonce is mined.
+    No more than max_in_flight transactions are in flight; submit blocks until there is room.
+    """
+
+    __logger = logging.getLogger(__name__)
+
+    def __init__(self, web3: Web3, nonce_manager: NonceManager,
+                 max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+                 poll_interval: float = DEFAULT_POLL_INTERVAL,
+                 receipt_timeout: float = DEFAULT_RECEIPT_TIMEOUT) -> None:
+        self.__w3 = web3
+        self.__nonce_manager = nonce_manager
+
+        self.__max_in_flight = max_in_flight or DEFAULT_MAX_IN_FLIGHT
+        self.__poll_interval = poll_interval or DEFAULT_POLL_INTERVAL
+        self.__receipt_timeout = receipt_timeout or DEFAULT_RECEIPT_TIMEOUT
+
+        self.__slots = threading.BoundedSemaphore(self.__max_in_flight)
+        self.__condition = threading.Condition()
+
+        self.__waiting_transactions = []
+        self.__sending_number = 0
+        self.__in_flight_transactions = {}
+
+        self.__worker = None
+        self.__closed = False
+        self.__resync_pending = False
+
+        self.__logger.info(
+            "%s is initialized. Max in flight: %d", __class__.__name__, self.__max_in_flight)
+
+    def __start_worker(self):
+        if self.__worker is None:
+            self.__worker = threading.Thread(
+                target=self.__run, name=__class__.__name__, daemon=True)
+            self.__worker.start()
+
+    def submit(self, raw_transaction: bytes, nonce: int, callback=None):
+        """
+        Adds the signed transaction to the next batch request. The callback is called with True or
+        False once the transaction is confirmed or failed. It blocks while there are max_in_flight
+        transactions in flight.
+        """
+
+        self.__slots.acquire()  # pylint: disable=consider-using-with
+
+        with self.__condition:
+            self.__waiting_transactions.append({
+                ENTRY_RAW_TRANSACTION: raw_transaction,
+                ENTRY_NONCE: nonce,
+                ENTRY_CALLBACK: callback,
+            })
+
+            self.__start_worker()
+            self.__condition.notify_all()
+
+    def get_in_flight_number(self):
+        """
+        Returns the number of transactions that are waiting to be sent or in flight.
+        """
+
+        with self.__condition:
+            return (len(self.__waiting_transactions) + self.__sending_number +
+                    len(self.__in_flight_transactions))
+
+    def wait(self, timeout: float = None):
+        """
+        Waits until all the submitted transactions are confirmed or failed.
+        Returns True if there are no transactions in flight, and False if the timeout expires.
+        """
+
+        with self.__condition:
+            return self.__condition.wait_for(
+                lambda: (len(self.__waiting_transactions) == 0 and
+                         self.__sending_number == 0 and
+                         len(self.__in_flight_transactions) == 0),
+                timeout)
+
+    def close(self, timeout: float = None):
+        """
+        Waits for the transactions in flight and stops the worker.
+        """
+
+        self.wait(timeout)
+
+        with self.__condition:
+            self.__closed = True
+            self.__condition.notify_all()
+
+        if self.__worker is not None:
+            self.__worker.join(timeout)
+
+    def __run(self):
+        while True:
+            with self.__condition:
+                self.__condition.wait_for(
+                    lambda: (self.__closed or len(self.__waiting_transactions) > 0 or
+                             len(self.__in_flight_transactions) > 0))
+
+                if self.__closed and len(self.__in_flight_transactions) == 0:
+                    return
+
+                waiting_transactions = list(self.__waiting_transactions)
+                self.__waiting_transactions.clear()
+                self.__sending_number = len(waiting_transactions)
+
+            try:
+                if len(waiting_transactions) > 0:
+                    self.__send_transactions(waiting_transactions)
+
+            except Exception as ex:  # pylint: disable=broad-exception-caught
+                self.__logger.error(
+                    "Exception in the transaction pipeline: %s", ex)
+
+            with self.__condition:
+                self.__sending_number = 0
+
+            try:
+                self.__poll_receipts()
+
+            except Exception as ex:  # pylint: disable=broad-exception-caught
+                self.__logger.error(
+                    "Exception in the transaction pipeline: %s", ex)
+
+            with self.__condition:
+                self.__condition.notify_all()
+
+                if len(self.__waiting_transactions) == 0:
+                    self.__condition.wait(self.__poll_interval)
+
+    def __send_transactions(self, transactions: list):
+        try:
+            responses = self.__w3.provider.make_batch_request(
+                [(RPC_SEND_RAW_TRANSACTION, [Web3.to_hex(transaction[ENTRY_RAW_TRANSACTION])])
+                 for transaction in transactions])
+
+        except Exception as ex:  # pylint: disable=broad-exception-caught
+            self.__logger.error(
+                "Exception when sending %d transactions: %s", len(transactions), ex)
+
+            for transaction in transactions:
+                self.__nonce_manager.release(transaction[ENTRY_NONCE])
+                self.__finish(transaction, False)
+
+            return
+
+        for transaction, response in zip(transactions, responses):
+            if response.get(RPC_ERROR) is not None or response.get(RPC_RESULT) is None:
+                self.__logger.error(
+                    "Transaction with nonce %s was rejected: %s",
+                    transaction[ENTRY_NONCE], response.get(RPC_ERROR))
+
+                if NonceManager.is_nonce_error(response.get(RPC_ERROR)):
+                    with self.__condition:
+                        self.__resync_pending = True
+                else:
+                    self.__nonce_manager.release(transaction[ENTRY_NONCE])
+
+                self.__finish(transaction, False)
+
+                continue
+
+            transaction[ENTRY_SENT_TIME] = time.monotonic()
+
+            with self.__condition:
+                self.__in_flight_transactions[response[RPC_RESULT]] = transaction
+
+        self.__logger.debug("%d transactions were sent", len(transactions))
+
+        self.__resync_if_idle()
+
+    def __resync_if_idle(self):
+        """
+        Resynchronizes the nonces after a nonce error once there are no other transactions in
+        flight, since their nonces are still reserved.
+        """
+
+        with self.__condition:
+            if (self.__resync_pending is False or len(self.__waiting_transactions) > 0 or
+                    len(self.__in_flight_transactions) > 0):
+                return
+
+            self.__resync_pending = False
+
+        self.__nonce_manager.resync()
+
+    def __poll_receipts(self):
+        with self.__condition:
+            hashes = list(self.__in_flight_transactions.keys())
+
+        if len(hashes) == 0:
+            self.__resync_if_idle()
+
+            return
+
+        responses = self.__w3.provider.make_batch_request(
+            [(RPC_GET_TRANSACTION_RECEIPT, [hash_transaction]) for hash_transaction in hashes])
+
+        for hash_transaction, response in zip(hashes, responses):
+            receipt = response.get(RPC_RESULT)
+
+            if receipt is None:
+                self.__check_receipt_timeout(hash_transaction)
+
+                continue
+
+            with self.__condition:
+                transaction = self.__in_flight_transactions.pop(hash_transaction)
+
+            stored = self.__is_successful_receipt(receipt)
+            if stored is False:
+                self.__logger.error(
+                    "Transaction %s was reverted", hash_transaction)
+
+            self.__finish(transaction, stored)
+
+        self.__resync_if_idle()
+
+    def __check_receipt_timeout(self, hash_transaction: str):
+        with self.__condition:
+            transaction = self.__in_flight_transactions[hash_transaction]
+
+            if time.monotonic() - transaction[ENTRY_SENT_TIME] < self.__receipt_timeout:
+                return
+
+        # The transaction may still be pending or dropped, so it is sent again with its nonce
+        if self.__nonce_manager.is_nonce_mined(transaction[ENTRY_NONCE]) is False:
+            self.__logger.warning(
+                "Transaction %s was not mined in %s seconds. It is sent again",
+                hash_transaction, self.__receipt_timeout)
+
+            self.__resend_transaction(transaction)
+            transaction[ENTRY_SENT_TIME] = time.monotonic()
+
+            return
+
+        # The receipt is polled again, since the transaction may be mined after the last poll
+        receipt = self.__w3.provider.make_request(
+            RPC_GET_TRANSACTION_RECEIPT, [hash_transaction]).get(RPC_RESULT)
+
+        with self.__condition:
+            del self.__in_flight_transactions[hash_transaction]
+
+        if receipt is None:
+            self.__logger.error(
+                "Transaction %s was replaced by another transaction with nonce %s",
+                hash_transaction, transaction[ENTRY_NONCE])
+
+            self.__finish(transaction, False)
+
+            return
+
+        stored = self.__is_successful_receipt(receipt)
+        if stored is False:
+            self.__logger.error(
+                "Transaction %s was reverted", hash_transaction)
+
+        self.__finish(transaction, stored)
+
+    def __resend_transaction(self, transaction: dict):
+        try:
+            response = self.__w3.provider.make_request(
+                RPC_SEND_RAW_TRANSACTION, [Web3.to_hex(transaction[ENTRY_RAW_TRANSACTION])])
+
+        except Exception as ex:  # pylint: disable=broad-exception-caught
+            self.__logger.error(
+                "Exception when sending again the transaction with nonce %s: %s",
+                transaction[ENTRY_NONCE], ex)
+
+            return
+
+        # The transaction is usually known by the node yet
+        if response.get(RPC_ERROR) is not None:
+            self.__logger.debug(
+                "Transaction with nonce %s was not sent again: %s",
+                transaction[ENTRY_NONCE], response.get(RPC_ERROR))
+
+    def __is_successful_receipt(self, receipt: dict):
+        status = receipt.get(RECEIPT_STATUS)
+
+        if isinstance(status, str):
+            status = int(status, 16)
+
+        return status == 1
+
+    def __finish(self, transaction: dict, stored: bool):
+        self.__slots.release()
+
+        callback = transaction[ENTRY_CALLBACK]
+        if callback is None:
+            return
+
+        try:
+            callback(stored)
+
+        except Exception as ex:  # pylint: disable=broad-exception-caught
+            self.__logger.error(
+                "Exception when notifying a transaction: %s", ex)
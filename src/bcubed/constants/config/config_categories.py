@@ -16,3 +16,14 @@ class ConfigCategories:  # pylint: disable=too-few-public-methods
     CONTRACT = "contract"
     SOLIDITY = "solidity"
     NETWORK = "network"
+    WRITER = "writer"
+    GAS = "gas"
+    PIPELINE = "pipeline"
+    SPOOL = "spool"
+    FLUSH = "flush"
+    PACKING = "packing"
+    COMPRESSION = "compression"
+    ANCHORING = "anchoring"
+    EVENT_LOG = "event_log"
+    KEY_CACHE = "key_cache"
+    READ_CACHE = "read_cache"
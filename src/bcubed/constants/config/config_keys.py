@@ -26,3 +26,34 @@ class ConfigKeys:  # pylint: disable=too-few-public-methods
     CHAIN_ID = "chain_id"
     ACCOUNT_ADDRESS = "account_address"
     PRIVATE_KEY = "private_key"
+
+    QUEUE_SIZE = "queue_size"
+
+    SAFETY_MARGIN = "safety_margin"
+    RECALIBRATION_INTERVAL = "recalibration_interval"
+
+    ENABLED = "enabled"
+    MAX_IN_FLIGHT = "max_in_flight"
+    POLL_INTERVAL = "poll_interval"
+    RECEIPT_TIMEOUT = "receipt_timeout"
+    MAX_RESUBMISSIONS = "max_resubmissions"
+
+    SYNC_INTERVAL = "sync_interval"
+
+    MAX_AGE = "max_age"
+    MAX_RECORDS = "max_records"
+    MAX_BYTES = "max_bytes"
+    ADAPTIVE = "adaptive"
+    TARGET_INCLUSION_TIME = "target_inclusion_time"
+    MIN_TARGET_GAS = "min_target_gas"
+
+    WINDOW = "window"
+    MULTI_FIELD = "multi_field"
+
+    FIELDS = "fields"
+    SAMPLES = "samples"
+    DICTIONARY_SIZE = "dictionary_size"
+
+    BLOCK_RANGE = "block_range"
+
+    FINALIZATION_CHECK_INTERVAL = "finalization_check_interval"
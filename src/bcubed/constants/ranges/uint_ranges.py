@@ -16,3 +16,6 @@ class UintRanges():  # pylint: disable=too-few-public-methods
 
     UINT16_MIN = 0
     UINT16_MAX = 65535
+
+    UINT64_MIN = 0
+    UINT64_MAX = 18446744073709551615
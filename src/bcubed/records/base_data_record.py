@@ -11,18 +11,42 @@ import sys
 from numbers import Number
 from collections.abc import Mapping
 
-from zlib import decompress
-
 from bcubed.constants.records.fields.common_data_fields import CommonDataFields
 from bcubed.constants.records.fields.id_value_fields import IdValueFields
 from bcubed.enumerates.record_type import RecordType
 
+from bcubed.utilities.compression_help import decompress_value
 from bcubed.utilities.datetime_help import get_current_timestamp
 from bcubed.utilities.record_type_help import is_valid_record_type
 
 ZERO_DEPTH_BASES = (str, bytes, Number, range, bytearray)
 
 
+def is_not_default_value(field_name: str, field_value):
+    """
+    Returns True if the value of a field, which is not an id-value field, is not its default value.
+    These fields are counted in the fieN value.
+    """
+
+    if field_name is CommonDataFields.FIELD_FIE_N:
+        # The fieN field will always have a no default value
+        return True
+
+    if isinstance(field_value, bool):
+        return True
+
+    if isinstance(field_value, int):
+        return field_value != 0
+
+    if isinstance(field_value, str):
+        return field_value != ""
+
+    if isinstance(field_value, bytes):
+        return field_value != b''
+
+    return False
+
+
 class BaseDataRecord(dict):
     """
     It contains the base dictionary that all record types share and the key and value constraints.
@@ -33,8 +57,15 @@ class BaseDataRecord(dict):
     _retrieve_type = False
 
     def __init__(self, record_type: RecordType) -> None:
+        self.__not_default_fields = None
+        self.__id_value_fields = {}
+        self.__updating_fields = False
+
         self.__initialize_data_record(record_type)
 
+        # The record types add their fields after, so they are counted on the first update
+        self.__not_default_fields = None
+
         super().__init__()
 
     def __setitem__(self, key: str, value):
@@ -58,7 +89,8 @@ class BaseDataRecord(dict):
 
         super().__setitem__(key, value)
 
-        self.__update_rec_t_value()
+        if self.__updating_fields is False:
+            self.__update_rec_t_value(key, value)
 
     def __initialize_data_record(self, record_type: RecordType):
         self.update(
@@ -71,32 +103,51 @@ class BaseDataRecord(dict):
 
         self.__update_rec_t_value()
 
-    def __update_rec_t_value(self):
-        # Always a value is updated, the recT field must be updated.
-        rec_t_value = self.__get_not_default_fields_number()
-        super().__setitem__(CommonDataFields.FIELD_FIE_N, rec_t_value)
-
-    def __get_not_default_fields_number(self):
-        count = 0
-
-        for field_name in self:
-            field_value = self[field_name]
-
-            if field_name is CommonDataFields.FIELD_FIE_N:
-                # The fieN field will always have a no default value
-                count += 1
-            elif isinstance(field_value, bool):
-                count += 1
-            elif isinstance(field_value, int) and field_value != 0:
-                count += 1
-            elif isinstance(field_value, str) and field_value != "":
-                count += 1
-            elif isinstance(field_value, bytes) and field_value != b'':
-                count += 1
-            elif isinstance(field_value, dict) and field_value[IdValueFields.FIELD_ID] != 0:
-                count += 1
-
-        return count
+    def update_fields(self, fields: dict):
+        """
+        Sets the values of the fields, each one validated as when it is set alone, and updates the
+        fieN value once, after all of them are set.
+        """
+
+        self.__updating_fields = True
+
+        try:
+            for key, value in fields.items():
+                self[key] = value
+        finally:
+            self.__updating_fields = False
+
+            self.__update_rec_t_value()
+
+    def __update_rec_t_value(self, key: str = None, value=None):
+        # Always a value is updated, the recT field must be updated. The scalar fields with no
+        # default value are counted once, and then only the status of the updated field is
+        # checked. The id-value fields are updated in place, so they are checked every time.
+        if key is None or self.__not_default_fields is None:
+            self.__not_default_fields = set()
+            self.__id_value_fields = {}
+
+            for field_name, field_value in self.items():
+                self.__update_field_status(field_name, field_value)
+
+        else:
+            self.__not_default_fields.discard(key)
+            self.__id_value_fields.pop(key, None)
+
+            self.__update_field_status(key, value)
+
+        not_default_fields_number = len(self.__not_default_fields)
+        for field_value in self.__id_value_fields.values():
+            if field_value[IdValueFields.FIELD_ID] != 0:
+                not_default_fields_number += 1
+
+        super().__setitem__(CommonDataFields.FIELD_FIE_N, not_default_fields_number)
+
+    def __update_field_status(self, field_name: str, field_value):
+        if isinstance(field_value, dict):
+            self.__id_value_fields[field_name] = field_value
+        elif is_not_default_value(field_name, field_value):
+            self.__not_default_fields.add(field_name)
 
     def set_retrieve_type(self, retrieve_type: bool):
         """
@@ -120,7 +171,7 @@ class BaseDataRecord(dict):
                     dictionary[key] = value
 
                 if isinstance(value, bytes) and value != b'':
-                    value = decompress(value).decode()
+                    value = decompress_value(value)
                     dictionary[key] = value
 
             if value == {}:
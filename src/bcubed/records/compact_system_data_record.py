@@ -0,0 +1,153 @@
+"""
+This is a class-containing module.
+
+It contains the CompactSystemDataRecord and CompactIdValueField classes, which implement Mapping
+and store the values of the retrieved System Data records in tuples with a fixed field index,
+instead of dictionaries.
+"""
+
+from collections.abc import Mapping
+
+from bcubed.constants.records.fields.common_data_fields import CommonDataFields
+from bcubed.constants.records.fields.id_value_fields import IdValueFields
+from bcubed.constants.records.fields.system_data_fields import SystemDataFields
+from bcubed.records.base_data_record import is_not_default_value
+from bcubed.records.system_data_record import SystemDataRecord, from_bytes_to_valid_unit
+
+
+class CompactIdValueField(Mapping):
+    """
+    It contains the values of an id-value field. The keys are shared by all the fields of the same
+    type. It is read-only.
+    """
+
+    __slots__ = ('_keys', '_values')
+
+    def __init__(self, keys: tuple, values: tuple) -> None:
+        self._keys = keys
+        self._values = values
+
+    def __getitem__(self, key: str):
+        try:
+            return self._values[self._keys.index(key)]
+        except ValueError:
+            raise KeyError(key) from None
+
+    def __iter__(self):
+        return iter(self._keys)
+
+    def __len__(self):
+        return len(self._keys)
+
+    def __repr__(self):
+        return repr(dict(self))
+
+
+__system_data_record = SystemDataRecord()
+
+FIELD_NAMES = tuple(__system_data_record)
+FIELD_INDEXES = dict((field_name, index) for index, field_name in enumerate(FIELD_NAMES))
+
+ID_VALUE_FIELD_TYPES = dict(
+    (field_name, type(field_value)) for field_name, field_value in __system_data_record.items()
+    if isinstance(field_value, dict))
+
+# The default id-value fields are read-only, so they are shared by all the records
+DEFAULT_VALUES = tuple(
+    CompactIdValueField(tuple(field_value), tuple(field_value.values()))
+    if isinstance(field_value, dict) else field_value
+    for field_value in __system_data_record.values())
+
+del __system_data_record
+
+
+class CompactSystemDataRecord(Mapping):
+    """
+    It contains the values of a retrieved System Data record, with the same keys and values as a
+    SystemDataRecord, in a tuple indexed by FIELD_INDEXES. A System Data record usually has the
+    value of one field, namF, so the other id-value fields are the shared default ones. It is
+    read-only.
+    """
+
+    __slots__ = ('_values',)
+
+    def __init__(self, rec_t: int, sys_t: int, nam_f: str = None, nam_f_value=None,
+                 fields: dict = None) -> None:
+        """
+        The nam_f_value is the value of the namF field as it is retrieved from the contract, or a
+        dictionary with the id and values of an id-value field. The fields are the values of more
+        fields, as nam_f_value, by field name, for the records that store several fields.
+        """
+
+        values = list(DEFAULT_VALUES)
+
+        values[FIELD_INDEXES[CommonDataFields.FIELD_REC_T]] = rec_t
+        values[FIELD_INDEXES[SystemDataFields.FIELD_SYS_T]] = sys_t
+
+        for field_name, field_value in [(nam_f, nam_f_value)] + list((fields or {}).items()):
+            if field_name in ID_VALUE_FIELD_TYPES:
+                field = ID_VALUE_FIELD_TYPES[field_name](field_value)
+                values[FIELD_INDEXES[field_name]] = CompactIdValueField(
+                    values[FIELD_INDEXES[field_name]]._keys, tuple(field.values()))
+
+            elif field_name in FIELD_INDEXES:
+                values[FIELD_INDEXES[field_name]] = from_bytes_to_valid_unit(
+                    field_name, field_value)
+
+        values[FIELD_INDEXES[CommonDataFields.FIELD_FIE_N]] = self.__get_not_default_fields_number(
+            values)
+
+        self._values = tuple(values)
+
+    def __get_not_default_fields_number(self, values: list):
+        not_default_fields_number = 0
+
+        for field_name, field_value in zip(FIELD_NAMES, values):
+            if isinstance(field_value, CompactIdValueField):
+                if field_value[IdValueFields.FIELD_ID] != 0:
+                    not_default_fields_number += 1
+
+            elif is_not_default_value(field_name, field_value):
+                not_default_fields_number += 1
+
+        return not_default_fields_number
+
+    def __getitem__(self, key: str):
+        return self._values[FIELD_INDEXES[key]]
+
+    def __iter__(self):
+        return iter(FIELD_NAMES)
+
+    def __len__(self):
+        return len(FIELD_NAMES)
+
+    def __repr__(self):
+        return repr(dict(self))
+
+    def to_system_data_record(self):
+        """
+        Returns a SystemDataRecord with the record values.
+        """
+
+        system_data_record = SystemDataRecord()
+        system_data_record.set_retrieve_type(True)
+
+        # The default values are kept, the default id-value fields are not valid to be set again
+        system_data_record.update_fields(dict(
+            (field_name, ID_VALUE_FIELD_TYPES[field_name](dict(field_value))
+             if field_name in ID_VALUE_FIELD_TYPES else field_value)
+            for field_name, field_value, default_value in zip(
+                FIELD_NAMES, self._values, DEFAULT_VALUES)
+            if field_value is not default_value and
+            field_name not in (CommonDataFields.FIELD_TYP_R, CommonDataFields.FIELD_FIE_N)))
+
+        system_data_record.set_retrieve_type(False)
+
+        return system_data_record
+
+    def to_string(self):
+        """
+        Returns the record information in string json format, as SystemDataRecord.to_string does.
+        """
+
+        return self.to_system_data_record().to_string()
@@ -6,9 +6,9 @@ dictionary for all fields value which contain a field called id, whose value is
 several fields called value with an identifier, whose values are numbers.
 """
 
-from zlib import decompress
 from bcubed.constants.records.fields.id_value_fields import IdValueFields
 from bcubed.records.fields.base_id_field import BaseIdField
+from bcubed.utilities.compression_help import decompress_value
 
 
 class BaseIdNumberValueArrayField(BaseIdField):
@@ -51,6 +51,6 @@ class BaseIdNumberValueArrayField(BaseIdField):
             isinstance(value, bytes) and
                 value != b''):
 
-            value = int(decompress(value).decode())
+            value = int(decompress_value(value))
 
         return value
@@ -6,9 +6,9 @@ dictionary for all fields value which contain a field called id, whose value is
 field called value, whose value is a number.
 """
 
-from zlib import decompress
 from bcubed.constants.records.fields.id_value_fields import IdValueFields
 from bcubed.records.fields.base_id_field import BaseIdField
+from bcubed.utilities.compression_help import decompress_value
 
 
 class BaseIdNumberValueNumberField(BaseIdField):
@@ -47,7 +47,7 @@ class BaseIdNumberValueNumberField(BaseIdField):
             isinstance(value, bytes) and
                 value != b''):
 
-            value = int(decompress(value).decode())
+            value = int(decompress_value(value))
 
         return value
 
@@ -56,6 +56,6 @@ class BaseIdNumberValueNumberField(BaseIdField):
             isinstance(value, bytes) and
                 value != b''):
 
-            value = float(decompress(value).decode())
+            value = float(decompress_value(value))
 
         return value
@@ -6,9 +6,9 @@ dictionary for all fields value which contain a field called id, whose value is
 field called value, whose value is a string.
 """
 
-from zlib import decompress
 from bcubed.constants.records.fields.id_value_fields import IdValueFields
 from bcubed.records.fields.base_id_field import BaseIdField
+from bcubed.utilities.compression_help import decompress_value
 
 
 class BaseIdNumberValueStringField(BaseIdField):
@@ -51,6 +51,6 @@ class BaseIdNumberValueStringField(BaseIdField):
             isinstance(value, bytes) and
                 value != b''):
 
-            value = str(decompress(value).decode())
+            value = decompress_value(value)
 
         return value
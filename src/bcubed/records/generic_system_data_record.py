@@ -5,14 +5,14 @@ It contains the GenericSystemDataRecord class, which inherits from BaseDataRecor
 dictionary for system data record type.
 """
 
-from zlib import compress
-
 from bcubed.constants.records.fields.common_data_fields import CommonDataFields
 from bcubed.constants.records.fields.generic_system_data_fields import GenericSystemDataFields
 from bcubed.constants.records.fields.id_value_fields import IdValueFields
 from bcubed.constants.records.fields.system_data_fields import SystemDataFields
 from bcubed.enumerates.record_type import RecordType
 from bcubed.records.base_data_record import BaseDataRecord
+from bcubed.utilities.compression_help import compress_value
+from bcubed.utilities.encoding_help import get_encoded_size
 
 from bcubed.constants.records.fields.system_data_fields import (
     VAL_F_FIELDS,
@@ -29,6 +29,8 @@ class GenericSystemDataRecord(BaseDataRecord):
     """
 
     def __init__(self, system_data_record):
+        self.__encoded_size = None
+
         super().__init__(RecordType.SYSTEM_DATA)
 
         self.__initialize_data_record()
@@ -80,7 +82,7 @@ class GenericSystemDataRecord(BaseDataRecord):
                     GenericSystemDataFields.FIELD_VALUE_2_FOU,
                     GenericSystemDataFields.FIELD_VALUE_3_FOU] and
                 isinstance(value, str)):
-            value = compress(value.encode())
+            value = compress_value(value, self.get(GenericSystemDataFields.FIELD_NAM_F))
 
         if self.__check_simple_fields(key, value):
             raise ValueError(
@@ -88,6 +90,20 @@ class GenericSystemDataRecord(BaseDataRecord):
 
         super().__setitem__(key, value)
 
+        self.__encoded_size = None
+
+    def get_encoded_size(self):
+        """
+        Returns the exact size of the ABI encoding of the record as a contract tuple, that is, the
+        calldata that it takes on chain. It is computed from the length of its values and cached
+        until a value changes.
+        """
+
+        if self.__encoded_size is None:
+            self.__encoded_size = get_encoded_size(self)
+
+        return self.__encoded_size
+
     def __check_simple_fields(self, key: str, value):
         return (self.__is_valid_int_value(key, value) or
                 self.__is_valid_string_value(key, value) or
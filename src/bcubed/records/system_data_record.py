@@ -5,8 +5,6 @@ It contains the SystemDataRecord class, which inherits from BaseDataRecord and d
 dictionary for system data record type.
 """
 
-from zlib import decompress
-
 from bcubed.constants.records.fields.system_data_fields import SystemDataFields
 from bcubed.enumerates.record_type import RecordType
 from bcubed.records.base_data_record import BaseDataRecord
@@ -14,6 +12,40 @@ from bcubed.records.fields.id_uint8_value_uint16_field import IdUint8ValueUint16
 from bcubed.records.fields.id_uint8_value_array_uint16_field import IdUint8ValueArrayUint16Field
 from bcubed.records.fields.id_uint8_value_string_field import IdUint8ValueStringField
 from bcubed.records.fields.id_uint8_value_float_field import IdUint8ValueFloatField
+from bcubed.utilities.compression_help import decompress_value
+
+
+def from_bytes_to_valid_unit(key: str, value):
+    """
+    Returns the value of a System Data field that is not an id-value field, decoded if it is
+    retrieved encoded from the contract.
+    """
+
+    if isinstance(value, bytes):
+        if key == SystemDataFields.FIELD_BAT_L and value != b'':
+            value = int(decompress_value(value))
+
+        elif key in (
+            SystemDataFields.FIELD_OPE_S,
+            SystemDataFields.FIELD_TXT_C,
+            SystemDataFields.FIELD_TXT_R,
+            SystemDataFields.FIELD_RAM_D,
+            SystemDataFields.FIELD_SWP_D,
+            SystemDataFields.FIELD_PER_I
+        ) and value != b'':
+            value = decompress_value(value)
+
+        elif key == SystemDataFields.FIELD_AUT_B:
+            if value != b'':
+                value = decompress_value(value)
+                if value in ("True", "true"):
+                    value = True
+                elif value in ("False", "false"):
+                    value = False
+            else:
+                value = False
+
+    return value
 
 
 class SystemDataRecord(BaseDataRecord):
@@ -30,7 +62,7 @@ class SystemDataRecord(BaseDataRecord):
 
     def __setitem__(self, key: str, value):
 
-        value = self.__from_bytes_to_valid_unit(key, value)
+        value = from_bytes_to_valid_unit(key, value)
 
         if (self.__check_simple_fields(key, value) or
                 self.__check_composite_fields(key, value)):
@@ -40,33 +72,6 @@ class SystemDataRecord(BaseDataRecord):
 
         super().__setitem__(key, value)
 
-    def __from_bytes_to_valid_unit(self, key: str, value):
-        if isinstance(value, bytes):
-            if key == SystemDataFields.FIELD_BAT_L and value != b'':
-                value = int(decompress(value).decode())
-
-            elif key in (
-                SystemDataFields.FIELD_OPE_S,
-                SystemDataFields.FIELD_TXT_C,
-                SystemDataFields.FIELD_TXT_R,
-                SystemDataFields.FIELD_RAM_D,
-                SystemDataFields.FIELD_SWP_D,
-                SystemDataFields.FIELD_PER_I
-            ) and value != b'':
-                value = str(decompress(value).decode())
-
-            elif key == SystemDataFields.FIELD_AUT_B:
-                if value != b'':
-                    value = decompress(value).decode()
-                    if value in ("True", "true"):
-                        value = True
-                    elif value in ("False", "false"):
-                        value = False
-                else:
-                    value = False
-
-        return value
-
     def __check_simple_fields(self, key: str, value):
         return (self.__is_valid_int_value(key, value) or
                 self.__is_valid_string_value(key, value) or
@@ -0,0 +1,306 @@
+"""
+This module contains functions that provide common support for building the System Data contract
+tuples from columnar data, instead of one SystemDataRecord for each value.
+"""
+
+from bcubed.constants.ranges.int_ranges import IntRanges
+from bcubed.constants.ranges.uint_ranges import UintRanges
+from bcubed.constants.records.fields.common_data_fields import CommonDataFields
+from bcubed.constants.records.fields.generic_system_data_fields import GenericSystemDataFields
+from bcubed.constants.records.fields.id_value_fields import IdValueFields
+from bcubed.constants.records.fields.system_data_fields import SystemDataFields
+from bcubed.records.compact_system_data_record import (
+    DEFAULT_VALUES,
+    FIELD_INDEXES,
+    ID_VALUE_FIELD_TYPES
+)
+from bcubed.records.fields.id_uint16_value_int24_field import IdUint16ValueInt24Field
+from bcubed.records.fields.id_uint8_value_array_uint16_field import IdUint8ValueArrayUint16Field
+from bcubed.records.fields.id_uint8_value_float_field import IdUint8ValueFloatField
+from bcubed.records.fields.id_uint8_value_int16_field import IdUint8ValueInt16Field
+from bcubed.records.fields.id_uint8_value_string_field import IdUint8ValueStringField
+from bcubed.records.fields.id_uint8_value_uint16_field import IdUint8ValueUint16Field
+from bcubed.records.fields.id_uint8_value_uint8_field import IdUint8ValueUint8Field
+from bcubed.utilities.compression_help import compress_value
+from bcubed.utilities.datetime_help import get_current_timestamp
+
+from bcubed.constants.records.fields.system_data_fields import (
+    VAL_F_FIELDS,
+    TWO_V_FIELDS,
+    FOU_V_FIELDS
+)
+
+# NumPy is optional. Without it, the columns are lists and they are validated in pure Python.
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+UINT8_RANGE = (UintRanges.UINT8_MIN, UintRanges.UINT8_MAX)
+UINT16_RANGE = (UintRanges.UINT16_MIN, UintRanges.UINT16_MAX)
+UINT64_RANGE = (UintRanges.UINT64_MIN, UintRanges.UINT64_MAX)
+INT16_RANGE = (IntRanges.INT16_MIN, IntRanges.INT16_MAX)
+INT24_RANGE = (IntRanges.INT24_MIN, IntRanges.INT24_MAX)
+
+# The id range and the value range, or type, of each id-value field type
+ID_VALUE_FIELD_RANGES = {
+    IdUint8ValueUint16Field: (UINT8_RANGE, UINT16_RANGE),
+    IdUint8ValueArrayUint16Field: (UINT8_RANGE, UINT16_RANGE),
+    IdUint8ValueUint8Field: (UINT8_RANGE, UINT8_RANGE),
+    IdUint8ValueInt16Field: (UINT8_RANGE, INT16_RANGE),
+    IdUint16ValueInt24Field: (UINT16_RANGE, INT24_RANGE),
+    IdUint8ValueFloatField: (UINT8_RANGE, float),
+    IdUint8ValueStringField: (UINT8_RANGE, str)
+}
+
+FOU_VALUE_KEYS = (IdValueFields.FIELD_VALUE_1, IdValueFields.FIELD_VALUE_2,
+                  IdValueFields.FIELD_VALUE_3)
+
+# The values of a field without id that are not stored, as in a SystemDataRecord
+DEFAULT_VAL_F_VALUES = ('', '0', 'False')
+
+# The range of the integer fields without id, other than sysT. The battery level is a percentage.
+VAL_F_FIELD_RANGES = {
+    SystemDataFields.FIELD_BAT_L: UINT8_RANGE
+}
+
+
+def __get_invalid_column_error(field: str, key: str = None):
+    if key is None:
+        return ValueError(f"Columns. {field} values are not valid")
+
+    return ValueError(f"Columns. {field} {key} values are not valid")
+
+
+def __get_invalid_value_error(values, row: int, field: str, key: str = None):
+    if key is None:
+        return ValueError(f"Columns. {field} value of row {row} is not valid: {values[row]}")
+
+    return ValueError(f"Columns. {field} {key} value of row {row} is not valid: {values[row]}")
+
+
+def __check_values(values: list, is_valid, field: str, key: str = None):
+    """
+    Raises a ValueError with the row of the first value for which is_valid returns False, if any.
+    """
+
+    for row, value in enumerate(values):
+        if not is_valid(value):
+            raise __get_invalid_value_error(values, row, field, key)
+
+
+def __is_numpy_array(column):
+    return numpy is not None and isinstance(column, numpy.ndarray)
+
+
+def __get_int_column(column, value_range: tuple, field: str, key: str = None):
+    """
+    Returns the column as a list, if all its values are integers in value_range, if any. The range
+    of a NumPy array is validated with its minimum and maximum values, and its rows are only
+    checked one by one to find the first value out of range.
+    """
+
+    if __is_numpy_array(column):
+        if column.dtype.kind not in 'iu':
+            raise __get_invalid_column_error(field, key)
+
+        values = column.tolist()
+        if value_range is not None and len(column) > 0 and (
+                int(column.min()) < value_range[0] or int(column.max()) > value_range[1]):
+            __check_values(values, lambda value: value_range[0] <= value <= value_range[1],
+                           field, key)
+
+        return values
+
+    values = list(column)
+    __check_values(values, lambda value: isinstance(value, int) and not isinstance(value, bool),
+                   field, key)
+
+    if value_range is not None and len(values) > 0 and (
+            min(values) < value_range[0] or max(values) > value_range[1]):
+        __check_values(values, lambda value: value_range[0] <= value <= value_range[1],
+                       field, key)
+
+    return values
+
+
+def __get_float_column(column, field: str, key: str = None):
+    if __is_numpy_array(column):
+        if column.dtype.kind not in 'iuf':
+            raise __get_invalid_column_error(field, key)
+
+        return column.astype(float).tolist()
+
+    values = list(column)
+    __check_values(
+        values, lambda value: isinstance(value, (int, float)) and not isinstance(value, bool),
+        field, key)
+
+    return [float(value) for value in values]
+
+
+def __get_typed_column(column, value_type: type, field: str, key: str = None):
+    if __is_numpy_array(column):
+        column = column.tolist()
+
+    values = list(column)
+    __check_values(values, lambda value: isinstance(value, value_type), field, key)
+
+    return values
+
+
+def __get_value_column(column, value_range, field: str, key: str = None):
+    if value_range is float:
+        return __get_float_column(column, field, key)
+
+    if value_range is str:
+        return __get_typed_column(column, str, field, key)
+
+    if value_range is bool:
+        return __get_typed_column(column, bool, field, key)
+
+    if value_range is int:
+        return __get_int_column(column, None, field, key)
+
+    return __get_int_column(column, value_range, field, key)
+
+
+def __get_id_column(column, id_range: tuple, rows_number: int, field: str):
+    """
+    Returns the id column of an id-value field. The id can be one value for all the rows. The id 0
+    is not valid, since the field would not be stored.
+    """
+
+    if numpy is not None and isinstance(column, numpy.integer):
+        column = int(column)
+
+    if isinstance(column, int):
+        ids = __get_int_column([column], id_range, field, IdValueFields.FIELD_ID) * rows_number
+
+    elif column is None:
+        raise __get_invalid_column_error(field, IdValueFields.FIELD_ID)
+
+    else:
+        ids = __get_int_column(column, id_range, field, IdValueFields.FIELD_ID)
+        __check_rows_number(ids, rows_number, field)
+
+    if 0 in ids:
+        raise __get_invalid_column_error(field, IdValueFields.FIELD_ID)
+
+    return ids
+
+
+def __get_scalar_value_range(field: str):
+    default_value = DEFAULT_VALUES[FIELD_INDEXES[field]]
+
+    if isinstance(default_value, bool):
+        return bool
+
+    if isinstance(default_value, str):
+        return str
+
+    return VAL_F_FIELD_RANGES.get(field, int)
+
+
+def __get_field_values(field: str, column, rows_number: int):
+    """
+    Returns, for each row, the valF, idTwo, valueTwo, idFou and valueFou values of the field, or
+    None if the value is the default one, so the row does not have the field.
+    """
+
+    if field in VAL_F_FIELDS:
+        values = __get_value_column(column, __get_scalar_value_range(field), field)
+
+        return [None if str(value) in DEFAULT_VAL_F_VALUES else
+                (compress_value(str(value), field), 0, b'', 0, b'', b'', b'') for value in values]
+
+    if field not in ID_VALUE_FIELD_TYPES or not isinstance(column, dict):
+        raise __get_invalid_column_error(field)
+
+    id_range, value_range = ID_VALUE_FIELD_RANGES[ID_VALUE_FIELD_TYPES[field]]
+    ids = __get_id_column(column.get(IdValueFields.FIELD_ID), id_range, rows_number, field)
+
+    if field in TWO_V_FIELDS:
+        values = __get_value_column(
+            column.get(IdValueFields.FIELD_VALUE, ()), value_range, field, IdValueFields.FIELD_VALUE)
+        __check_rows_number(values, rows_number, field)
+
+        return [(b'', field_id, compress_value(str(value), field), 0, b'', b'', b'')
+                for field_id, value in zip(ids, values)]
+
+    if field in FOU_V_FIELDS:
+        values = [__get_value_column(column.get(key, ()), value_range, field, key)
+                  for key in FOU_VALUE_KEYS]
+        for key_values in values:
+            __check_rows_number(key_values, rows_number, field)
+
+        return [(b'', 0, b'', field_id,
+                 compress_value(str(value_1), field),
+                 compress_value(str(value_2), field),
+                 compress_value(str(value_3), field))
+                for field_id, value_1, value_2, value_3 in zip(ids, *values)]
+
+    raise __get_invalid_column_error(field)
+
+
+def __check_rows_number(values: list, rows_number: int, field: str):
+    if len(values) != rows_number:
+        raise ValueError(f"Columns. {field} has {len(values)} values instead of {rows_number}")
+
+
+def from_columns_to_contract_tuples(columns: dict, rec_t: int = None):
+    """
+    Returns the System Data contract tuples of columnar data, ready to be stored. The columns are
+    keyed by the SystemDataFields names and contain a sysT column. The column of a field without id
+    is a list, or a NumPy array, of values, and the column of an id-value field is a dictionary
+    with an id, as a column or as one value for all the rows, and a column for each value key.
+    One contract tuple is returned for each row and field, in row order, as they would be
+    returned for one SystemDataRecord for each value, so the default values of the fields without
+    id are skipped, and the id 0 of an id-value field is not valid.
+    All the columns are validated before any contract tuple is built. The ranges of the NumPy
+    arrays are validated vectorized. A ValueError raises if a column is not valid, with the row
+    and field of the first value that is not valid, if the column has the expected type.
+    """
+
+    if SystemDataFields.FIELD_SYS_T not in columns:
+        raise __get_invalid_column_error(SystemDataFields.FIELD_SYS_T)
+
+    if rec_t is None:
+        rec_t = get_current_timestamp()
+
+    sys_t_values = __get_int_column(
+        columns[SystemDataFields.FIELD_SYS_T], UINT64_RANGE, SystemDataFields.FIELD_SYS_T)
+    rows_number = len(sys_t_values)
+
+    fields_values = []
+    for field, column in columns.items():
+        if field == SystemDataFields.FIELD_SYS_T:
+            continue
+
+        values = __get_field_values(field, column, rows_number)
+        __check_rows_number(values, rows_number, field)
+
+        fields_values.append((field, values))
+
+    contract_tuples = []
+    for row, sys_t in enumerate(sys_t_values):
+        for field, values in fields_values:
+            if values[row] is None:
+                continue
+
+            val_f, id_two, value_two, id_fou, value_1_fou, value_2_fou, value_3_fou = values[row]
+
+            contract_tuples.append({
+                CommonDataFields.FIELD_REC_T: rec_t,
+                SystemDataFields.FIELD_SYS_T: sys_t,
+                GenericSystemDataFields.FIELD_NAM_F: field,
+                GenericSystemDataFields.FIELD_VAL_F: val_f,
+                GenericSystemDataFields.FIELD_ID_TWO: id_two,
+                GenericSystemDataFields.FIELD_VALUE_TWO: value_two,
+                GenericSystemDataFields.FIELD_ID_FOU: id_fou,
+                GenericSystemDataFields.FIELD_VALUE_1_FOU: value_1_fou,
+                GenericSystemDataFields.FIELD_VALUE_2_FOU: value_2_fou,
+                GenericSystemDataFields.FIELD_VALUE_3_FOU: value_3_fou
+            })
+
+    return contract_tuples
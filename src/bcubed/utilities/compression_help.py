@@ -0,0 +1,239 @@
+"""
+This module contains functions that provide common support for encoding the System Data values.
+"""
+
+import contextvars
+import struct
+import zlib
+
+from collections import Counter
+from contextlib import contextmanager
+
+# The first byte of each value is the encoding header. The values stored before the header was
+# introduced are bare zlib streams, which start with 0x78.
+ENCODING_RAW = 0x00
+ENCODING_DEFLATE = 0x01
+# The dictionary header is followed by the dictionary identifier, in DICTIONARY_ID_SIZE bytes.
+ENCODING_DICTIONARY_DEFLATE = 0x02
+DICTIONARY_ID_SIZE = 2
+# The packed samples of a sensor, see sample_packing_help. They are not decoded by decompress_value.
+ENCODING_PACKED = 0x03
+# A chunk of an encoded value that is too big for one record. The chunk header is followed by the
+# group identifier of the value, the index of the chunk and the total of chunks.
+ENCODING_CHUNK = 0x04
+CHUNK_HEADER = struct.Struct('>BQHH')
+# The values of several fields of one record, see multi_field_help. They are not decoded by
+# decompress_value.
+ENCODING_FIELDS = 0x05
+# The first byte of the legacy zlib values
+LEGACY_ZLIB_HEADER = 0x78
+
+DEFLATE_LEVEL = 9
+DEFLATE_WBITS = -15
+# The deflate window is 32 KiB, so a longer dictionary is never used entirely.
+MAX_DICTIONARY_SIZE = 32768
+
+# Compression dictionaries by identifier and the identifier of the last dictionary of each field,
+# for each contract address. The identifiers are only unique in a contract, so the dictionaries
+# used are the ones of the contract address selected by compression_dictionary_scope.
+__dictionaries = {}
+__field_dictionary_ids = {}
+__contract_address = contextvars.ContextVar('compression_contract_address', default=None)
+
+
+@contextmanager
+def compression_dictionary_scope(contract_address: str):
+    """
+    Selects the compression dictionaries of the contract address until the context is left. Out of
+    any scope, the dictionaries registered without a contract address are used.
+    """
+
+    token = __contract_address.set(contract_address)
+
+    try:
+        yield
+
+    finally:
+        __contract_address.reset(token)
+
+
+def __get_dictionaries():
+    return __dictionaries.setdefault(__contract_address.get(), {})
+
+
+def __get_field_dictionary_ids():
+    return __field_dictionary_ids.setdefault(__contract_address.get(), {})
+
+
+def __deflate(data: bytes, dictionary: bytes = None):
+    if dictionary is None:
+        compressor = zlib.compressobj(DEFLATE_LEVEL, zlib.DEFLATED, DEFLATE_WBITS)
+    else:
+        compressor = zlib.compressobj(
+            DEFLATE_LEVEL, zlib.DEFLATED, DEFLATE_WBITS, zdict=dictionary)
+
+    return compressor.compress(data) + compressor.flush()
+
+
+def __get_dictionary(dictionary_id: int):
+    dictionaries = __get_dictionaries()
+    if dictionary_id not in dictionaries:
+        raise ValueError(f"Compression dictionary {dictionary_id} is not registered")
+
+    return dictionaries[dictionary_id]
+
+
+def register_compression_dictionary(dictionary_id: int, field: str, dictionary: bytes):
+    """
+    Registers the compression dictionary of the field in the current scope, so the next values of
+    the field are compressed with it and the values compressed with it can be decompressed.
+    """
+
+    __get_dictionaries()[dictionary_id] = dictionary
+    __get_field_dictionary_ids()[field] = dictionary_id
+
+
+def get_compression_dictionary_ids():
+    """
+    Returns the identifiers of the compression dictionaries registered in the current scope.
+    """
+
+    return set(__get_dictionaries())
+
+
+def clear_compression_dictionaries():
+    """
+    Removes the compression dictionaries registered in the current scope.
+    """
+
+    __get_dictionaries().clear()
+    __get_field_dictionary_ids().clear()
+
+
+def train_compression_dictionary(samples: list, dictionary_size: int):
+    """
+    Returns a compression dictionary of up to dictionary_size bytes built from the sample values.
+    The distinct samples are sorted from the least to the most frequent, because deflate finds
+    the closest matches, at the end of the dictionary, with the cheapest distances.
+    """
+
+    frequencies = Counter(samples)
+    dictionary = b''.join(
+        sample.encode() for sample, _ in sorted(frequencies.items(), key=lambda item: item[1]))
+
+    return dictionary[-min(dictionary_size, MAX_DICTIONARY_SIZE):]
+
+
+def compress_value(value: str, field: str = None):
+    """
+    Returns the value encoded with the smallest encoding, raw, deflate or, if the field has a
+    registered compression dictionary in the current scope, deflate with the dictionary, preceded
+    by the encoding header.
+    """
+
+    data = value.encode()
+    encoded_value = bytes((ENCODING_RAW,)) + data
+
+    deflated_value = bytes((ENCODING_DEFLATE,)) + __deflate(data)
+    if len(deflated_value) < len(encoded_value):
+        encoded_value = deflated_value
+
+    dictionary_id = __get_field_dictionary_ids().get(field)
+    if dictionary_id is not None:
+        dictionary_value = (bytes((ENCODING_DICTIONARY_DEFLATE,)) +
+                            dictionary_id.to_bytes(DICTIONARY_ID_SIZE, 'big') +
+                            __deflate(data, __get_dictionary(dictionary_id)))
+
+        if len(dictionary_value) < len(encoded_value):
+            encoded_value = dictionary_value
+
+    return encoded_value
+
+
+def __get_dictionary_data_and_decompressor(value: bytes):
+    dictionary_id = int.from_bytes(value[1:(DICTIONARY_ID_SIZE + 1)], 'big')
+    decompressor = zlib.decompressobj(DEFLATE_WBITS, zdict=__get_dictionary(dictionary_id))
+
+    return value[(DICTIONARY_ID_SIZE + 1):], decompressor
+
+
+def decompress_value(value: bytes):
+    """
+    Returns the string of a value encoded by compress_value or a legacy zlib value. A ValueError
+    is raised if the value is compressed with a dictionary that is not registered in the current
+    scope.
+    """
+
+    if value == b'':
+        return ""
+
+    if value[0] == ENCODING_RAW:
+        return value[1:].decode()
+
+    if value[0] == ENCODING_DEFLATE:
+        return zlib.decompress(value[1:], DEFLATE_WBITS).decode()
+
+    if value[0] == ENCODING_DICTIONARY_DEFLATE:
+        data, decompressor = __get_dictionary_data_and_decompressor(value)
+
+        return (decompressor.decompress(data) + decompressor.flush()).decode()
+
+    return zlib.decompress(value).decode()
+
+
+def decompress_value_prefix(value: bytes, length: int):
+    """
+    Returns up to the first length bytes of a value encoded by compress_value or a legacy zlib
+    value, without decoding the rest of it.
+    """
+
+    if value == b'':
+        return b''
+
+    if value[0] == ENCODING_RAW:
+        return value[1:(length + 1)]
+
+    if value[0] == ENCODING_DEFLATE:
+        data, decompressor = value[1:], zlib.decompressobj(DEFLATE_WBITS)
+    elif value[0] == ENCODING_DICTIONARY_DEFLATE:
+        data, decompressor = __get_dictionary_data_and_decompressor(value)
+    else:
+        data, decompressor = value, zlib.decompressobj()
+
+    return decompressor.decompress(data, length)
+
+
+def is_legacy_value(value: bytes):
+    """
+    Returns True if the value is a legacy zlib value, stored before the encoding header.
+    """
+
+    return len(value) > 0 and value[0] == LEGACY_ZLIB_HEADER
+
+
+def get_chunk_value(group_id: int, index: int, total: int, data: memoryview):
+    """
+    Returns the chunk index of the total chunks of an encoded value, preceded by the chunk header.
+    The data is a slice of the encoded value, so the chunks are not decoded and encoded again.
+    """
+
+    return CHUNK_HEADER.pack(ENCODING_CHUNK, group_id, index, total) + bytes(data)
+
+
+def is_chunk_value(value: bytes):
+    """
+    Returns True if the value is a chunk of an encoded value.
+    """
+
+    return len(value) >= CHUNK_HEADER.size and value[0] == ENCODING_CHUNK
+
+
+def parse_chunk_value(value: bytes):
+    """
+    Returns a tuple with the group identifier, the index and the total of chunks of a chunk value,
+    and its slice of the encoded value.
+    """
+
+    _, group_id, index, total = CHUNK_HEADER.unpack_from(value)
+
+    return group_id, index, total, value[CHUNK_HEADER.size:]
@@ -0,0 +1,180 @@
+"""
+This module contains functions that provide common support for ABI encoding the System Data
+contract tuples, as the contract receives them.
+"""
+
+import math
+
+from eth_abi import decode, encode
+
+from bcubed.constants.records.fields.common_data_fields import CommonDataFields
+from bcubed.constants.records.fields.generic_system_data_fields import GenericSystemDataFields
+from bcubed.constants.records.fields.id_value_fields import IdValueFields
+from bcubed.constants.records.fields.system_data_fields import SystemDataFields
+from bcubed.utilities.compression_help import compress_value
+from bcubed.utilities.multi_field_help import MULTI_FIELD_NAM_F, get_multi_field_value
+
+from bcubed.constants.records.fields.system_data_fields import (
+    VAL_F_FIELDS,
+    TWO_V_FIELDS,
+    FOU_V_FIELDS
+)
+
+SYSTEM_DATA_RECORD_ABI_TYPE = '(uint64,uint64,string,bytes,int16,bytes,int16,bytes,bytes,bytes)'
+
+ABI_WORD_SIZE = 32
+# The offset of the tuple and the head of each one of its ten fields
+SYSTEM_DATA_RECORD_HEAD_SIZE = ABI_WORD_SIZE * 11
+
+SYSTEM_DATA_CONTRACT_TUPLE_FIELDS = [
+    CommonDataFields.FIELD_REC_T,
+    SystemDataFields.FIELD_SYS_T,
+    GenericSystemDataFields.FIELD_NAM_F,
+    GenericSystemDataFields.FIELD_VAL_F,
+    GenericSystemDataFields.FIELD_ID_TWO,
+    GenericSystemDataFields.FIELD_VALUE_TWO,
+    GenericSystemDataFields.FIELD_ID_FOU,
+    GenericSystemDataFields.FIELD_VALUE_1_FOU,
+    GenericSystemDataFields.FIELD_VALUE_2_FOU,
+    GenericSystemDataFields.FIELD_VALUE_3_FOU
+]
+
+# The values of a System Data contract tuple without any field, from namF on
+DEFAULT_CONTRACT_TUPLE_VALUES = ("", b'', 0, b'', 0, b'', b'', b'')
+
+
+def get_encoded_words(value: bytes):
+    """
+    Returns the number of ABI words that the data of a string or bytes value takes.
+    """
+
+    return math.ceil(len(value) / ABI_WORD_SIZE)
+
+
+def get_encoded_size(contract_tuple: dict):
+    """
+    Returns the size of the ABI encoding of the System Data contract tuple, without encoding it.
+    Each string or bytes value is encoded as its length word followed by its data, padded to
+    words.
+    """
+
+    size = SYSTEM_DATA_RECORD_HEAD_SIZE
+
+    for value in contract_tuple.values():
+        if isinstance(value, str):
+            value = value.encode()
+
+        if isinstance(value, bytes):
+            size += ABI_WORD_SIZE * (1 + get_encoded_words(value))
+
+    return size
+
+
+def encode_system_data_contract_tuple(contract_tuple: dict):
+    """
+    Returns the ABI encoding of the System Data contract tuple.
+    """
+
+    return encode([SYSTEM_DATA_RECORD_ABI_TYPE], [tuple(contract_tuple.values())])
+
+
+def decode_system_data_contract_tuple(data: bytes):
+    """
+    Returns the System Data contract tuple, with the values in the contract order, encoded by
+    encode_system_data_contract_tuple.
+    """
+
+    return decode([SYSTEM_DATA_RECORD_ABI_TYPE], data)[0]
+
+
+def __is_not_default_val_f_value(value, fie_n: int):
+    value = str(value)
+
+    return value not in ('', '0', 'False') or (value == "False" and fie_n == 5)
+
+
+def __encode_val_f_value(values: list, field: str, value):
+    values[2] = field
+    values[3] = compress_value(str(value), field)
+
+
+def __encode_two_v_value(values: list, field: str, value):
+    values[2] = field
+    values[4] = value[IdValueFields.FIELD_ID]
+    values[5] = compress_value(str(value[IdValueFields.FIELD_VALUE]), field)
+
+
+def __encode_fou_v_value(values: list, field: str, value):
+    values[2] = field
+    values[6] = value[IdValueFields.FIELD_ID]
+    values[7] = compress_value(str(value[IdValueFields.FIELD_VALUE_1]), field)
+    values[8] = compress_value(str(value[IdValueFields.FIELD_VALUE_2]), field)
+    values[9] = compress_value(str(value[IdValueFields.FIELD_VALUE_3]), field)
+
+
+# The encoder of each System Data field, which sets its values in the contract tuple values
+FIELD_ENCODERS = dict(
+    [(field, __encode_val_f_value) for field in VAL_F_FIELDS] +
+    [(field, __encode_two_v_value) for field in TWO_V_FIELDS] +
+    [(field, __encode_fou_v_value) for field in FOU_V_FIELDS])
+
+
+def __get_not_default_fields(system_data_record):
+    fie_n = system_data_record[CommonDataFields.FIELD_FIE_N]
+
+    fields = []
+    for field, value in system_data_record.items():
+        if field not in FIELD_ENCODERS:
+            continue
+
+        if isinstance(value, dict):
+            if value[IdValueFields.FIELD_ID] != 0:
+                fields.append((field, value))
+
+        elif __is_not_default_val_f_value(value, fie_n):
+            fields.append((field, value))
+
+    return fields
+
+
+def from_system_data_record_to_contract_tuple(system_data_record, multi_field: bool = False):
+    """
+    Returns the System Data contract tuple of the SystemDataRecord, with the same values as the
+    contract tuple of its GenericSystemDataRecord, without building it. The field that is not the
+    default one is encoded, and the values are compressed, in one pass over the record.
+    If multi_field is True and the record has several fields that are not the default ones, all
+    of them are stored in the multi-field valF instead of only the last one.
+    """
+
+    values = [system_data_record[CommonDataFields.FIELD_REC_T],
+              system_data_record[SystemDataFields.FIELD_SYS_T],
+              *DEFAULT_CONTRACT_TUPLE_VALUES]
+
+    fields = __get_not_default_fields(system_data_record)
+
+    if multi_field is True and len(fields) > 1:
+        values[2] = MULTI_FIELD_NAM_F
+        values[3] = get_multi_field_value(fields)
+
+    else:
+        for field, value in fields:
+            FIELD_ENCODERS[field](values, field, value)
+
+    return dict(zip(SYSTEM_DATA_CONTRACT_TUPLE_FIELDS, values))
+
+
+def from_field_to_contract_tuple(rec_t: int, sys_t: int, field: str, value):
+    """
+    Returns the System Data contract tuple of the field value. The value of an id-value field is
+    a dictionary with its id and values. A ValueError raises if the field is not a System Data
+    field.
+    """
+
+    encoder = FIELD_ENCODERS.get(field)
+    if encoder is None:
+        raise ValueError(f"Contract tuple. {field} is not a System Data field")
+
+    values = [rec_t, sys_t, *DEFAULT_CONTRACT_TUPLE_VALUES]
+    encoder(values, field, value)
+
+    return dict(zip(SYSTEM_DATA_CONTRACT_TUPLE_FIELDS, values))
@@ -0,0 +1,127 @@
+"""
+This module contains functions that provide common support for the Merkle trees of the anchored
+System Data records.
+
+The leaves and the inner nodes are hashed with keccak256 and different prefixes, so a leaf cannot
+be taken for an inner node. When a level has an odd number of nodes, the last one is promoted to
+the next level.
+"""
+
+from web3 import Web3
+
+LEAF_PREFIX = b'\x00'
+NODE_PREFIX = b'\x01'
+
+# Keys of the inclusion proof of an anchored record
+PROOF_RECORD = 'record'
+PROOF_INDEX = 'index'
+PROOF_LEAVES_NUMBER = 'leavesNumber'
+PROOF_HASHES = 'hashes'
+PROOF_ROOT = 'root'
+
+
+def get_leaf_hash(data: bytes):
+    """
+    Returns the Merkle leaf hash of the encoded record.
+    """
+
+    return bytes(Web3.keccak(LEAF_PREFIX + data))
+
+
+def __get_node_hash(left: bytes, right: bytes):
+    return bytes(Web3.keccak(NODE_PREFIX + left + right))
+
+
+def __get_next_level(level: list):
+    next_level = [__get_node_hash(level[index], level[index + 1])
+                  for index in range(0, len(level) - 1, 2)]
+
+    if len(level) % 2 == 1:
+        next_level.append(level[-1])
+
+    return next_level
+
+
+def get_merkle_tree(leaves: list):
+    """
+    Returns the levels of the Merkle tree of the leaf hashes, from the leaves to the root.
+    """
+
+    if len(leaves) == 0:
+        raise ValueError("The Merkle tree of no leaves is not defined")
+
+    levels = [list(leaves)]
+    while len(levels[-1]) > 1:
+        levels.append(__get_next_level(levels[-1]))
+
+    return levels
+
+
+def get_merkle_root(leaves: list):
+    """
+    Returns the Merkle root of the leaf hashes.
+    """
+
+    return get_merkle_tree(leaves)[-1][0]
+
+
+def get_merkle_proof(levels: list, index: int):
+    """
+    Returns the inclusion proof of the leaf in the index position of the Merkle tree levels: the
+    list of sibling hashes from the leaf to the root.
+    """
+
+    proof = []
+
+    for level in levels[:-1]:
+        sibling_index = index ^ 1
+        if sibling_index < len(level):
+            proof.append(level[sibling_index])
+
+        index //= 2
+
+    return proof
+
+
+def verify_merkle_proof(leaf: bytes, index: int, leaves_number: int, proof: list, root: bytes):
+    """
+    Returns True if the proof shows that the leaf is in the index position of a Merkle tree of
+    leaves_number leaves whose root is root.
+    """
+
+    node = leaf
+    proof_index = 0
+    level_length = leaves_number
+
+    while level_length > 1:
+        sibling_index = index ^ 1
+
+        if sibling_index < level_length:
+            if proof_index >= len(proof):
+                return False
+
+            if index % 2 == 0:
+                node = __get_node_hash(node, proof[proof_index])
+            else:
+                node = __get_node_hash(proof[proof_index], node)
+
+            proof_index += 1
+
+        index //= 2
+        level_length = (level_length + 1) // 2
+
+    return proof_index == len(proof) and node == root
+
+
+def verify_inclusion_proof(inclusion_proof: dict):
+    """
+    Returns True if the inclusion proof shows that its encoded record is in the batch whose
+    Merkle root is its root.
+    """
+
+    return verify_merkle_proof(
+        get_leaf_hash(inclusion_proof[PROOF_RECORD]),
+        inclusion_proof[PROOF_INDEX],
+        inclusion_proof[PROOF_LEAVES_NUMBER],
+        inclusion_proof[PROOF_HASHES],
+        inclusion_proof[PROOF_ROOT])
@@ -0,0 +1,88 @@
+"""
+This module contains functions that provide common support for storing several System Data fields
+of the same record in one contract tuple.
+
+The multi-field contract tuple has the MULTI_FIELD_NAM_F namF and its valF starts with the
+ENCODING_FIELDS header, followed by a value encoded by compress_value: the JSON list of the fields,
+each one a list with its name, its id, which is 0 if it is not an id-value field, and the string of
+each one of its values. The fields are compressed together, so the values that they share are only
+stored once.
+"""
+
+import json
+
+from bcubed.constants.records.fields.system_data_fields import FOU_V_FIELDS, TWO_V_FIELDS
+from bcubed.constants.records.fields.id_value_fields import IdValueFields
+from bcubed.utilities.compression_help import (
+    ENCODING_FIELDS,
+    ENCODING_RAW,
+    compress_value,
+    decompress_value
+)
+
+MULTI_FIELD_NAM_F = 'mulF'
+
+# The value keys of the id-value fields, in the contract tuple order
+TWO_V_VALUE_KEYS = (IdValueFields.FIELD_VALUE,)
+FOU_V_VALUE_KEYS = (IdValueFields.FIELD_VALUE_1, IdValueFields.FIELD_VALUE_2,
+                    IdValueFields.FIELD_VALUE_3)
+
+
+def __get_value_keys(field: str):
+    if field in TWO_V_FIELDS:
+        return TWO_V_VALUE_KEYS
+
+    if field in FOU_V_FIELDS:
+        return FOU_V_VALUE_KEYS
+
+    return None
+
+
+def get_multi_field_value(fields: list):
+    """
+    Returns the multi-field value of the fields, a list of (field, value) tuples. The value of an
+    id-value field is a dictionary with its id and values.
+    """
+
+    encoded_fields = []
+    for field, value in fields:
+        value_keys = __get_value_keys(field)
+
+        if value_keys is None:
+            encoded_fields.append([field, 0, str(value)])
+        else:
+            encoded_fields.append([field, value[IdValueFields.FIELD_ID]] +
+                                  [str(value[value_key]) for value_key in value_keys])
+
+    return bytes((ENCODING_FIELDS,)) + compress_value(
+        json.dumps(encoded_fields, separators=(',', ':')), MULTI_FIELD_NAM_F)
+
+
+def is_multi_field_value(value):
+    """
+    Returns True if the contract value is a multi-field value.
+    """
+
+    return isinstance(value, bytes) and value[:1] == bytes((ENCODING_FIELDS,))
+
+
+def from_multi_field_value_to_contract_tuples(rec_t: int, sys_t: int, value: bytes):
+    """
+    Returns a contract tuple for each field of the multi-field value, as if each field was stored
+    on its own. The values are raw encoded, so they are decoded as the contract ones.
+    """
+
+    contract_tuples = []
+    for encoded_field in json.loads(decompress_value(value[1:])):
+        field, field_id = encoded_field[:2]
+        values = [bytes((ENCODING_RAW,)) + field_value.encode()
+                  for field_value in encoded_field[2:]]
+
+        if field in TWO_V_FIELDS:
+            contract_tuples.append((rec_t, sys_t, field, b'', field_id, *values, 0, b'', b'', b''))
+        elif field in FOU_V_FIELDS:
+            contract_tuples.append((rec_t, sys_t, field, b'', 0, b'', field_id, *values))
+        else:
+            contract_tuples.append((rec_t, sys_t, field, *values, 0, b'', 0, b'', b'', b''))
+
+    return contract_tuples
@@ -2,6 +2,11 @@
 This module contains functions that provide common support for parsing contract tuples.
 """
 
+import logging
+import re
+
+from concurrent.futures import ThreadPoolExecutor
+
 from bcubed.constants.records.fields.common_data_fields import CommonDataFields
 from bcubed.constants.records.fields.generic_system_data_fields import GenericSystemDataFields
 from bcubed.constants.records.fields.id_value_fields import IdValueFields
@@ -10,6 +15,8 @@ from bcubed.constants.records.fields.overview_data_fields import OverviewDataFie
 from bcubed.constants.records.fields.system_data_fields import SystemDataFields
 
 from bcubed.records.base_data_record import BaseDataRecord
+from bcubed.records.compact_system_data_record import CompactSystemDataRecord
+from bcubed.records.generic_system_data_record import GenericSystemDataRecord
 from bcubed.records.meta_data_record import MetaDataRecord
 from bcubed.records.system_data_record import SystemDataRecord
 from bcubed.records.overview_data_record import OverviewDataRecord
@@ -20,6 +27,26 @@ from bcubed.constants.records.fields.system_data_fields import (
     FOU_V_FIELDS
 )
 
+from bcubed.utilities.compression_help import (
+    ENCODING_CHUNK,
+    decompress_value,
+    decompress_value_prefix,
+    is_chunk_value,
+    is_legacy_value,
+    parse_chunk_value
+)
+from bcubed.utilities.encoding_help import SYSTEM_DATA_CONTRACT_TUPLE_FIELDS
+from bcubed.utilities.multi_field_help import (
+    MULTI_FIELD_NAM_F,
+    from_multi_field_value_to_contract_tuples,
+    is_multi_field_value
+)
+from bcubed.utilities.sample_packing_help import (
+    PACKABLE_FIELDS,
+    is_packed_value,
+    unpack_samples
+)
+
 KEY_WITH_FIXED_FIELD = [
     CommonDataFields.FIELD_TYP_R,
     CommonDataFields.FIELD_FIE_N,
@@ -40,39 +67,56 @@ NO_NAME_F_FIELD_NAMES = [
     SystemDataFields.FIELD_SYS_T
 ]
 
+# The positions of the valF, valueTwo and valueFou values in a System Data contract tuple
+VALUE_POSITIONS = (3, 5, 7, 8, 9)
+
+# The values of the records split before the chunk header start with "<index>;"
+LEGACY_CHUNK_PREFIX = re.compile(rb'(\d+);')
+LEGACY_CHUNK_PREFIX_SIZE = 12
+
+REASSEMBLY_PARALLEL_GROUPS = 8
+
+__logger = logging.getLogger(__name__)
+
 
 def __from_contract_tuple_to_record(data_record, contract_tuple: tuple):
     """
-    Stores the contract_tuple values in the data_record fields.
+    Stores the contract_tuple values in the data_record fields. The values are set at once, so the
+    fieN value is updated once.
     """
+    fields = {}
+
     i = 0
     for value in data_record:
         if value not in [CommonDataFields.FIELD_TYP_R,
                          CommonDataFields.FIELD_FIE_N]:
 
             if value not in VAL_F_FIELDS + TWO_V_FIELDS + FOU_V_FIELDS:
-                data_record[value] = contract_tuple[i]
+                fields[value] = contract_tuple[i]
 
             elif value != MetaDataFields.FIELD_RES_P:
                 nam_f = contract_tuple[2]
 
                 if value == nam_f:
                     if nam_f in VAL_F_FIELDS:
-                        data_record[nam_f] = contract_tuple[3]
+                        fields[nam_f] = contract_tuple[3]
                     elif nam_f in TWO_V_FIELDS:
                         data_record[nam_f][IdValueFields.FIELD_ID] = contract_tuple[4]
                         data_record[nam_f][IdValueFields.FIELD_VALUE] = contract_tuple[5]
 
+                        fields[nam_f] = data_record[nam_f]
+
                     elif nam_f in FOU_V_FIELDS:
                         data_record[nam_f][IdValueFields.FIELD_ID] = contract_tuple[6]
                         data_record[nam_f][IdValueFields.FIELD_VALUE_1] = contract_tuple[7]
                         data_record[nam_f][IdValueFields.FIELD_VALUE_2] = contract_tuple[8]
                         data_record[nam_f][IdValueFields.FIELD_VALUE_3] = contract_tuple[9]
 
-                    # If this line is removed, then the fieN compute is wrong
-                    data_record[nam_f] = data_record[value]
+                        fields[nam_f] = data_record[nam_f]
             i += 1
 
+    data_record.update_fields(fields)
+
     return data_record
 
 
@@ -103,24 +147,350 @@ def from_contract_tuple_to_meta_data_record(contract_tuple: tuple):
     return new_meta_data_record
 
 
-def from_contract_tuple_to_system_data_records(contract_tuple: tuple):
+def __get_packed_value(contract_tuple: tuple):
     """
-    Returns a SystemDataRecord list with the contract_tuple values.
+    Returns the packed value of the contract_tuple, or None if its samples are not packed.
     """
 
+    nam_f = contract_tuple[2]
+    if nam_f not in PACKABLE_FIELDS:
+        return None
+
+    value = contract_tuple[5] if nam_f in TWO_V_FIELDS else contract_tuple[7]
+
+    return value if is_packed_value(value) else None
+
+
+def __from_packed_contract_tuple_to_system_data_records(
+        contract_tuple: tuple, packed_value: bytes, compact: bool = False):
+    """
+    Returns a SystemDataRecord list with a record for each sample packed in the contract_tuple, or
+    a CompactSystemDataRecord list if compact is True.
+    """
+
+    nam_f = contract_tuple[2]
+    value_keys, is_float = PACKABLE_FIELDS[nam_f]
+    field_id = contract_tuple[4] if nam_f in TWO_V_FIELDS else contract_tuple[6]
+
     system_data_records = []
+    for sys_t, values in unpack_samples(contract_tuple[1], packed_value, len(value_keys), is_float):
+        if compact is True:
+            nam_f_value = dict(zip(value_keys, values))
+            nam_f_value[IdValueFields.FIELD_ID] = field_id
+
+            system_data_records.append(
+                CompactSystemDataRecord(contract_tuple[0], sys_t, nam_f, nam_f_value))
+
+            continue
 
-    for contract_system_data_record in contract_tuple:
         system_data_record = SystemDataRecord()
         system_data_record.set_retrieve_type(True)
 
-        new_system_data_record = __from_contract_tuple_to_record(
-            system_data_record, contract_system_data_record
-        )
+        system_data_record[CommonDataFields.FIELD_REC_T] = contract_tuple[0]
+        system_data_record[SystemDataFields.FIELD_SYS_T] = sys_t
+
+        system_data_record[nam_f][IdValueFields.FIELD_ID] = field_id
+        for value_key, value in zip(value_keys, values):
+            system_data_record[nam_f][value_key] = value
+
+        # If this line is removed, then the fieN compute is wrong
+        system_data_record[nam_f] = system_data_record[nam_f]
 
         system_data_record.set_retrieve_type(False)
 
-        system_data_records.append(new_system_data_record)
+        system_data_records.append(system_data_record)
+
+    return system_data_records
+
+
+def __get_chunk_fragment(contract_tuple: tuple):
+    """
+    Returns a tuple with the group key, the index and the total of chunks of the contract_tuple,
+    if it is a chunk of a split record, or None.
+    """
+
+    for position in VALUE_POSITIONS:
+        if (position < len(contract_tuple) and isinstance(contract_tuple[position], bytes) and
+                is_chunk_value(contract_tuple[position])):
+            group_id, index, total, _ = parse_chunk_value(contract_tuple[position])
+
+            return (ENCODING_CHUNK, group_id), index, total
+
+    return None
+
+
+def __get_legacy_fragment(contract_tuple: tuple):
+    """
+    Returns a tuple with the group key and the index of the contract_tuple, if its values start with
+    the index prefix of the records split before the chunk header, or None. The total of chunks
+    of these records is not stored. These records were stored before the encoding header, so only
+    the legacy zlib values are decompressed, and a value with the header that starts with the
+    index prefix is not a fragment.
+    """
+
+    if (len(contract_tuple) <= max(VALUE_POSITIONS) or contract_tuple[2] in PACKABLE_FIELDS or
+            contract_tuple[2] == MULTI_FIELD_NAM_F):
+        return None
+
+    index = None
+    for position in VALUE_POSITIONS:
+        value = contract_tuple[position]
+        if not isinstance(value, bytes) or value == b'':
+            continue
+
+        if is_legacy_value(value) is False:
+            return None
+
+        match = LEGACY_CHUNK_PREFIX.match(decompress_value_prefix(value, LEGACY_CHUNK_PREFIX_SIZE))
+        if match is None or (index is not None and index != int(match.group(1))):
+            return None
+
+        index = int(match.group(1))
+
+    if index is None:
+        return None
+
+    return (contract_tuple[1], contract_tuple[2]), index, None
+
+
+def __is_complete_fragment_group(fragments: dict, total: int):
+    if total is None:
+        # The legacy records were always split into two or more chunks
+        total = len(fragments) if len(fragments) > 1 else 0
+
+    return total > 0 and sorted(fragments) == list(range(total))
+
+
+def __join_fragments(fragments: list):
+    """
+    Returns the contract tuple of the split record whose chunks, in index order, are fragments.
+    Each value is the concatenation of the values of its chunks, without their chunk header or
+    index prefix.
+    """
+
+    joined_contract_tuple = list(fragments[0])
+
+    for position in VALUE_POSITIONS:
+        value = fragments[0][position]
+        if value == b'':
+            continue
+
+        if is_chunk_value(value):
+            joined_contract_tuple[position] = b''.join(
+                parse_chunk_value(fragment[position])[3] for fragment in fragments)
+        else:
+            joined_contract_tuple[position] = ''.join(
+                decompress_value(fragment[position]).split(';', 1)[1] for fragment in fragments)
+
+    return tuple(joined_contract_tuple)
+
+
+def __group_fragments(contract_tuple: tuple, raw_fragments: bool):
+    """
+    Returns the contract_tuple list with the chunks of each complete split record grouped, in index
+    order, at the position of its first chunk. The chunks of the records that are not complete are
+    not returned, except the legacy ones, which can be decoded on their own. The legacy chunks of a
+    group with a repeated index are not grouped either, since they belong to several records. If
+    raw_fragments is True, the chunks are not grouped. Returns also the number of groups.
+    """
+
+    fragment_keys = []
+    fragment_groups = {}
+    # The legacy groups have no group identifier, so two records split with the same sysT and
+    # field share a key. The chunk groups have a random one, so a repeated chunk is the same chunk.
+    colliding_groups = {}
+
+    for contract_system_data_record in contract_tuple:
+        fragment = (__get_chunk_fragment(contract_system_data_record) or
+                    __get_legacy_fragment(contract_system_data_record))
+
+        if fragment is None:
+            fragment_keys.append(None)
+
+            continue
+
+        key, index, total = fragment
+        fragment_keys.append(key)
+
+        fragments = fragment_groups.setdefault(key, ({}, total))[0]
+        if total is None and (key in colliding_groups or index in fragments):
+            colliding_groups.setdefault(key, list(fragments.values())).append(
+                contract_system_data_record)
+
+        fragments[index] = contract_system_data_record
+
+    if raw_fragments is True:
+        return list(contract_tuple), 0
+
+    entries = []
+    groups_number = 0
+
+    for contract_system_data_record, key in zip(contract_tuple, fragment_keys):
+        if key is None:
+            entries.append(contract_system_data_record)
+
+        elif key in colliding_groups:
+            chunks = colliding_groups.pop(key)
+            fragment_groups.pop(key)
+
+            __logger.warning(
+                "Legacy split SD records with the same key are not reassembled. Group: %s. "
+                "Chunks: %d", key, len(chunks))
+
+            entries.extend(chunks)
+
+        elif key in fragment_groups:
+            fragments, total = fragment_groups.pop(key)
+
+            if __is_complete_fragment_group(fragments, total):
+                entries.append([fragments[index] for index in sorted(fragments)])
+                groups_number += 1
+
+            elif total is None:
+                entries.extend(fragments[index] for index in sorted(fragments))
+
+            else:
+                __logger.warning(
+                    "Incomplete split SD record is not returned. Group: %s. Missing chunks: %s",
+                    key, sorted(set(range(total)) - set(fragments)))
+
+    return entries, groups_number
+
+
+def __from_raw_fragment_to_generic_system_data_record(contract_tuple: tuple):
+    """
+    Returns a GenericSystemDataRecord with the contract_tuple values, which keeps its chunk
+    values encoded.
+    """
+
+    return GenericSystemDataRecord(dict(zip(SYSTEM_DATA_CONTRACT_TUPLE_FIELDS, contract_tuple)))
+
+
+def __get_nam_f_value(contract_tuple: tuple):
+    """
+    Returns a tuple with the namF of the contract_tuple and its value as it is retrieved from the
+    contract, or a dictionary with the id and values of an id-value field.
+    """
+
+    nam_f = contract_tuple[2]
+
+    if nam_f in VAL_F_FIELDS:
+        return nam_f, contract_tuple[3]
+
+    if nam_f in TWO_V_FIELDS:
+        return nam_f, {IdValueFields.FIELD_ID: contract_tuple[4],
+                       IdValueFields.FIELD_VALUE: contract_tuple[5]}
+
+    if nam_f in FOU_V_FIELDS:
+        return nam_f, {IdValueFields.FIELD_ID: contract_tuple[6],
+                       IdValueFields.FIELD_VALUE_1: contract_tuple[7],
+                       IdValueFields.FIELD_VALUE_2: contract_tuple[8],
+                       IdValueFields.FIELD_VALUE_3: contract_tuple[9]}
+
+    return None, None
+
+
+def __from_contract_tuple_to_compact_system_data_record(contract_tuple: tuple):
+    """
+    Returns a CompactSystemDataRecord with the contract_tuple values.
+    """
+
+    nam_f, nam_f_value = __get_nam_f_value(contract_tuple)
+
+    return CompactSystemDataRecord(contract_tuple[0], contract_tuple[1], nam_f, nam_f_value)
+
+
+def __from_multi_field_contract_tuple_to_system_data_record(contract_tuple: tuple, compact: bool):
+    """
+    Returns a SystemDataRecord, or CompactSystemDataRecord, with all the fields stored in the
+    multi-field contract_tuple.
+    """
+
+    field_contract_tuples = from_multi_field_value_to_contract_tuples(
+        contract_tuple[0], contract_tuple[1], contract_tuple[3])
+
+    if compact is True:
+        return CompactSystemDataRecord(
+            contract_tuple[0], contract_tuple[1],
+            fields=dict(__get_nam_f_value(field_contract_tuple)
+                        for field_contract_tuple in field_contract_tuples))
+
+    system_data_record = SystemDataRecord()
+    system_data_record.set_retrieve_type(True)
+
+    for field_contract_tuple in field_contract_tuples:
+        __from_contract_tuple_to_record(system_data_record, field_contract_tuple)
+
+    system_data_record.set_retrieve_type(False)
+
+    return system_data_record
+
+
+def __from_entry_to_system_data_records(entry, raw_fragments: bool, compact: bool):
+    """
+    Returns a SystemDataRecord, or CompactSystemDataRecord, list with the entry values. The entry
+    is a contract tuple or the list of chunks of a split record.
+    """
+
+    if isinstance(entry, list):
+        contract_system_data_record = __join_fragments(entry)
+    else:
+        contract_system_data_record = entry
+
+    if raw_fragments is True and __get_chunk_fragment(contract_system_data_record) is not None:
+        return [__from_raw_fragment_to_generic_system_data_record(contract_system_data_record)]
+
+    packed_value = __get_packed_value(contract_system_data_record)
+    if packed_value is not None:
+        return __from_packed_contract_tuple_to_system_data_records(
+            contract_system_data_record, packed_value, compact)
+
+    if (contract_system_data_record[2] == MULTI_FIELD_NAM_F and
+            is_multi_field_value(contract_system_data_record[3])):
+        return [__from_multi_field_contract_tuple_to_system_data_record(
+            contract_system_data_record, compact)]
+
+    if compact is True:
+        return [__from_contract_tuple_to_compact_system_data_record(contract_system_data_record)]
+
+    system_data_record = SystemDataRecord()
+    system_data_record.set_retrieve_type(True)
+
+    new_system_data_record = __from_contract_tuple_to_record(
+        system_data_record, contract_system_data_record
+    )
+
+    system_data_record.set_retrieve_type(False)
+
+    return [new_system_data_record]
+
+
+def from_contract_tuple_to_system_data_records(
+        contract_tuple: tuple, raw_fragments: bool = False, compact: bool = False):
+    """
+    Returns a SystemDataRecord list with the contract_tuple values. The packed samples are returned
+    as one SystemDataRecord each, and the chunks of a split record as one SystemDataRecord. When
+    there are REASSEMBLY_PARALLEL_GROUPS or more split records, they are reassembled in parallel.
+    If raw_fragments is True, the chunks are not reassembled, and the ones with a chunk header are
+    returned as GenericSystemDataRecord.
+    If compact is True, the records are returned as read-only CompactSystemDataRecord, which take
+    a fraction of the memory of a SystemDataRecord.
+    """
+
+    entries, groups_number = __group_fragments(contract_tuple, raw_fragments)
+
+    if groups_number >= REASSEMBLY_PARALLEL_GROUPS:
+        with ThreadPoolExecutor() as executor:
+            entries_records = list(executor.map(
+                lambda entry: __from_entry_to_system_data_records(entry, raw_fragments, compact),
+                entries))
+    else:
+        entries_records = [__from_entry_to_system_data_records(entry, raw_fragments, compact)
+                           for entry in entries]
+
+    system_data_records = []
+    for entry_records in entries_records:
+        system_data_records.extend(entry_records)
 
     return system_data_records
 
@@ -0,0 +1,144 @@
+"""
+This module contains functions that provide common support for packing several samples of a
+numeric System Data field into one value.
+
+The packed value starts with the ENCODING_PACKED header, followed by unsigned varints: the number
+of samples, the decimal scale of the values and, for each sample, the zigzag-encoded delta of its
+sysT and of each of its values with respect to the previous sample. The first sample deltas are
+relative to the sysT of the record and to zero. The float values are scaled by 10^scale, where
+scale is the largest number of decimals of their shortest representation, so they are packed as
+integers without losing precision.
+"""
+
+import math
+
+from decimal import Decimal
+
+from bcubed.constants.records.fields.id_value_fields import IdValueFields
+from bcubed.constants.records.fields.system_data_fields import SystemDataFields
+from bcubed.utilities.compression_help import ENCODING_PACKED
+
+# The value keys of each packable field and if their values are float
+PACKABLE_FIELDS = {
+    SystemDataFields.FIELD_GYR_V: ((IdValueFields.FIELD_VALUE_1,
+                                    IdValueFields.FIELD_VALUE_2,
+                                    IdValueFields.FIELD_VALUE_3), False),
+    SystemDataFields.FIELD_ACC_V: ((IdValueFields.FIELD_VALUE_1,
+                                    IdValueFields.FIELD_VALUE_2,
+                                    IdValueFields.FIELD_VALUE_3), False),
+    SystemDataFields.FIELD_TMP_V: ((IdValueFields.FIELD_VALUE,), True),
+    SystemDataFields.FIELD_ACT_V: ((IdValueFields.FIELD_VALUE,), True),
+    SystemDataFields.FIELD_ACT_D: ((IdValueFields.FIELD_VALUE,), True),
+    SystemDataFields.FIELD_IR_SE: ((IdValueFields.FIELD_VALUE,), True),
+    SystemDataFields.FIELD_TCH_S: ((IdValueFields.FIELD_VALUE,), False),
+    SystemDataFields.FIELD_IF_SE: ((IdValueFields.FIELD_VALUE,), False),
+}
+
+
+def __write_varint(data: bytearray, value: int):
+    while value > 0x7f:
+        data.append((value & 0x7f) | 0x80)
+        value >>= 7
+
+    data.append(value)
+
+
+def __read_varint(data: bytes, offset: int):
+    value = 0
+    shift = 0
+
+    while True:
+        byte = data[offset]
+        offset += 1
+
+        value |= (byte & 0x7f) << shift
+        shift += 7
+
+        if byte < 0x80:
+            return value, offset
+
+
+def __zigzag(value: int):
+    return (value << 1) if value >= 0 else ((-value << 1) - 1)
+
+
+def __unzigzag(value: int):
+    return (value >> 1) if (value & 1) == 0 else -((value + 1) >> 1)
+
+
+def is_packable_value(value):
+    """
+    Returns True if the value can be packed without losing precision.
+    """
+
+    return (isinstance(value, int) or
+            (isinstance(value, float) and math.isfinite(value)))
+
+
+def is_packed_value(value):
+    """
+    Returns True if the contract value is a packed value.
+    """
+
+    return isinstance(value, bytes) and value[:1] == bytes((ENCODING_PACKED,))
+
+
+def pack_samples(sys_t: int, samples: list):
+    """
+    Returns the packed value of the samples, a list of (sysT, values) tuples, relative to the
+    sysT of the record.
+    """
+
+    scale = max((-min(Decimal(repr(value)).as_tuple().exponent, 0)
+                 for _, values in samples for value in values if isinstance(value, float)),
+                default=0)
+
+    data = bytearray((ENCODING_PACKED,))
+    __write_varint(data, len(samples))
+    __write_varint(data, scale)
+
+    previous_sys_t = sys_t
+    previous_values = [0] * len(samples[0][1])
+
+    for sample_sys_t, values in samples:
+        __write_varint(data, __zigzag(sample_sys_t - previous_sys_t))
+        previous_sys_t = sample_sys_t
+
+        for index, value in enumerate(values):
+            scaled_value = int(Decimal(repr(value)).scaleb(scale))
+
+            __write_varint(data, __zigzag(scaled_value - previous_values[index]))
+            previous_values[index] = scaled_value
+
+    return bytes(data)
+
+
+def unpack_samples(sys_t: int, value: bytes, values_number: int, is_float: bool):
+    """
+    Returns the list of (sysT, values) tuples packed in the value by pack_samples.
+    """
+
+    samples_number, offset = __read_varint(value, 1)
+    scale, offset = __read_varint(value, offset)
+
+    samples = []
+    previous_sys_t = sys_t
+    previous_values = [0] * values_number
+
+    for _ in range(samples_number):
+        delta, offset = __read_varint(value, offset)
+        previous_sys_t += __unzigzag(delta)
+
+        values = []
+        for index in range(values_number):
+            delta, offset = __read_varint(value, offset)
+            previous_values[index] += __unzigzag(delta)
+
+            if is_float:
+                values.append(float(Decimal(previous_values[index]).scaleb(-scale)))
+            else:
+                values.append(previous_values[index])
+
+        samples.append((previous_sys_t, values))
+
+    return samples
@@ -0,0 +1,136 @@
+"""
+This module contains functions that provide common support for merging the retrieved System Data
+records, which usually have the value of one field each, into one record, or one table row, for
+each sysT.
+"""
+
+from bcubed.constants.records.fields.common_data_fields import CommonDataFields
+from bcubed.constants.records.fields.id_value_fields import IdValueFields
+from bcubed.constants.records.fields.system_data_fields import SystemDataFields
+from bcubed.records.compact_system_data_record import (
+    DEFAULT_VALUES,
+    FIELD_INDEXES,
+    FIELD_NAMES,
+    ID_VALUE_FIELD_TYPES,
+    CompactSystemDataRecord
+)
+from bcubed.records.system_data_record import SystemDataRecord
+
+NOT_MERGED_FIELDS = (
+    CommonDataFields.FIELD_TYP_R,
+    CommonDataFields.FIELD_FIE_N,
+    CommonDataFields.FIELD_REC_T,
+    SystemDataFields.FIELD_SYS_T
+)
+
+# The fields that are merged, with their default value
+MERGED_FIELDS = tuple(
+    (field_name, DEFAULT_VALUES[FIELD_INDEXES[field_name]]) for field_name in FIELD_NAMES
+    if field_name not in NOT_MERGED_FIELDS)
+
+
+def __get_not_default_fields(system_data_record):
+    """
+    Returns a dictionary with the fields of the record that are not the default ones. The value of
+    an id-value field is returned as a dictionary.
+    """
+
+    fields = {}
+
+    for field_name, default_value in MERGED_FIELDS:
+        field_value = system_data_record[field_name]
+
+        if field_name in ID_VALUE_FIELD_TYPES:
+            if field_value[IdValueFields.FIELD_ID] != 0:
+                fields[field_name] = dict(field_value)
+
+        elif field_value != default_value:
+            fields[field_name] = field_value
+
+    return fields
+
+
+def __get_timeline_groups(system_data_records: list, tolerance: int):
+    """
+    Returns a list with a (sysT, recT, fields) tuple for each group of records whose sysT is at
+    most tolerance after the sysT of the first record of the group. The records are sorted once by
+    sysT, and the fields of a record override the same fields of the previous records of its group.
+    """
+
+    groups = []
+
+    for system_data_record in sorted(
+            system_data_records, key=lambda record: record[SystemDataFields.FIELD_SYS_T]):
+        sys_t = system_data_record[SystemDataFields.FIELD_SYS_T]
+
+        if len(groups) == 0 or sys_t - groups[-1][0] > tolerance:
+            groups.append((sys_t, system_data_record[CommonDataFields.FIELD_REC_T], {}))
+
+        groups[-1][2].update(__get_not_default_fields(system_data_record))
+
+    return groups
+
+
+def merge_system_data_records(system_data_records: list, tolerance: int = 0, compact: bool = False):
+    """
+    Returns the System Data records merged by sysT, sorted by sysT. The records whose sysT is at
+    most tolerance after the sysT of the first record of a group are merged into one record with
+    that sysT. When several records of a group have the same field, the value with the latest sysT
+    is kept.
+    If compact is True, the merged records are returned as CompactSystemDataRecord.
+    """
+
+    merged_records = []
+
+    for sys_t, rec_t, fields in __get_timeline_groups(system_data_records, tolerance):
+        if compact is True:
+            merged_records.append(CompactSystemDataRecord(rec_t, sys_t, fields=fields))
+
+            continue
+
+        system_data_record = SystemDataRecord()
+        system_data_record.set_retrieve_type(True)
+
+        fields[CommonDataFields.FIELD_REC_T] = rec_t
+        fields[SystemDataFields.FIELD_SYS_T] = sys_t
+
+        for field_name, field_value in fields.items():
+            if field_name in ID_VALUE_FIELD_TYPES:
+                fields[field_name] = ID_VALUE_FIELD_TYPES[field_name](field_value)
+
+        system_data_record.update_fields(fields)
+        system_data_record.set_retrieve_type(False)
+
+        merged_records.append(system_data_record)
+
+    return merged_records
+
+
+def from_system_data_records_to_table(system_data_records: list, tolerance: int = 0):
+    """
+    Returns the System Data records merged by sysT, as merge_system_data_records does, in a table
+    with a column for sysT and for each field that has a value in any row, in the format of
+    from_columns_to_contract_tuples. The column of an id-value field is a dictionary with a column
+    for its id and for each value key. The fields that have no value in a row are None.
+    """
+
+    groups = __get_timeline_groups(system_data_records, tolerance)
+    field_names = set()
+    for _, _, fields in groups:
+        field_names.update(fields)
+
+    table = {SystemDataFields.FIELD_SYS_T: [sys_t for sys_t, _, _ in groups]}
+
+    for field_name, default_value in MERGED_FIELDS:
+        if field_name not in field_names:
+            continue
+
+        if field_name in ID_VALUE_FIELD_TYPES:
+            table[field_name] = dict(
+                (value_key, [fields[field_name][value_key] if field_name in fields else None
+                             for _, _, fields in groups])
+                for value_key in default_value)
+        else:
+            table[field_name] = [fields.get(field_name) for _, _, fields in groups]
+
+    return table
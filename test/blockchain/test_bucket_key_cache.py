@@ -0,0 +1,87 @@
+"""
+This is a class-containing module.
+
+It contains the GivenABucketKeyCache class, which inherits from TestCase and performs all the
+BucketKeyCache tests.
+"""
+
+import os
+import tempfile
+
+from unittest import TestCase
+
+from bcubed.blockchain.bucket_key_cache import ADDRESS_SIZE, KEY, BucketKeyCache
+
+
+ADDRESS = '0x' + '01' * ADDRESS_SIZE
+OTHER_ADDRESS = '0x' + '02' * ADDRESS_SIZE
+
+
+class GivenABucketKeyCache(TestCase):
+    """
+    It contains the test suite related with BucketKeyCache class.
+    Add tests as required.
+    """
+
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.path = os.path.join(self.directory.name, 'keys.bin')
+
+        return super().setUp()
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+        return super().tearDown()
+
+    def test_when_adding_keys_then_the_range_keys_are_returned_sorted_and_unique(self):
+        """
+        Given a BucketKeyCache when adding keys then the keys of a range are returned sorted and
+        unique, and their contract positions are returned while the contract keys are sorted
+        """
+
+        bucket_key_cache = BucketKeyCache(ADDRESS)
+
+        bucket_key_cache.add_keys([1, 2, 5])
+        bucket_key_cache.add_keys([7, 9])
+
+        self.assertEqual(5, bucket_key_cache.get_keys_count())
+        self.assertEqual([2, 5, 7], bucket_key_cache.get_keys(2, 8))
+        self.assertEqual([1, 2, 5, 7, 9], bucket_key_cache.get_keys())
+        self.assertEqual((1, 4), bucket_key_cache.get_key_positions(2, 8))
+
+        bucket_key_cache.add_keys([5, 3])
+
+        self.assertEqual(7, bucket_key_cache.get_keys_count())
+        self.assertEqual([2, 3, 5, 7], bucket_key_cache.get_keys(2, 8))
+        self.assertEqual((0, 7), bucket_key_cache.get_key_positions(2, 8))
+
+    def test_when_creating_it_with_a_path_then_the_stored_keys_are_loaded(self):
+        """
+        Given a BucketKeyCache with a path when creating another one then the stored keys are
+        loaded, unless they belong to another contract
+        """
+
+        BucketKeyCache(ADDRESS, self.path).add_keys([1, 2, 5])
+        BucketKeyCache(ADDRESS, self.path).add_keys([7])
+
+        self.assertEqual([1, 2, 5, 7], BucketKeyCache(ADDRESS, self.path).get_keys())
+        self.assertEqual([], BucketKeyCache(OTHER_ADDRESS, self.path).get_keys())
+        self.assertFalse(os.path.exists(self.path))
+
+    def test_when_the_last_stored_key_is_torn_then_it_is_discarded(self):
+        """
+        Given a BucketKeyCache with a path when the last stored key is torn then it is discarded
+        and the next keys are appended after the previous one
+        """
+
+        BucketKeyCache(ADDRESS, self.path).add_keys([1, 2])
+
+        with open(self.path, 'ab') as file:
+            file.write(KEY.pack(5)[:3])
+
+        bucket_key_cache = BucketKeyCache(ADDRESS, self.path)
+        bucket_key_cache.add_keys([5])
+
+        self.assertEqual(ADDRESS_SIZE + 3 * KEY.size, os.path.getsize(self.path))
+        self.assertEqual([1, 2, 5], BucketKeyCache(ADDRESS, self.path).get_keys())
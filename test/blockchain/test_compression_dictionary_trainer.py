@@ -0,0 +1,56 @@
+"""
+This is a class-containing module.
+
+It contains the GivenACompressionDictionaryTrainer class, which inherits from TestCase and performs
+all the CompressionDictionaryTrainer tests.
+"""
+
+from unittest import TestCase
+
+from bcubed.blockchain.compression_dictionary_trainer import CompressionDictionaryTrainer
+
+
+FIELD = "txtC"
+OTHER_FIELD = "txtR"
+VALUE = '{"process": "ros2 launch bcubed", "state": "running"}'
+
+
+class GivenACompressionDictionaryTrainer(TestCase):
+    """
+    It contains the test suite related with CompressionDictionaryTrainer class.
+    Add tests as required.
+    """
+
+    def setUp(self) -> None:
+        self.trainer = CompressionDictionaryTrainer([FIELD], 2, 16)
+
+        return super().setUp()
+
+    def tearDown(self) -> None:
+        del self.trainer
+
+        return super().tearDown()
+
+    def test_when_adding_samples_then_the_dictionary_is_trained_once_the_field_has_enough_samples(self):
+        """
+        Given a CompressionDictionaryTrainer when adding samples then the dictionary is returned only
+        when the field reaches the number of samples, and the field is not sampled anymore
+        """
+
+        self.assertIsNone(self.trainer.add_sample(FIELD, VALUE))
+
+        dictionary = self.trainer.add_sample(FIELD, VALUE)
+
+        self.assertEqual(VALUE.encode()[-16:], dictionary)
+        self.assertFalse(self.trainer.is_training(FIELD))
+        self.assertIsNone(self.trainer.add_sample(FIELD, VALUE))
+
+    def test_when_adding_samples_of_a_field_not_trained_then_no_dictionary_is_returned(self):
+        """
+        Given a CompressionDictionaryTrainer when adding samples of a field that is not trained then
+        no dictionary is returned
+        """
+
+        self.assertFalse(self.trainer.is_training(OTHER_FIELD))
+        self.assertIsNone(self.trainer.add_sample(OTHER_FIELD, VALUE))
+        self.assertIsNone(self.trainer.add_sample(OTHER_FIELD, VALUE))
@@ -0,0 +1,96 @@
+"""
+This is a class-containing module.
+
+It contains the GivenAFlushPolicy class, which inherits from TestCase and performs all the
+FlushPolicy tests.
+"""
+
+import time
+
+from unittest import TestCase
+
+from bcubed.blockchain.flush_policy import FlushPolicy
+
+
+class GivenAFlushPolicy(TestCase):
+    """
+    It contains the test suite related with FlushPolicy class.
+    Add tests as required.
+    """
+
+    def setUp(self) -> None:
+        self.flush_policy = FlushPolicy(
+            16000000, max_age=10, max_records=3, max_bytes=100, adaptive=True,
+            target_inclusion_time=20, min_target_gas=4000000)
+
+        return super().setUp()
+
+    def test_when_the_oldest_record_is_older_than_max_age_then_it_is_expired(self):
+        """
+        Given a FlushPolicy when the oldest record is older than max age then it is expired
+        """
+
+        self.assertTrue(self.flush_policy.is_expired(time.monotonic() - 11))
+        self.assertFalse(self.flush_policy.is_expired(time.monotonic()))
+        self.assertFalse(self.flush_policy.is_expired(None))
+
+    def test_when_the_buffer_reaches_max_records_or_max_bytes_then_it_is_full(self):
+        """
+        Given a FlushPolicy when the buffer reaches max records or max bytes then it is full
+        """
+
+        self.assertTrue(self.flush_policy.is_full(3, 10))
+        self.assertTrue(self.flush_policy.is_full(1, 100))
+        self.assertFalse(self.flush_policy.is_full(2, 99))
+
+    def test_when_the_triggers_are_not_configured_then_they_are_disabled(self):
+        """
+        Given a FlushPolicy without triggers then it is never expired nor full and the target gas
+        does not change
+        """
+
+        flush_policy = FlushPolicy(16000000)
+
+        self.assertFalse(flush_policy.is_expired(time.monotonic() - 100000))
+        self.assertFalse(flush_policy.is_full(100000, 100000000))
+
+        flush_policy.observe(1000, 1)
+
+        self.assertEqual(16000000, flush_policy.get_target_gas())
+
+    def test_when_the_inclusion_is_slow_then_the_target_gas_is_shrunk_to_the_minimum(self):
+        """
+        Given an adaptive FlushPolicy when the batches are included slowly or the blocks are full
+        then the target gas is shrunk, but not below the minimum
+        """
+
+        self.flush_policy.observe(30, 0.2)
+        self.assertEqual(12000000, self.flush_policy.get_target_gas())
+
+        self.flush_policy.observe(5, 0.95)
+        self.assertEqual(9000000, self.flush_policy.get_target_gas())
+
+        for _ in range(10):
+            self.flush_policy.observe(30)
+
+        self.assertEqual(4000000, self.flush_policy.get_target_gas())
+
+    def test_when_the_inclusion_is_fast_then_the_target_gas_is_grown_to_the_maximum(self):
+        """
+        Given an adaptive FlushPolicy when the batches are included quickly in blocks with room
+        then the target gas is grown, but not above the maximum
+        """
+
+        self.flush_policy.observe(30)
+        self.flush_policy.observe(30)
+
+        self.flush_policy.observe(15, 0.2)
+        self.assertEqual(9000000, self.flush_policy.get_target_gas())
+
+        self.flush_policy.observe(5, 0.2)
+        self.assertEqual(11250000, self.flush_policy.get_target_gas())
+
+        for _ in range(10):
+            self.flush_policy.observe(5, 0.2)
+
+        self.assertEqual(16000000, self.flush_policy.get_target_gas())
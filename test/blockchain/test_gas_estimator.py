@@ -0,0 +1,132 @@
+"""
+This is a class-containing module.
+
+It contains the GivenAGasEstimator class, which inherits from TestCase and performs all the
+GasEstimator tests.
+"""
+
+from unittest import TestCase
+from unittest.mock import MagicMock
+
+from bcubed.blockchain.gas_estimator import GasEstimator
+from bcubed.constants.records.fields.id_value_fields import IdValueFields
+from bcubed.constants.records.fields.system_data_fields import SystemDataFields
+from bcubed.records.generic_system_data_record import GenericSystemDataRecord
+from bcubed.records.system_data_record import SystemDataRecord
+from bcubed.utilities.parse_help import from_record_to_contract_tuple
+
+
+class GivenAGasEstimator(TestCase):
+    """
+    It contains the test suite related with GasEstimator class.
+    Add tests as required.
+    """
+
+    def setUp(self) -> None:
+        self.network = MagicMock()
+        self.network.get_estimated_gas = MagicMock(return_value=50000)
+
+        self.gas_estimator = GasEstimator(self.network, 0.1, 3)
+
+        return super().setUp()
+
+    def __get_contract_tuple(self, system_timestamp: int, battery_level: int):
+        system_data_record = SystemDataRecord()
+        system_data_record[SystemDataFields.FIELD_SYS_T] = system_timestamp
+        system_data_record[SystemDataFields.FIELD_BAT_L] = battery_level
+
+        return from_record_to_contract_tuple(GenericSystemDataRecord(system_data_record))
+
+    def test_when_estimating_the_same_shape_then_the_network_is_asked_once(self):
+        """
+        Given a GasEstimator when estimating records with the same shape then the network is
+        asked once
+        """
+
+        # The first record of the bucket has its own shape
+        self.gas_estimator.get_estimated_gas(
+            self.__get_contract_tuple(1000000, 30))
+
+        first_gas = self.gas_estimator.get_estimated_gas(
+            self.__get_contract_tuple(1000001, 40))
+        second_gas = self.gas_estimator.get_estimated_gas(
+            self.__get_contract_tuple(1000002, 50))
+
+        self.assertEqual(50000, first_gas)
+        self.assertEqual(50000, second_gas)
+        self.assertEqual(2, self.network.get_estimated_gas.call_count)
+        self.assertEqual((1, 2), self.gas_estimator.get_statistics())
+
+    def test_when_estimating_the_first_record_of_new_buckets_then_the_shape_is_shared(self):
+        """
+        Given a GasEstimator when estimating the first record of several timestamp buckets then
+        they share the same shape and the network is asked once
+        """
+
+        self.gas_estimator.get_estimated_gas(
+            self.__get_contract_tuple(1000000, 30))
+        self.gas_estimator.get_estimated_gas(
+            self.__get_contract_tuple(2000000, 30))
+
+        self.network.get_estimated_gas.assert_called_once()
+        self.assertEqual((1, 1), self.gas_estimator.get_statistics())
+
+    def test_when_estimating_a_different_field_then_the_shape_is_different(self):
+        """
+        Given a GasEstimator when estimating records of different fields then the network is asked
+        for each one
+        """
+
+        contract_tuple = self.__get_contract_tuple(1000000, 30)
+
+        system_data_record = SystemDataRecord()
+        system_data_record[SystemDataFields.FIELD_SYS_T] = 1000001
+        system_data_record[SystemDataFields.FIELD_SYS_X][IdValueFields.FIELD_ID] = 1
+        system_data_record[SystemDataFields.FIELD_SYS_X][IdValueFields.FIELD_VALUE] = "value"
+
+        self.gas_estimator.get_estimated_gas(contract_tuple)
+        self.gas_estimator.get_estimated_gas(
+            from_record_to_contract_tuple(GenericSystemDataRecord(system_data_record)))
+
+        self.assertEqual(2, self.network.get_estimated_gas.call_count)
+
+    def test_when_the_recalibration_interval_is_reached_then_the_network_is_asked_again(self):
+        """
+        Given a GasEstimator when the recalibration interval is reached then the network is asked
+        again and the learnt value is updated
+        """
+
+        # One estimation for the new bucket, one for the known bucket and three hits
+        for index in range(5):
+            self.gas_estimator.get_estimated_gas(
+                self.__get_contract_tuple(1000000 + index, 30))
+
+        self.network.get_estimated_gas = MagicMock(return_value=60000)
+
+        gas = self.gas_estimator.get_estimated_gas(
+            self.__get_contract_tuple(1000005, 30))
+
+        self.assertEqual(60000, gas)
+        self.network.get_estimated_gas.assert_called_once()
+
+    def test_when_the_network_cannot_estimate_then_it_is_not_cached(self):
+        """
+        Given a GasEstimator when the network cannot estimate the gas then it returns 0 and it is
+        not cached
+        """
+
+        self.network.get_estimated_gas = MagicMock(return_value=0)
+
+        self.assertEqual(0, self.gas_estimator.get_estimated_gas(
+            self.__get_contract_tuple(1000000, 30)))
+        self.assertEqual(0, self.gas_estimator.get_estimated_gas(
+            self.__get_contract_tuple(2000000, 30)))
+
+        self.assertEqual(2, self.network.get_estimated_gas.call_count)
+
+    def test_when_getting_gas_limit_then_the_safety_margin_is_added(self):
+        """
+        Given a GasEstimator when getting the gas limit then the safety margin is added
+        """
+
+        self.assertEqual(110000, self.gas_estimator.get_gas_limit(100000))
@@ -6,22 +6,28 @@ Network tests.
 """
 
 import logging
+import os
+import tempfile
 
 from typing import TypedDict
 from unittest import TestCase
 
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, PropertyMock
 
 from test.config.config_test_helper import ConfigTestHelper
 
 from web3.exceptions import (
+    TimeExhausted,
     Web3AttributeError,
+    Web3RPCError,
     Web3TypeError,
     Web3ValueError,
 )
 
 from bcubed.blockchain.network import Network
 from bcubed.config.config import Config
+from bcubed.constants.config.config_categories import ConfigCategories
+from bcubed.constants.config.config_keys import ConfigKeys
 from bcubed.constants.records.fields.common_data_fields import CommonDataFields
 from bcubed.constants.records.fields.id_value_fields import IdValueFields
 from bcubed.constants.records.fields.meta_data_fields import MetaDataFields
@@ -31,6 +37,8 @@ from bcubed.records.meta_data_record import MetaDataRecord
 from bcubed.records.system_data_record import SystemDataRecord
 from bcubed.records.generic_system_data_record import GenericSystemDataRecord
 from bcubed.records.overview_data_record import OverviewDataRecord
+from bcubed.utilities.encoding_help import encode_system_data_contract_tuple
+from bcubed.utilities.parse_help import from_record_to_contract_tuple
 
 CLASS_PATH = 'bcubed.blockchain.network'
 
@@ -479,6 +487,123 @@ class GivenANetwork(TestCase):
 
         self.assertTrue(success)
 
+    def test_when_storing_several_transactions_then_the_transaction_count_is_requested_once(self):
+        """
+        Given a Network instance when storing several transactions then the nonces are reserved
+        locally and the transaction count is requested once
+        """
+
+        self.web3.eth.get_transaction_count = MagicMock(return_value=3)
+        self.network = Network(self.web3)
+        self.network.deploy_contract(True, 'abi', 'byte_code')
+
+        build_transaction = MagicMock()
+        self.web3_contract.functions.addSystemDataRecords = MagicMock(
+            return_value=MagicMock(build_transaction=build_transaction))
+
+        for _ in range(3):
+            self.network.store_system_data_records(
+                [GenericSystemDataRecord(SystemDataRecord())], 16772215)
+
+        self.web3.eth.get_transaction_count.assert_called_once()
+        self.assertEqual([3, 4, 5], [call.args[0]['nonce']
+                                     for call in build_transaction.call_args_list])
+
+    def test_when_storing_sd_records_and_nonce_is_too_low_then_it_is_resynchronized_and_sent_again(self):
+        """
+        Given a Network instance when storing SystemData records and the nonce is too low then the
+        nonces are resynchronized and the transaction is sent again
+        """
+
+        self.web3.eth.get_transaction_count = MagicMock(side_effect=[3, 5])
+        self.web3.eth.send_raw_transaction = MagicMock(
+            side_effect=[Web3RPCError('nonce too low: next nonce 5, tx nonce 3'), 'hash'])
+        self.network = Network(self.web3)
+        self.network.deploy_contract(True, 'abi', 'byte_code')
+
+        build_transaction = MagicMock()
+        self.web3_contract.functions.addSystemDataRecords = MagicMock(
+            return_value=MagicMock(build_transaction=build_transaction))
+
+        success = self.network.store_system_data_records(
+            [GenericSystemDataRecord(SystemDataRecord())], 16772215)
+
+        self.assertTrue(success)
+        self.assertEqual([3, 5], [call.args[0]['nonce']
+                                  for call in build_transaction.call_args_list])
+
+    def test_when_storing_sd_records_and_the_receipt_times_out_then_the_transaction_is_sent_again(self):
+        """
+        Given a Network instance when storing SystemData records and the receipt times out while
+        the nonce is not mined then the same signed transaction is sent again
+        """
+
+        self.web3.eth.get_transaction_count = MagicMock(return_value=3)
+        self.web3.eth.account.sign_transaction = MagicMock(
+            return_value=MagicMock(raw_transaction=b'\x01'))
+        self.network = Network(self.web3)
+        self.network.deploy_contract(True, 'abi', 'byte_code')
+
+        self.web3.eth.send_raw_transaction = MagicMock(
+            side_effect=['hash', Web3RPCError('already known')])
+        self.web3.eth.wait_for_transaction_receipt = MagicMock(
+            side_effect=[TimeExhausted(), self.tx_receipt])
+
+        with self.assertLogs(self.__logger, level='WARNING'):
+            success = self.network.store_system_data_records(
+                [GenericSystemDataRecord(SystemDataRecord())], 16772215)
+
+        self.assertTrue(success)
+        self.assertEqual(
+            [((b'\x01',),)] * 2, self.web3.eth.send_raw_transaction.call_args_list)
+
+    def test_when_storing_sd_records_and_the_transaction_is_never_mined_then_an_exception_raises(self):
+        """
+        Given a Network instance when storing SystemData records and the transaction is not mined
+        after max_resubmissions then TimeExhausted raises and the nonces are resynchronized
+        """
+
+        Config().set_property(ConfigKeys.MAX_RESUBMISSIONS, 2, ConfigCategories.PIPELINE)
+        self.web3.eth.get_transaction_count = MagicMock(return_value=3)
+        self.network = Network(self.web3)
+        self.network.deploy_contract(True, 'abi', 'byte_code')
+
+        self.web3.eth.wait_for_transaction_receipt = MagicMock(side_effect=TimeExhausted())
+
+        with self.assertLogs(self.__logger, level='ERROR'):
+            with self.assertRaises(TimeExhausted):
+                self.network.store_system_data_records(
+                    [GenericSystemDataRecord(SystemDataRecord())], 16772215)
+
+        self.assertEqual(3, self.web3.eth.send_raw_transaction.call_count)
+        self.assertEqual(
+            'pending', self.web3.eth.get_transaction_count.call_args.args[1])
+
+    def test_when_storing_sd_records_and_pipeline_is_enabled_then_the_receipt_is_not_waited(self):
+        """
+        Given a Network instance with the pipeline enabled when storing SystemData records then
+        the transaction is submitted to the pipeline without waiting for its receipt
+        """
+
+        Config().set_property(ConfigKeys.ENABLED, True, ConfigCategories.PIPELINE)
+        self.web3.eth.get_transaction_count = MagicMock(return_value=3)
+        self.web3.provider.make_batch_request = MagicMock(
+            side_effect=[[{'result': '0x1'}], [{'result': {'status': '0x1'}}]])
+        self.web3.eth.account.sign_transaction = MagicMock(
+            return_value=MagicMock(raw_transaction=b'\x01'))
+        self.network = Network(self.web3)
+        self.network.deploy_contract(True, 'abi', 'byte_code')
+
+        stored = []
+        success = self.network.store_system_data_records(
+            [GenericSystemDataRecord(SystemDataRecord())], 16772215, stored.append)
+
+        self.assertTrue(success)
+        self.assertTrue(self.network.is_pipelined())
+        self.assertTrue(self.network.wait_for_pending_transactions(5))
+        self.assertEqual([True], stored)
+        self.web3.eth.wait_for_transaction_receipt.assert_not_called()
+
     def test_when_getting_sd_records_by_timestamp_and_web3_attribute_error_except_is_thrown_then_it_is_logged(self):
         """
         Given a Network instance when getting SystemData records by timestamp and Web3AttributeError exception is
@@ -673,6 +798,263 @@ class GivenANetwork(TestCase):
         self.assertEqual(
             1729062295, overview_data_record[OverviewDataFields.FIELD_FIN_T])
 
+    def test_when_getting_logged_sd_records_then_the_logs_are_read_in_chunks_of_blocks(self):
+        """
+        Given a Network instance with the event log enabled when getting the logged SystemData
+        records then the logs are read in chunks of block_range blocks and a rejected chunk is split
+        """
+
+        Config().set_property(ConfigKeys.ENABLED, True, ConfigCategories.EVENT_LOG)
+        Config().set_property(ConfigKeys.BLOCK_RANGE, 10, ConfigCategories.EVENT_LOG)
+
+        system_data_record = SystemDataRecord()
+        system_data_record[SystemDataFields.FIELD_SYS_T] = 2000005
+        system_data_record[SystemDataFields.FIELD_BAT_L] = 30
+        log = {'data': encode_system_data_contract_tuple(
+            from_record_to_contract_tuple(GenericSystemDataRecord(system_data_record)))}
+
+        self.web3_contract.functions.getFirstLogBlock().call = MagicMock(return_value=1)
+        self.web3.eth.block_number = 25
+        self.web3.eth.get_logs = MagicMock(side_effect=[
+            Web3RPCError('query returned more than 10000 results'), [log], [], [], []])
+
+        self.network = Network(self.web3)
+        self.network.deploy_contract(True, 'abi', 'byte_code')
+
+        system_data_records = self.network.get_logged_system_data_records(2, 2)
+
+        self.assertTrue(self.network.is_event_log())
+        self.assertEqual(
+            [30], [record[SystemDataFields.FIELD_BAT_L] for record in system_data_records])
+        self.assertEqual(
+            [(1, 10), (1, 5), (6, 10), (11, 20), (21, 25)],
+            [(call.args[0]['fromBlock'], call.args[0]['toBlock'])
+             for call in self.web3.eth.get_logs.call_args_list])
+        self.assertEqual(
+            ['0x' + (2).to_bytes(32, 'big').hex()],
+            self.web3.eth.get_logs.call_args.args[0]['topics'][1])
+
+    def test_when_getting_sd_records_with_the_read_cache_then_they_are_read_once(self):
+        """
+        Given a Network instance with the read cache enabled when getting the SystemData records of
+        a bucket then they are read once for each block, pinned to it, while the black box is live,
+        and only once after it is finalized
+        """
+
+        Config().set_property(ConfigKeys.ENABLED, True, ConfigCategories.READ_CACHE)
+        Config().set_property(ConfigKeys.MAX_BYTES, 1000000, ConfigCategories.READ_CACHE)
+        Config().set_property(ConfigKeys.PATH, None, ConfigCategories.READ_CACHE)
+        Config().set_property(
+            ConfigKeys.FINALIZATION_CHECK_INTERVAL, 0, ConfigCategories.READ_CACHE)
+
+        system_data_record = SystemDataRecord()
+        system_data_record[SystemDataFields.FIELD_SYS_T] = 2000005
+        system_data_record[SystemDataFields.FIELD_BAT_L] = 30
+        contract_tuple = tuple(from_record_to_contract_tuple(
+            GenericSystemDataRecord(system_data_record)).values())
+
+        self.web3_contract.functions.getOverviewDataRecord().call = MagicMock(
+            side_effect=lambda block_identifier=None: (
+                (0, 0, 0, 0) if block_identifier == 25 else (1741007821, 1, 2, 3)))
+        get_records_call = MagicMock(return_value=[contract_tuple])
+        self.web3_contract.functions.getSystemDataRecordsByTimestamp().call = get_records_call
+
+        self.network = Network(self.web3)
+        self.network.deploy_contract(True, 'abi', 'byte_code')
+
+        pages = []
+        for block_number in (25, 25, 26, 26, 27):
+            self.web3.eth.block_number = block_number
+            pages.append(self.network.get_system_data_records_by_timestamp(2))
+
+        self.assertEqual(
+            [[30]] * 5,
+            [[record[SystemDataFields.FIELD_BAT_L] for record in page] for page in pages])
+        self.assertEqual(
+            [{'block_identifier': 25}, {}],
+            [call.kwargs for call in get_records_call.call_args_list])
+        self.assertEqual(
+            1741007821,
+            self.network.get_overview_data_record()[CommonDataFields.FIELD_REC_T])
+        self.assertEqual(
+            2, self.web3_contract.functions.getOverviewDataRecord().call.call_count)
+
+    def test_when_the_black_box_is_live_then_its_finalization_is_checked_once_per_interval(self):
+        """
+        Given a Network instance with the read cache enabled when reading from a live black box
+        then the latest block number and the Overview Data record are only requested once within
+        the finalization check interval, and the reads stay pinned to that block until this
+        Network confirms a transaction
+        """
+
+        Config().set_property(ConfigKeys.ENABLED, True, ConfigCategories.READ_CACHE)
+        Config().set_property(ConfigKeys.MAX_BYTES, 1000000, ConfigCategories.READ_CACHE)
+        Config().set_property(ConfigKeys.PATH, None, ConfigCategories.READ_CACHE)
+        Config().set_property(
+            ConfigKeys.FINALIZATION_CHECK_INTERVAL, 3600, ConfigCategories.READ_CACHE)
+
+        block_number = PropertyMock(side_effect=[25, 26, 27])
+        type(self.web3.eth).block_number = block_number
+        self.web3_contract.functions.getOverviewDataRecord().call = MagicMock(
+            return_value=(0, 0, 0, 0))
+        get_records_call = MagicMock(return_value=[])
+        self.web3_contract.functions.getSystemDataRecordsByTimestamp().call = get_records_call
+
+        self.network = Network(self.web3)
+        self.network.deploy_contract(True, 'abi', 'byte_code')
+
+        for _ in range(3):
+            self.network.get_system_data_records_by_timestamp(2)
+
+        self.assertEqual(1, block_number.call_count)
+        self.assertEqual(
+            1, self.web3_contract.functions.getOverviewDataRecord().call.call_count)
+
+        self.network.store_system_data_records(
+            [GenericSystemDataRecord(SystemDataRecord())], 16772215)
+        self.network.get_system_data_records_by_timestamp(2)
+
+        self.assertEqual(2, block_number.call_count)
+        self.assertEqual(
+            [{'block_identifier': 25}, {'block_identifier': 26}],
+            [call.kwargs for call in get_records_call.call_args_list])
+
+    def test_when_getting_sd_records_timestamps_then_they_are_unique_and_sorted(self):
+        """
+        Given a Network instance when getting the SystemData records timestamps then they are
+        unique and sorted, both if the contract keys are and if they are repeated
+        """
+
+        self.network.deploy_contract(True, 'abi', 'byte_code')
+
+        for keys in ([1, 2, 5], [2, 1, 1, 5, 2]):
+            self.web3_contract.functions.getSystemDataRecordKeys().call = MagicMock(
+                return_value=keys)
+
+            self.assertEqual([1, 2, 5], self.network.get_system_data_records_timestamps())
+
+    def test_when_getting_sd_timestamps_with_the_key_cache_then_only_new_keys_are_fetched(self):
+        """
+        Given a Network instance with the key cache when getting the SystemData records timestamps
+        then only the keys added since the previous call are fetched and the range is filtered
+        """
+
+        keys = [1, 2, 5]
+        self.web3_contract.functions.getSystemDataRecordKeysCount().call = MagicMock(
+            side_effect=lambda: len(keys))
+        self.web3_contract.functions.getSystemDataRecordKeysFrom = MagicMock(
+            side_effect=lambda index, limit: MagicMock(
+                call=MagicMock(return_value=keys[index:index + limit])))
+
+        self.network.deploy_contract(
+            True, [{'name': 'getSystemDataRecordKeysCount'},
+                   {'name': 'getSystemDataRecordKeysFrom'}], 'byte_code')
+
+        self.assertEqual([2, 5], self.network.get_system_data_records_timestamps(2, 6))
+
+        keys.extend([7, 6])
+
+        self.assertEqual([2, 5, 6], self.network.get_system_data_records_timestamps(2, 6))
+        self.assertEqual([1, 2, 5, 6, 7], self.network.get_system_data_records_timestamps())
+        self.assertEqual(
+            [(0, 4096), (3, 4096)],
+            [call.args for call in
+             self.web3_contract.functions.getSystemDataRecordKeysFrom.call_args_list])
+
+    def test_when_the_key_cache_does_not_match_the_contract_keys_then_it_is_rebuilt(self):
+        """
+        Given a Network instance with a key cache file when the contract has fewer keys than the
+        cache, or other first keys, then the cache is discarded and the keys are fetched again
+        """
+
+        for contract_keys in ([3], [4, 6, 8]):
+            with self.subTest(contract_keys=contract_keys), tempfile.TemporaryDirectory() as directory:
+                Config().set_property(ConfigKeys.ENABLED, True, ConfigCategories.KEY_CACHE)
+                Config().set_property(
+                    ConfigKeys.PATH, os.path.join(directory, 'keys.bin'), ConfigCategories.KEY_CACHE)
+
+                keys = [1, 2, 5]
+                self.web3_contract.functions.getSystemDataRecordKeysCount().call = MagicMock(
+                    side_effect=lambda: len(keys))
+                self.web3_contract.functions.getSystemDataRecordKeysFrom = MagicMock(
+                    side_effect=lambda index, limit: MagicMock(
+                        call=MagicMock(return_value=keys[index:index + limit])))
+
+                abi = [{'name': 'getSystemDataRecordKeysCount'},
+                       {'name': 'getSystemDataRecordKeysFrom'}]
+
+                self.network = Network(self.web3)
+                self.network.deploy_contract(True, abi, 'byte_code')
+
+                self.assertEqual([1, 2, 5], self.network.get_system_data_records_timestamps())
+
+                keys = contract_keys
+
+                self.network = Network(self.web3)
+                self.network.deploy_contract(True, abi, 'byte_code')
+
+                with self.assertLogs(self.__logger, level='WARNING'):
+                    self.assertEqual(
+                        sorted(contract_keys), self.network.get_system_data_records_timestamps())
+
+    def test_when_iterating_sd_records_in_range_then_the_cursor_is_walked_until_the_keys_end(self):
+        """
+        Given a Network instance with the range query when iterating the SystemData records in a
+        range then the cursor is walked until the keys are exhausted, or until the keys count if the
+        contract has it, the limit is halved when a call is rejected and each bucket is returned
+        once
+        """
+
+        keys = [1, 1, 2, 5, 2, 3]
+        buckets = {}
+        for bucket in set(keys):
+            system_data_record = SystemDataRecord()
+            system_data_record[SystemDataFields.FIELD_SYS_T] = bucket * 1000000 + 1
+            system_data_record[SystemDataFields.FIELD_BAT_L] = bucket
+            buckets[bucket] = [tuple(from_record_to_contract_tuple(
+                GenericSystemDataRecord(system_data_record)).values())]
+
+        def get_system_data_records_in_range(min_timestamp, max_timestamp, cursor, limit):
+            if limit > 2:
+                raise Web3RPCError('out of gas')
+
+            end = min(cursor + limit, len(keys))
+            page_buckets = []
+            for bucket in keys[cursor:end]:
+                if min_timestamp <= bucket <= max_timestamp and bucket not in page_buckets:
+                    page_buckets.append(bucket)
+
+            return MagicMock(call=MagicMock(return_value=(
+                [contract_tuple for bucket in page_buckets for contract_tuple in buckets[bucket]],
+                end)))
+
+        self.web3_contract.functions.getSystemDataRecordsInRange = MagicMock(
+            side_effect=get_system_data_records_in_range)
+
+        self.network.deploy_contract(True, [{'name': 'getSystemDataRecordsInRange'}], 'byte_code')
+
+        pages = list(self.network.iter_system_data_records_in_range(1, 3))
+
+        self.web3_contract.functions.getSystemDataRecordKeysCount().call = MagicMock(
+            return_value=len(keys))
+        self.network.deploy_contract(
+            True, [{'name': 'getSystemDataRecordsInRange'}, {'name': 'getSystemDataRecordKeysCount'}],
+            'byte_code')
+
+        self.assertEqual(
+            pages, list(self.network.iter_system_data_records_in_range(1, 3)))
+
+        self.assertTrue(self.network.is_range_query())
+        self.assertEqual(
+            [[1], [2], [3]],
+            [[record[SystemDataFields.FIELD_BAT_L] for record in page] for page in pages])
+        self.assertEqual(
+            [(0, 256), (0, 128), (0, 64), (0, 32), (0, 16), (0, 8), (0, 4), (0, 2), (2, 2), (4, 2),
+             (6, 2),
+             (0, 256), (0, 128), (0, 64), (0, 32), (0, 16), (0, 8), (0, 4), (0, 2), (2, 2), (4, 2)],
+            [call.args[2:] for call in
+             self.web3_contract.functions.getSystemDataRecordsInRange.call_args_list])
+
     def test_when_estimating_gas_then_it_is_returned(self):
         self.network.deploy_contract(True, 'abi', 'byte_code')
 
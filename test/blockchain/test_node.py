@@ -7,7 +7,9 @@ Node tests.
 
 import logging
 import os
-from zlib import decompress
+import tempfile
+import time
+import zlib
 
 from test.config.config_test_helper import ConfigTestHelper
 from unittest import TestCase
@@ -19,6 +21,11 @@ from bcubed.records.fields.id_uint8_value_string_field import IdUint8ValueString
 from bcubed.blockchain.contract import Contract
 from bcubed.blockchain.network import Network
 from bcubed.blockchain.node import Node
+from bcubed.blockchain.sample_packer import SamplePacker
+from bcubed.blockchain.system_data_record_spool import SystemDataRecordSpool
+from bcubed.config.config import Config
+from bcubed.constants.config.config_categories import ConfigCategories
+from bcubed.constants.config.config_keys import ConfigKeys
 from bcubed.constants.records.fields.common_data_fields import CommonDataFields
 from bcubed.constants.records.fields.id_value_fields import IdValueFields
 from bcubed.constants.records.fields.system_data_fields import SystemDataFields
@@ -28,10 +35,22 @@ from bcubed.records.system_data_record import SystemDataRecord
 from bcubed.records.fields.id_uint8_value_array_uint16_field import IdUint8ValueArrayUint16Field
 from bcubed.records.meta_data_record import MetaDataRecord
 from bcubed.records.overview_data_record import OverviewDataRecord
+from bcubed.utilities.compression_help import (
+    compress_value,
+    compression_dictionary_scope,
+    decompress_value,
+    parse_chunk_value
+)
+from bcubed.utilities.encoding_help import get_encoded_size
+from bcubed.utilities.merkle_help import verify_inclusion_proof
+from bcubed.utilities.parse_help import (
+    from_contract_tuple_to_system_data_records,
+    from_record_to_contract_tuple
+)
 
 
 CLASS_PATH = 'bcubed.blockchain.node'
-LIMIT_INDIVIDUAL_SIZE = 25000
+LIMIT_CHUNK_SIZE = 15000
 
 
 class GivenANode(TestCase):
@@ -75,6 +94,7 @@ class GivenANode(TestCase):
             return_value=overview_data_record)
 
         self.network.deploy_contract = MagicMock()
+        self.network.get_compression_dictionaries = MagicMock(return_value=[])
 
         self.network.get_initial_timestamp = MagicMock(return_value=1729062217)
         self.network.get_final_timestamp = MagicMock(return_value=1729062317)
@@ -216,7 +236,8 @@ class GivenANode(TestCase):
 
     def test_when_splitting_system_data_record_then_the_split_records_are_correct(self):
         """
-        Given a Node when splitting a SystemData record, then the split records are correct
+        Given a Node when splitting a SystemData record, then the split records are correct, each
+        one is under the chunk size and they are joined into the original record
         """
 
         huge_record = ("a" * 10000000) + ("b" * 5000000) + ("c" * 10000000)
@@ -226,52 +247,100 @@ class GivenANode(TestCase):
             {IdValueFields.FIELD_ID: 1, IdValueFields.FIELD_VALUE: huge_record})
 
         generic_sd_record = GenericSystemDataRecord(sd_record)
-        record_size = generic_sd_record.get_size()
-
-        chunk_length = (
-            (record_size // (LIMIT_INDIVIDUAL_SIZE - 10000)) + 1) * 2
-
-        split_records = self.node.split_system_data_record(
-            generic_sd_record, chunk_length)
-
-        self.assertEqual(chunk_length, len(split_records))
-
-        self.assertEqual(generic_sd_record[SystemDataFields.FIELD_SYS_T],
-                         split_records[0][SystemDataFields.FIELD_SYS_T])
-        self.assertEqual(generic_sd_record[SystemDataFields.FIELD_SYS_T],
-                         split_records[1][SystemDataFields.FIELD_SYS_T])
-        self.assertEqual(generic_sd_record[SystemDataFields.FIELD_SYS_T],
-                         split_records[2][SystemDataFields.FIELD_SYS_T])
-        self.assertEqual(generic_sd_record[SystemDataFields.FIELD_SYS_T],
-                         split_records[3][SystemDataFields.FIELD_SYS_T])
-
-        self.assertEqual(generic_sd_record[GenericSystemDataFields.FIELD_ID_TWO],
-                         split_records[0][GenericSystemDataFields.FIELD_ID_TWO])
-        self.assertEqual(generic_sd_record[GenericSystemDataFields.FIELD_ID_TWO],
-                         split_records[1][GenericSystemDataFields.FIELD_ID_TWO])
-        self.assertEqual(generic_sd_record[GenericSystemDataFields.FIELD_ID_TWO],
-                         split_records[2][GenericSystemDataFields.FIELD_ID_TWO])
-        self.assertEqual(generic_sd_record[GenericSystemDataFields.FIELD_ID_TWO],
-                         split_records[3][GenericSystemDataFields.FIELD_ID_TWO])
-
-        self.assertNotEqual(generic_sd_record[GenericSystemDataFields.FIELD_VALUE_TWO],
-                            split_records[0][GenericSystemDataFields.FIELD_VALUE_TWO])
-        self.assertNotEqual(generic_sd_record[GenericSystemDataFields.FIELD_VALUE_TWO],
-                            split_records[1][GenericSystemDataFields.FIELD_VALUE_TWO])
-        self.assertNotEqual(generic_sd_record[GenericSystemDataFields.FIELD_VALUE_TWO],
-                            split_records[2][GenericSystemDataFields.FIELD_VALUE_TWO])
-        self.assertNotEqual(generic_sd_record[GenericSystemDataFields.FIELD_VALUE_TWO],
-                            split_records[3][GenericSystemDataFields.FIELD_VALUE_TWO])
-
-        complete_value = decompress(split_records[0][GenericSystemDataFields.FIELD_VALUE_TWO]).decode()[2:] + \
-            decompress(
-                split_records[1][GenericSystemDataFields.FIELD_VALUE_TWO]).decode()[2:] + \
-            decompress(
-                split_records[2][GenericSystemDataFields.FIELD_VALUE_TWO]).decode()[2:] + \
-            decompress(
-                split_records[3][GenericSystemDataFields.FIELD_VALUE_TWO]).decode()[2:]
-
-        self.assertEqual(huge_record, complete_value)
+
+        split_records = self.node.split_system_data_record(generic_sd_record)
+
+        self.assertLess(1, len(split_records))
+
+        contract_tuples = [tuple(from_record_to_contract_tuple(record).values())
+                           for record in split_records]
+
+        for record in split_records:
+            self.assertEqual(generic_sd_record[SystemDataFields.FIELD_SYS_T],
+                             record[SystemDataFields.FIELD_SYS_T])
+            self.assertEqual(generic_sd_record[GenericSystemDataFields.FIELD_ID_TWO],
+                             record[GenericSystemDataFields.FIELD_ID_TWO])
+            self.assertGreaterEqual(
+                LIMIT_CHUNK_SIZE, get_encoded_size(from_record_to_contract_tuple(record)))
+
+        self.assertEqual(
+            generic_sd_record[GenericSystemDataFields.FIELD_VALUE_TWO],
+            b''.join(parse_chunk_value(record[GenericSystemDataFields.FIELD_VALUE_TWO])[3]
+                     for record in split_records))
+
+        system_data_records = from_contract_tuple_to_system_data_records(
+            list(reversed(contract_tuples)))
+
+        self.assertEqual(1, len(system_data_records))
+        self.assertEqual(
+            huge_record,
+            system_data_records[0][SystemDataFields.FIELD_SYS_X][IdValueFields.FIELD_VALUE])
+
+        with self.assertLogs('bcubed.utilities.parse_help', logging.WARNING) as logs:
+            self.assertEqual(
+                [], from_contract_tuple_to_system_data_records(contract_tuples[1:]))
+
+        self.assertIn("Missing chunks: [0]", logs.output[0])
+
+        raw_fragments = from_contract_tuple_to_system_data_records(contract_tuples, True)
+
+        self.assertEqual(len(split_records), len(raw_fragments))
+        self.assertEqual(
+            [record[GenericSystemDataFields.FIELD_VALUE_TWO] for record in split_records],
+            [record[GenericSystemDataFields.FIELD_VALUE_TWO] for record in raw_fragments])
+
+    def test_when_reading_legacy_split_records_then_they_are_reassembled(self):
+        """
+        Given a Node when reading the legacy zlib records split with the index prefix then the
+        fragments of each record are reassembled, in parallel, and a single fragment is returned as
+        it is. The values with the encoding header that start with the index prefix are not joined
+        """
+
+        contract_tuples = []
+        for sys_t in range(1, 11):
+            for index, part in [(1, f"world{sys_t}"), (0, "hello ")]:
+                contract_tuples.append(
+                    (1, sys_t, SystemDataFields.FIELD_SYS_X, b'', 1,
+                     zlib.compress(f"{index};{part}".encode()), 0, b'', b'', b''))
+
+        contract_tuples.append(
+            (1, 11, SystemDataFields.FIELD_SYS_X, b'', 1, zlib.compress(b"0;alone"), 0, b'', b'',
+             b''))
+
+        for value in ("0;user", "1;string"):
+            contract_tuples.append(
+                (1, 12, SystemDataFields.FIELD_SYS_X, b'', 1, compress_value(value), 0, b'', b'',
+                 b''))
+
+        system_data_records = from_contract_tuple_to_system_data_records(contract_tuples)
+
+        self.assertEqual(
+            [f"hello world{sys_t}" for sys_t in range(1, 11)] + ["0;alone", "0;user", "1;string"],
+            [record[SystemDataFields.FIELD_SYS_X][IdValueFields.FIELD_VALUE]
+             for record in system_data_records])
+
+        self.assertEqual(
+            len(contract_tuples), len(from_contract_tuple_to_system_data_records(contract_tuples, True)))
+
+    def test_when_reading_legacy_split_records_with_the_same_key_then_they_are_not_joined(self):
+        """
+        Given a Node when reading two legacy split records with the same sysT and field then their
+        chunks are returned as they are, since they cannot be told apart, and a warning is logged
+        """
+
+        parts = ["0;hello ", "1;world", "0;good", "1;bye"]
+        contract_tuples = [
+            (1, 1, SystemDataFields.FIELD_SYS_X, b'', 1, zlib.compress(part.encode()), 0, b'', b'',
+             b'') for part in parts]
+
+        with self.assertLogs('bcubed.utilities.parse_help', logging.WARNING) as logs:
+            system_data_records = from_contract_tuple_to_system_data_records(contract_tuples)
+
+        self.assertIn("Chunks: 4", logs.output[0])
+        self.assertEqual(
+            parts,
+            [record[SystemDataFields.FIELD_SYS_X][IdValueFields.FIELD_VALUE]
+             for record in system_data_records])
 
     def test_when_storing_system_data_records_with_four_values_then_it_returns_true(self):
         """
@@ -330,6 +399,72 @@ class GivenANode(TestCase):
         self.assertEqual(list, type(system_data_records_by_timestamp))
         self.assertEqual(0, len(system_data_records_by_timestamp))
 
+    def test_when_getting_sd_records_by_timestamp_with_range_query_then_the_pages_are_joined(self):
+        """
+        Given a Node whose contract has the range query when getting SystemData records by
+        timestamp then the pages of the range query are joined, without one call per timestamp
+        """
+
+        pages = [[SystemDataRecord(), SystemDataRecord()], [SystemDataRecord()]]
+        self.network.is_range_query = MagicMock(return_value=True)
+        self.network.iter_system_data_records_in_range = MagicMock(return_value=iter(pages))
+
+        self.assertEqual(
+            pages, list(self.node.iter_system_data_records_by_timestamp(1742384883, 1742384885)))
+
+        self.network.iter_system_data_records_in_range = MagicMock(return_value=iter(pages))
+
+        self.assertEqual(
+            3, len(self.node.get_system_data_records_by_timestamp(1742384883, 1742384885)))
+        self.network.get_system_data_records_timestamps.assert_not_called()
+        self.network.get_system_data_records_by_timestamp.assert_not_called()
+
+    def test_when_getting_merged_system_data_records_then_the_fields_are_merged_by_sys_t(self):
+        """
+        Given a Node when getting the merged SystemData records by timestamp then the records are
+        merged by sysT, within the tolerance, into records and table rows with all their fields
+        """
+
+        contract_tuples = [
+            (1, 1000010, SystemDataFields.FIELD_BAT_L, compress_value("49"),
+             0, b'', 0, b'', b'', b''),
+            (1, 1000000, SystemDataFields.FIELD_SYS_X, b'',
+             1, compress_value("value"), 0, b'', b'', b''),
+            (1, 1000000, SystemDataFields.FIELD_BAT_L, compress_value("50"),
+             0, b'', 0, b'', b'', b''),
+            (1, 1000002, SystemDataFields.FIELD_TXT_C, compress_value("text"),
+             0, b'', 0, b'', b'', b'')
+        ]
+
+        self.network.get_system_data_records_by_timestamp = MagicMock(
+            side_effect=lambda _, raw_fragments, compact: from_contract_tuple_to_system_data_records(
+                contract_tuples, raw_fragments, compact))
+
+        for compact in (False, True):
+            merged_records = self.node.get_merged_system_data_records_by_timestamp(
+                1742384883, 1742384885, 5, compact)
+
+            self.assertEqual([1000000, 1000010],
+                             [record[SystemDataFields.FIELD_SYS_T] for record in merged_records])
+            self.assertEqual([50, 49],
+                             [record[SystemDataFields.FIELD_BAT_L] for record in merged_records])
+            self.assertEqual(["text", ""],
+                             [record[SystemDataFields.FIELD_TXT_C] for record in merged_records])
+            self.assertEqual(
+                "value", merged_records[0][SystemDataFields.FIELD_SYS_X][IdValueFields.FIELD_VALUE])
+            self.assertEqual(0, merged_records[1][SystemDataFields.FIELD_SYS_X][IdValueFields.FIELD_ID])
+            self.assertEqual(8, merged_records[0][CommonDataFields.FIELD_FIE_N])
+
+        table = self.node.get_system_data_table_by_timestamp(1742384883, 1742384885)
+
+        self.assertEqual({
+            SystemDataFields.FIELD_SYS_T: [1000000, 1000002, 1000010],
+            SystemDataFields.FIELD_BAT_L: [50, None, 49],
+            SystemDataFields.FIELD_SYS_X: {IdValueFields.FIELD_ID: [1, None, None],
+                                           IdValueFields.FIELD_VALUE: ["value", None, None]},
+            SystemDataFields.FIELD_TXT_C: [None, "text", None]
+        }, table)
+
     def test_when_storing_overview_data_record_then_it_returns_true(self):
         """
         Given a Node when storing OverviewDataRecord then it returns True
@@ -365,6 +500,599 @@ class GivenANode(TestCase):
                 log.output[0],
                 'INFO:' + CLASS_PATH + ':Storing remaining SD records. Records: 5. Estimated gas: 100000')
 
+    def test_when_flushing_node_then_the_buffered_records_are_stored_and_callbacks_notified(self):
+        """
+        Given a Node when flushing then the buffered SystemData records are stored and the
+        callbacks are notified
+        """
+
+        self.network.get_estimated_gas = MagicMock(return_value=20000)
+
+        stored = []
+        for _ in range(3):
+            self.node.store_system_data_record(SystemDataRecord(), stored.append)
+
+        self.assertEqual([], stored)
+
+        self.assertTrue(self.node.flush())
+
+        self.network.store_system_data_records.assert_called_once()
+        self.assertEqual(
+            3, len(self.network.store_system_data_records.call_args[0][0]))
+        self.assertEqual([True, True, True], stored)
+
+    def test_when_transaction_fails_then_the_callbacks_are_notified_with_false(self):
+        """
+        Given a Node when the transaction fails then the callbacks are notified with False
+        """
+
+        self.network.get_estimated_gas = MagicMock(return_value=20000)
+        self.network.store_system_data_records = MagicMock(return_value=False)
+
+        stored = []
+        self.node.store_system_data_record(SystemDataRecord(), stored.append)
+
+        self.assertFalse(self.node.flush())
+        self.assertEqual([False], stored)
+
+    def test_when_record_is_not_stored_then_the_callback_is_notified_with_false(self):
+        """
+        Given a Node when the SystemData record cannot be stored then the callback is notified
+        with False
+        """
+
+        self.network.get_estimated_gas = MagicMock(return_value=0)
+
+        stored = []
+        with self.assertLogs(self.__logger, level="CRITICAL"):
+            self.node.store_system_data_record(SystemDataRecord(), stored.append)
+
+        self.assertEqual([False], stored)
+
+    def test_when_a_split_record_chunk_is_not_stored_then_the_callback_is_notified_once(self):
+        """
+        Given a Node when the second chunk of a split SystemData record cannot be stored then the
+        callback is notified once with False, also after the first chunk is stored
+        """
+
+        estimations = []
+
+        def get_estimated_gas(_contract_tuples):
+            estimations.append(True)
+
+            return 0 if len(estimations) == 2 else 20000
+
+        self.network.get_estimated_gas = MagicMock(side_effect=get_estimated_gas)
+
+        sd_record = SystemDataRecord()
+        sd_record[SystemDataFields.FIELD_SYS_X] = IdUint8ValueStringField(
+            {IdValueFields.FIELD_ID: 1, IdValueFields.FIELD_VALUE: os.urandom(20000).hex()})
+
+        stored = []
+        with self.assertLogs(self.__logger, level="CRITICAL"):
+            self.assertFalse(self.node.store_system_data_record(sd_record, stored.append))
+
+        self.assertEqual([], stored)
+
+        self.node.flush()
+
+        self.network.store_system_data_records.assert_called_once()
+        self.assertEqual([False], stored)
+
+    def test_when_closing_node_context_then_the_remaining_records_are_stored_once(self):
+        """
+        Given a Node when leaving the Node context then the remaining SystemData records are stored
+        and they are not stored again when the Node is deleted
+        """
+
+        self.network.get_estimated_gas = MagicMock(return_value=20000)
+
+        with self.node as node:
+            node.store_system_data_record(SystemDataRecord())
+
+        self.network.store_system_data_records.assert_called_once()
+
+        del self.node
+
+        self.network.store_system_data_records.assert_called_once()
+
+    def test_when_pipelined_transaction_fails_then_it_is_resubmitted_on_flush(self):
+        """
+        Given a pipelined Node when the transaction fails then the batch is resubmitted on flush
+        and the callbacks are notified once it is confirmed
+        """
+
+        confirmations = [False, True]
+
+        def store_system_data_records(_system_data_records, _gas, callback):
+            callback(confirmations.pop(0))
+
+            return True
+
+        self.network.get_estimated_gas = MagicMock(return_value=20000)
+        self.network.is_pipelined = MagicMock(return_value=True)
+        self.network.wait_for_pending_transactions = MagicMock(return_value=True)
+        self.network.store_system_data_records = MagicMock(
+            side_effect=store_system_data_records)
+
+        stored = []
+        self.node.store_system_data_record(SystemDataRecord(), stored.append)
+
+        with self.assertLogs(self.__logger, level="WARNING"):
+            self.assertTrue(self.node.flush())
+
+        self.assertEqual(2, self.network.store_system_data_records.call_count)
+        self.assertEqual([True], stored)
+
+    def test_when_pipelined_transaction_fails_too_many_times_then_callbacks_are_notified_with_false(self):
+        """
+        Given a pipelined Node when the transaction fails more than max_resubmissions times then
+        the callbacks are notified with False and flush returns False
+        """
+
+        def store_system_data_records(_system_data_records, _gas, callback):
+            callback(False)
+
+            return True
+
+        self.network.get_estimated_gas = MagicMock(return_value=20000)
+        self.network.is_pipelined = MagicMock(return_value=True)
+        self.network.wait_for_pending_transactions = MagicMock(return_value=True)
+        self.network.store_system_data_records = MagicMock(
+            side_effect=store_system_data_records)
+
+        stored = []
+        self.node.store_system_data_record(SystemDataRecord(), stored.append)
+
+        with self.assertLogs(self.__logger, level="WARNING"):
+            self.assertFalse(self.node.flush())
+
+        self.assertEqual(4, self.network.store_system_data_records.call_count)
+        self.assertEqual([False], stored)
+
+    def test_when_creating_a_node_with_spooled_records_then_only_the_records_not_stored_are_replayed(self):
+        """
+        Given a Node with spooled records when creating it then the records that are already stored
+        on the blockchain are not replayed and the spool is truncated once the others are stored
+        """
+
+        stored_record = SystemDataRecord()
+        stored_record[SystemDataFields.FIELD_SYS_T] = 1000001
+        stored_record[SystemDataFields.FIELD_BAT_L] = 30
+        stored_contract_tuple = from_record_to_contract_tuple(
+            GenericSystemDataRecord(stored_record))
+
+        pending_record = SystemDataRecord()
+        pending_record[SystemDataFields.FIELD_SYS_T] = 1000002
+        pending_record[SystemDataFields.FIELD_BAT_L] = 40
+        pending_contract_tuple = from_record_to_contract_tuple(
+            GenericSystemDataRecord(pending_record))
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'spool.bin')
+
+            spool = SystemDataRecordSpool(path, 1)
+            spool.append(stored_contract_tuple)
+            spool.append(pending_contract_tuple)
+            spool.close()
+
+            Config().set_property(ConfigKeys.ENABLED, True, ConfigCategories.SPOOL)
+            Config().set_property(ConfigKeys.PATH, path, ConfigCategories.SPOOL)
+
+            self.network.get_estimated_gas = MagicMock(return_value=20000)
+            self.network.get_system_data_contract_tuples_by_timestamp = MagicMock(
+                return_value=[tuple(stored_contract_tuple.values())])
+
+            node = Node(self.network, Contract())
+
+            self.assertTrue(node.close())
+            self.network.get_system_data_contract_tuples_by_timestamp.assert_called_once_with(1)
+            self.network.store_system_data_records.assert_called_once()
+            self.assertEqual(
+                [pending_contract_tuple], self.network.store_system_data_records.call_args[0][0])
+            self.assertEqual(0, os.path.getsize(path))
+
+    def test_when_creating_a_node_with_spooled_samples_already_packed_then_they_are_not_replayed(self):
+        """
+        Given a Node with spooled samples when creating it and their packed record is already
+        stored on the blockchain then they are not replayed, and only the sample that is not stored
+        is
+        """
+
+        sample_packer = SamplePacker(2)
+        sample_contract_tuples = []
+        packed_groups = []
+        for index in range(3):
+            system_data_record = SystemDataRecord()
+            system_data_record[SystemDataFields.FIELD_SYS_T] = 1000001 + index
+            system_data_record[SystemDataFields.FIELD_TMP_V] = IdUint8ValueFloatField(
+                {IdValueFields.FIELD_ID: 1, IdValueFields.FIELD_VALUE: 20.5 + index})
+            generic_sd_record = GenericSystemDataRecord(system_data_record)
+            sample_contract_tuples.append(from_record_to_contract_tuple(generic_sd_record))
+
+            packed_groups.extend(sample_packer.add(system_data_record, generic_sd_record))
+
+        packed_contract_tuple = from_record_to_contract_tuple(packed_groups[0][0])
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'spool.bin')
+
+            spool = SystemDataRecordSpool(path, 1)
+            for sample_contract_tuple in sample_contract_tuples:
+                spool.append(sample_contract_tuple)
+            spool.close()
+
+            Config().set_property(ConfigKeys.ENABLED, True, ConfigCategories.SPOOL)
+            Config().set_property(ConfigKeys.PATH, path, ConfigCategories.SPOOL)
+
+            self.network.get_estimated_gas = MagicMock(return_value=20000)
+            self.network.get_system_data_contract_tuples_by_timestamp = MagicMock(
+                return_value=[tuple(packed_contract_tuple.values())])
+
+            node = Node(self.network, Contract())
+
+            self.assertTrue(node.close())
+            self.network.store_system_data_records.assert_called_once()
+            self.assertEqual(
+                [sample_contract_tuples[2]],
+                self.network.store_system_data_records.call_args[0][0])
+            self.assertEqual(0, os.path.getsize(path))
+
+    def test_when_the_buffer_reaches_max_records_then_the_records_are_stored(self):
+        """
+        Given a Node with a flush max records when the buffer reaches it then the records are
+        stored without waiting for the transaction cap
+        """
+
+        Config().set_property(ConfigKeys.MAX_RECORDS, 2, ConfigCategories.FLUSH)
+        self.network.get_estimated_gas = MagicMock(return_value=20000)
+
+        node = Node(self.network, Contract())
+        for _ in range(5):
+            node.store_system_data_record(SystemDataRecord())
+
+        self.assertEqual(2, self.network.store_system_data_records.call_count)
+        self.assertEqual(
+            2, len(self.network.store_system_data_records.call_args[0][0]))
+
+        node.close()
+
+    def test_when_the_oldest_record_expires_then_the_records_are_stored(self):
+        """
+        Given a Node with a flush max age when the oldest buffered record expires then the records
+        are stored by flush_expired
+        """
+
+        Config().set_property(ConfigKeys.MAX_AGE, 0.01, ConfigCategories.FLUSH)
+        self.network.get_estimated_gas = MagicMock(return_value=20000)
+
+        node = Node(self.network, Contract())
+        node.store_system_data_record(SystemDataRecord())
+
+        time.sleep(0.02)
+
+        self.assertTrue(node.flush_expired())
+        self.network.store_system_data_records.assert_called_once()
+
+        node.close()
+
+    def test_when_the_target_gas_is_shrunk_then_the_batches_are_smaller(self):
+        """
+        Given an adaptive Node when the batches are included slowly then the next batches are cut
+        at the shrunk target gas
+        """
+
+        Config().set_property(ConfigKeys.ADAPTIVE, True, ConfigCategories.FLUSH)
+        Config().set_property(ConfigKeys.TARGET_INCLUSION_TIME, 0.001, ConfigCategories.FLUSH)
+        Config().set_property(ConfigKeys.MIN_TARGET_GAS, 12000000, ConfigCategories.FLUSH)
+
+        def store_system_data_records(*_):
+            time.sleep(0.01)
+
+            return True
+
+        self.network.get_estimated_gas = MagicMock(return_value=5000000)
+        self.network.get_block_fullness = MagicMock(return_value=0.5)
+        self.network.store_system_data_records = MagicMock(
+            side_effect=store_system_data_records)
+
+        node = Node(self.network, Contract())
+        for _ in range(6):
+            node.store_system_data_record(SystemDataRecord())
+
+        # Three records per batch until the first one is included, then two
+        self.assertEqual([3, 2], [len(call.args[0]) for call in
+                                  self.network.store_system_data_records.call_args_list])
+
+        node.close()
+
+    def test_when_packing_is_enabled_then_the_records_fill_fewer_transactions(self):
+        """
+        Given a Node with a packing window when storing records that do not fit in arrival order
+        then they are packed into fewer transactions
+        """
+
+        Config().set_property(ConfigKeys.WINDOW, 2, ConfigCategories.PACKING)
+
+        # Each field has its own shape, so each record is estimated by the network
+        self.network.get_estimated_gas = MagicMock(
+            side_effect=[8000000, 8000000, 7000000, 7000000])
+
+        node = Node(self.network, Contract())
+        for field in [SystemDataFields.FIELD_OPE_S, SystemDataFields.FIELD_RAM_D,
+                      SystemDataFields.FIELD_TXT_C, SystemDataFields.FIELD_TXT_R]:
+            system_data_record = SystemDataRecord()
+            system_data_record[SystemDataFields.FIELD_SYS_T] = 1000000
+            system_data_record[field] = "value"
+
+            node.store_system_data_record(system_data_record)
+
+        self.assertTrue(node.close())
+
+        self.assertEqual(2, self.network.store_system_data_records.call_count)
+        self.assertEqual(
+            [SystemDataFields.FIELD_OPE_S, SystemDataFields.FIELD_TXT_C],
+            [contract_tuple[GenericSystemDataFields.FIELD_NAM_F] for contract_tuple in
+             self.network.store_system_data_records.call_args_list[0].args[0]])
+
+    def test_when_compression_dictionaries_are_enabled_then_the_trained_dictionary_is_stored_and_used(self):
+        """
+        Given a Node with compression dictionaries when storing the sampled records of a field then
+        its dictionary is stored on the blockchain and the next records are compressed with it
+        """
+
+        Config().set_property(ConfigKeys.ENABLED, True, ConfigCategories.COMPRESSION)
+        Config().set_property(ConfigKeys.FIELDS, [SystemDataFields.FIELD_TXT_C],
+                              ConfigCategories.COMPRESSION)
+        Config().set_property(ConfigKeys.SAMPLES, 2, ConfigCategories.COMPRESSION)
+
+        self.network.get_estimated_gas = MagicMock(return_value=20000)
+        self.network.store_compression_dictionary = MagicMock(return_value=True)
+
+        values = ['{"cpu": 12.5, "process": "ros2 launch bcubed", "state": "running"}',
+                  '{"cpu": 13.5, "process": "ros2 launch bcubed", "state": "running"}',
+                  '{"cpu": 14.5, "process": "ros2 launch bcubed", "state": "running"}']
+
+        node = Node(self.network, Contract())
+        for value in values:
+            system_data_record = SystemDataRecord()
+            system_data_record[SystemDataFields.FIELD_SYS_T] = 1000000
+            system_data_record[SystemDataFields.FIELD_TXT_C] = value
+
+            node.store_system_data_record(system_data_record)
+
+        self.assertTrue(node.close())
+
+        self.network.store_compression_dictionary.assert_called_once()
+        self.assertEqual(
+            (0, SystemDataFields.FIELD_TXT_C),
+            self.network.store_compression_dictionary.call_args.args[:2])
+
+        stored_values = [contract_tuple[GenericSystemDataFields.FIELD_VAL_F] for contract_tuple in
+                         self.network.store_system_data_records.call_args.args[0]]
+        self.assertEqual([1, 1, 2], [stored_value[0] for stored_value in stored_values])
+
+        with compression_dictionary_scope("valid_value"):
+            self.assertEqual(
+                values, [decompress_value(stored_value) for stored_value in stored_values])
+
+    def test_when_sample_packing_is_enabled_then_the_samples_are_stored_in_fewer_records(self):
+        """
+        Given a Node with sample packing when storing samples of a numeric field then they are
+        stored in fewer records and all their callbacks are notified
+        """
+
+        Config().set_property(ConfigKeys.SAMPLES, 2, ConfigCategories.PACKING)
+
+        self.network.get_estimated_gas = MagicMock(return_value=20000)
+        callback = MagicMock()
+
+        node = Node(self.network, Contract())
+        for index in range(3):
+            system_data_record = SystemDataRecord()
+            system_data_record[SystemDataFields.FIELD_SYS_T] = 1000000 + index
+            system_data_record[SystemDataFields.FIELD_TMP_V] = IdUint8ValueFloatField(
+                {IdValueFields.FIELD_ID: 1, IdValueFields.FIELD_VALUE: 20.5 + index})
+
+            self.assertTrue(node.store_system_data_record(system_data_record, callback))
+
+        self.assertTrue(node.close())
+
+        self.network.store_system_data_records.assert_called_once()
+        self.assertEqual(
+            2, len(self.network.store_system_data_records.call_args.args[0]))
+        self.assertEqual(3, callback.call_count)
+        callback.assert_called_with(True)
+
+    def test_when_sample_packing_and_spool_are_enabled_then_the_held_samples_are_spooled(self):
+        """
+        Given a Node with sample packing and spool when storing samples of a numeric field then
+        each held sample is spooled, so it is replayed after a crash, and all of them are committed
+        with their packed record
+        """
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'spool.bin')
+
+            Config().set_property(ConfigKeys.SAMPLES, 3, ConfigCategories.PACKING)
+            Config().set_property(ConfigKeys.ENABLED, True, ConfigCategories.SPOOL)
+            Config().set_property(ConfigKeys.PATH, path, ConfigCategories.SPOOL)
+            Config().set_property(ConfigKeys.SYNC_INTERVAL, 1, ConfigCategories.SPOOL)
+
+            self.network.get_estimated_gas = MagicMock(return_value=20000)
+
+            node = Node(self.network, Contract())
+            sample_contract_tuples = []
+            for index in range(2):
+                system_data_record = SystemDataRecord()
+                system_data_record[SystemDataFields.FIELD_SYS_T] = 1000000 + index
+                system_data_record[SystemDataFields.FIELD_TMP_V] = IdUint8ValueFloatField(
+                    {IdValueFields.FIELD_ID: 1, IdValueFields.FIELD_VALUE: 20.5 + index})
+                sample_contract_tuples.append(from_record_to_contract_tuple(
+                    GenericSystemDataRecord(system_data_record)))
+
+                self.assertTrue(node.store_system_data_record(system_data_record))
+
+            spool = SystemDataRecordSpool(path)
+            pending_records = spool.get_pending_records()
+            spool.close()
+
+            self.network.store_system_data_records.assert_not_called()
+            self.assertEqual(
+                sample_contract_tuples,
+                [contract_tuple for _, contract_tuple in pending_records])
+
+            self.assertTrue(node.close())
+
+            self.network.store_system_data_records.assert_called_once()
+            self.assertEqual(
+                1, len(self.network.store_system_data_records.call_args.args[0]))
+            self.assertEqual(0, os.path.getsize(path))
+
+    def test_when_multi_field_is_enabled_then_all_the_fields_of_a_record_are_stored_in_one_entry(self):
+        """
+        Given a Node with multi-field records when storing a record with several fields then they
+        are stored in one contract tuple, which is retrieved as one record with all of them
+        """
+
+        Config().set_property(ConfigKeys.MULTI_FIELD, True, ConfigCategories.PACKING)
+
+        self.network.get_estimated_gas = MagicMock(return_value=20000)
+
+        system_data_record = SystemDataRecord()
+        system_data_record[SystemDataFields.FIELD_SYS_T] = 1000000
+        system_data_record[SystemDataFields.FIELD_BAT_L] = 50
+        system_data_record[SystemDataFields.FIELD_TXT_C] = "text"
+        system_data_record[SystemDataFields.FIELD_TMP_V] = IdUint8ValueFloatField(
+            {IdValueFields.FIELD_ID: 1, IdValueFields.FIELD_VALUE: 20.5})
+        system_data_record[SystemDataFields.FIELD_GYR_V] = IdUint8ValueArrayUint16Field(
+            {IdValueFields.FIELD_ID: 2, IdValueFields.FIELD_VALUE_1: 0,
+             IdValueFields.FIELD_VALUE_2: 0, IdValueFields.FIELD_VALUE_3: 3})
+
+        node = Node(self.network, Contract())
+        self.assertTrue(node.store_system_data_record(system_data_record))
+        self.assertTrue(node.close())
+
+        stored_contract_tuples = self.network.store_system_data_records.call_args.args[0]
+        self.assertEqual(1, len(stored_contract_tuples))
+
+        for compact in (False, True):
+            retrieved_records = from_contract_tuple_to_system_data_records(
+                [tuple(stored_contract_tuples[0].values())], compact=compact)
+
+            self.assertEqual(1, len(retrieved_records))
+            self.assertEqual(system_data_record, retrieved_records[0])
+            self.assertEqual(system_data_record[CommonDataFields.FIELD_FIE_N],
+                             retrieved_records[0][CommonDataFields.FIELD_FIE_N])
+
+    def test_when_storing_system_data_columns_then_the_values_are_stored_as_one_record_each(self):
+        """
+        Given a Node when storing System Data columns then each value is stored as the contract tuple
+        of a SystemDataRecord with only that value, and the callback is notified once
+        """
+
+        self.network.get_estimated_gas = MagicMock(return_value=20000)
+        callback = MagicMock()
+
+        columns = {
+            SystemDataFields.FIELD_SYS_T: [1000000, 1000001],
+            SystemDataFields.FIELD_BAT_L: [50, 49],
+            SystemDataFields.FIELD_TMP_V: {IdValueFields.FIELD_ID: 1,
+                                           IdValueFields.FIELD_VALUE: [20.5, 21]}
+        }
+
+        self.assertTrue(self.node.store_system_data_columns(columns, callback))
+        self.assertTrue(self.node.close())
+
+        expected_contract_tuples = []
+        for index in range(2):
+            system_data_record = SystemDataRecord()
+            system_data_record[SystemDataFields.FIELD_SYS_T] = 1000000 + index
+            system_data_record[SystemDataFields.FIELD_BAT_L] = 50 - index
+            expected_contract_tuples.append(
+                from_record_to_contract_tuple(GenericSystemDataRecord(system_data_record)))
+
+            system_data_record = SystemDataRecord()
+            system_data_record[SystemDataFields.FIELD_SYS_T] = 1000000 + index
+            system_data_record[SystemDataFields.FIELD_TMP_V] = IdUint8ValueFloatField(
+                {IdValueFields.FIELD_ID: 1, IdValueFields.FIELD_VALUE: 20.5 + index / 2})
+            expected_contract_tuples.append(
+                from_record_to_contract_tuple(GenericSystemDataRecord(system_data_record)))
+
+        stored_contract_tuples = self.network.store_system_data_records.call_args.args[0]
+
+        for contract_tuple in expected_contract_tuples + stored_contract_tuples:
+            del contract_tuple[CommonDataFields.FIELD_REC_T]
+
+        self.assertEqual(expected_contract_tuples, stored_contract_tuples)
+        callback.assert_called_once_with(True)
+
+    def test_when_storing_system_data_columns_out_of_range_then_an_exception_raises(self):
+        """
+        Given a Node when storing System Data columns with a value out of range then an exception
+        raises and no value is stored
+        """
+
+        columns = {
+            SystemDataFields.FIELD_SYS_T: [1000000, 1000001],
+            SystemDataFields.FIELD_TCH_S: {IdValueFields.FIELD_ID: 1,
+                                           IdValueFields.FIELD_VALUE: [1, 65536]}
+        }
+
+        with self.assertRaises(ValueError):
+            self.node.store_system_data_columns(columns)
+
+        self.assertTrue(self.node.close())
+
+        self.network.store_system_data_records.assert_not_called()
+
+    def test_when_anchoring_is_enabled_then_only_the_root_is_stored_and_records_are_read_with_proofs(self):
+        """
+        Given a Node with anchoring when storing records then only the Merkle root of the batch is
+        stored on the blockchain, the records are read from the segment store with valid inclusion
+        proofs and a modified segment is not read
+        """
+
+        with tempfile.TemporaryDirectory() as directory:
+            Config().set_property(ConfigKeys.ENABLED, True, ConfigCategories.ANCHORING)
+            Config().set_property(ConfigKeys.PATH, directory, ConfigCategories.ANCHORING)
+
+            self.network.get_estimated_gas = MagicMock(return_value=20000)
+            self.network.store_batch_anchor = MagicMock(return_value=True)
+
+            node = Node(self.network, Contract())
+            for battery_level in [30, 40, 50]:
+                system_data_record = SystemDataRecord()
+                system_data_record[SystemDataFields.FIELD_SYS_T] = 1000000 + battery_level
+                system_data_record[SystemDataFields.FIELD_BAT_L] = battery_level
+
+                node.store_system_data_record(system_data_record)
+
+            self.assertTrue(node.close())
+
+            self.network.store_system_data_records.assert_not_called()
+            root, records_number, min_sys_t, max_sys_t = self.network.store_batch_anchor.call_args.args
+            self.assertEqual((3, 1000030, 1000050), (records_number, min_sys_t, max_sys_t))
+
+            self.network.get_batch_anchors = MagicMock(
+                return_value=[(root, records_number, min_sys_t, max_sys_t)])
+
+            anchored_system_data_records = node.get_anchored_system_data_records(1, 1)
+
+            self.assertEqual(
+                [30, 40, 50],
+                [record[SystemDataFields.FIELD_BAT_L] for record, _ in anchored_system_data_records])
+            self.assertTrue(all(verify_inclusion_proof(inclusion_proof)
+                                for _, inclusion_proof in anchored_system_data_records))
+
+            segment_path = os.path.join(directory, root.hex() + '.seg')
+            with open(segment_path, 'r+b') as file:
+                file.seek(-1, os.SEEK_END)
+                file.write(b'\x01')
+
+            with self.assertLogs(self.__logger, level="CRITICAL"):
+                self.assertEqual([], node.get_system_data_records_by_timestamp(0, 2))
+
     def test_when_creating_a_node_and_contract_is_already_compiled_then_it_is_not_compiled_again(self):
         """
         Given a Node when creating a Node and contract is already compiled then it is not compiled again
@@ -379,6 +1107,7 @@ class GivenANode(TestCase):
         web3.is_connected = MagicMock(return_value=True)
         network.get_contract_address = MagicMock(return_value="valid_value")
         network.deploy_contract = MagicMock()
+        network.get_compression_dictionaries = MagicMock(return_value=[])
 
         contract = Contract()
         contract.compile()
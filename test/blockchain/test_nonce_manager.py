@@ -0,0 +1,116 @@
+"""
+This is a class-containing module.
+
+It contains the GivenANonceManager class, which inherits from TestCase and performs all the
+NonceManager tests.
+"""
+
+import logging
+
+from unittest import TestCase
+from unittest.mock import ANY, MagicMock
+
+from web3.exceptions import Web3RPCError
+
+from bcubed.blockchain.nonce_manager import NonceManager
+
+
+CLASS_PATH = 'bcubed.blockchain.nonce_manager'
+
+
+class GivenANonceManager(TestCase):
+    """
+    It contains the test suite related with NonceManager class.
+    Add tests as required.
+    """
+
+    __logger = logging.getLogger(CLASS_PATH)
+
+    def setUp(self) -> None:
+        self.web3 = MagicMock()
+        self.web3.eth.get_transaction_count = MagicMock(return_value=7)
+
+        self.nonce_manager = NonceManager(self.web3, 'account_address')
+
+        return super().setUp()
+
+    def test_when_reserving_nonces_then_the_network_is_asked_once(self):
+        """
+        Given a NonceManager when reserving nonces then they are consecutive and the network is
+        asked only once
+        """
+
+        nonces = [self.nonce_manager.reserve() for _ in range(3)]
+
+        self.assertEqual([7, 8, 9], nonces)
+        self.web3.eth.get_transaction_count.assert_called_once_with(
+            'account_address', 'pending')
+
+    def test_when_releasing_the_last_nonce_then_it_is_reserved_again(self):
+        """
+        Given a NonceManager when releasing the last reserved nonce then it is reserved again
+        """
+
+        nonce = self.nonce_manager.reserve()
+        self.nonce_manager.release(nonce)
+
+        self.assertEqual(nonce, self.nonce_manager.reserve())
+        self.assertEqual(8, self.nonce_manager.reserve())
+
+    def test_when_releasing_a_nonce_in_the_middle_then_the_gap_is_recovered(self):
+        """
+        Given a NonceManager when releasing a nonce that is not the last one then the gap is
+        recovered by the next reservation
+        """
+
+        first_nonce = self.nonce_manager.reserve()
+        self.nonce_manager.reserve()
+
+        self.nonce_manager.release(first_nonce)
+
+        self.assertEqual(first_nonce, self.nonce_manager.reserve())
+        self.assertEqual(9, self.nonce_manager.reserve())
+
+    def test_when_resynchronizing_then_the_next_nonce_is_the_pending_transaction_count(self):
+        """
+        Given a NonceManager when resynchronizing then the next nonce is the pending transaction
+        count and it is logged
+        """
+
+        self.nonce_manager.reserve()
+        self.nonce_manager.reserve()
+
+        self.web3.eth.get_transaction_count = MagicMock(return_value=8)
+
+        with self.assertLogs(self.__logger, level='WARNING') as log:
+            self.nonce_manager.resync()
+
+            self.assertEqual(
+                log.output[0],
+                'WARNING:' + CLASS_PATH + ':Nonce resynchronized. Previous nonce: 9. Next nonce: 8')
+
+        self.assertEqual(8, self.nonce_manager.reserve())
+
+    def test_when_checking_if_a_nonce_is_mined_then_the_latest_transaction_count_is_used(self):
+        """
+        Given a NonceManager when checking if a nonce is mined then it is mined only if the
+        transaction count at the latest block has passed it
+        """
+
+        self.web3.eth.get_transaction_count = MagicMock(return_value=8)
+
+        self.assertTrue(self.nonce_manager.is_nonce_mined(7))
+        self.assertFalse(self.nonce_manager.is_nonce_mined(8))
+        self.web3.eth.get_transaction_count.assert_called_with(ANY, 'latest')
+
+    def test_when_checking_nonce_errors_then_they_are_detected(self):
+        """
+        Given a NonceManager when checking exceptions then only the nonce errors are detected
+        """
+
+        self.assertTrue(NonceManager.is_nonce_error(
+            Web3RPCError('nonce too low: next nonce 8, tx nonce 7')))
+        self.assertTrue(NonceManager.is_nonce_error(
+            Web3RPCError('Nonce too high. Expected nonce to be 7 but got 9.')))
+        self.assertFalse(NonceManager.is_nonce_error(
+            Web3RPCError('Insufficient funds for gas * price + value')))
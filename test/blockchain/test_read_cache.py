@@ -0,0 +1,87 @@
+"""
+This is a class-containing module.
+
+It contains the GivenAReadCache class, which inherits from TestCase and performs all the
+ReadCache tests.
+"""
+
+import os
+import tempfile
+
+from unittest import TestCase
+
+from bcubed.blockchain.read_cache import OVERVIEW_KEY, ReadCache
+
+
+ADDRESS = '0x' + '01' * 20
+OVERVIEW_CONTRACT_TUPLE = (1741007821, 1, 2, 3)
+
+
+class GivenAReadCache(TestCase):
+    """
+    It contains the test suite related with ReadCache class.
+    Add tests as required.
+    """
+
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+
+        return super().setUp()
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+        return super().tearDown()
+
+    def test_when_the_black_box_is_live_then_the_entries_are_only_returned_for_their_block(self):
+        """
+        Given a ReadCache of a live black box when getting an entry then it is only returned for
+        the block it was read at, and it is not written to the disk tier
+        """
+
+        read_cache = ReadCache(ADDRESS, 1000, self.directory.name)
+
+        read_cache.put('bucket-1', [(1, b'value')], 25)
+
+        self.assertEqual([(1, b'value')], read_cache.get('bucket-1', 25))
+        self.assertIsNone(read_cache.get('bucket-1', 26))
+        self.assertEqual([], os.listdir(os.path.join(self.directory.name, ADDRESS)))
+
+    def test_when_the_black_box_is_finalized_then_the_entries_are_read_from_the_disk_tier(self):
+        """
+        Given a ReadCache of a finalized black box when creating another one then it is finalized
+        and the entries are read from the disk tier
+        """
+
+        read_cache = ReadCache(ADDRESS, 1000, self.directory.name)
+        read_cache.put('bucket-1', [(1, b'live')], 25)
+
+        read_cache.set_finalized()
+        read_cache.put(OVERVIEW_KEY, OVERVIEW_CONTRACT_TUPLE)
+        read_cache.put('bucket-2', [(2, bytearray(b'value'))])
+
+        self.assertIsNone(read_cache.get('bucket-1', 25))
+
+        read_cache = ReadCache(ADDRESS, 1000, self.directory.name)
+
+        self.assertTrue(read_cache.is_finalized())
+        self.assertEqual(OVERVIEW_CONTRACT_TUPLE, read_cache.get(OVERVIEW_KEY))
+        self.assertEqual([(2, bytearray(b'value'))], read_cache.get('bucket-2'))
+        self.assertIsNone(read_cache.get('bucket-1'))
+
+    def test_when_the_entries_exceed_the_budget_then_the_least_recently_used_are_evicted(self):
+        """
+        Given a ReadCache without disk tier when the entries exceed max_bytes then the least
+        recently used entries are evicted
+        """
+
+        read_cache = ReadCache(ADDRESS, 2 * len(repr(b'1' * 10)))
+
+        read_cache.put('bucket-1', b'1' * 10, 25)
+        read_cache.put('bucket-2', b'2' * 10, 25)
+        read_cache.get('bucket-1', 25)
+        read_cache.put('bucket-3', b'3' * 10, 25)
+
+        self.assertEqual(b'1' * 10, read_cache.get('bucket-1', 25))
+        self.assertIsNone(read_cache.get('bucket-2', 25))
+        self.assertEqual(b'3' * 10, read_cache.get('bucket-3', 25))
@@ -0,0 +1,72 @@
+"""
+This is a class-containing module.
+
+It contains the GivenARecordPacker class, which inherits from TestCase and performs all the
+RecordPacker tests.
+"""
+
+import logging
+
+from unittest import TestCase
+from unittest.mock import MagicMock
+
+from bcubed.blockchain.gas_estimator import GasEstimator
+from bcubed.blockchain.record_packer import RecordPacker
+
+
+CLASS_PATH = 'bcubed.blockchain.record_packer'
+
+
+class GivenARecordPacker(TestCase):
+    """
+    It contains the test suite related with RecordPacker class.
+    Add tests as required.
+    """
+
+    __logger = logging.getLogger(CLASS_PATH)
+
+    def setUp(self) -> None:
+        self.record_packer = RecordPacker(GasEstimator(MagicMock(), 0), 2)
+
+        return super().setUp()
+
+    def test_when_packing_records_then_they_fill_the_fewest_transactions(self):
+        """
+        Given a RecordPacker when packing records then the small records fill the headroom of the
+        big ones and the arrival order is kept inside each transaction
+        """
+
+        with self.assertLogs(self.__logger, level='INFO') as log:
+            transactions, remaining_indexes = self.record_packer.pack([8, 8, 7, 7], 15)
+
+            self.assertEqual(
+                log.output[0],
+                'INFO:' + CLASS_PATH + ':SD records packed. Records: 2. Estimated gas: 15. '
+                'Fill ratio: 1.00')
+
+        self.assertEqual([[0, 2], [1, 3]], transactions)
+        self.assertEqual([], remaining_indexes)
+        self.assertEqual((2, 1.0), self.record_packer.get_statistics())
+
+    def test_when_keeping_the_remainder_then_the_least_filled_transaction_is_not_packed(self):
+        """
+        Given a RecordPacker when keeping the remainder then the least filled transaction is
+        returned as remaining records
+        """
+
+        with self.assertLogs(self.__logger, level='INFO'):
+            transactions, remaining_indexes = self.record_packer.pack(
+                [10, 3, 6, 9, 2], 16, True)
+
+        self.assertEqual([[0, 2]], transactions)
+        self.assertEqual([1, 3, 4], remaining_indexes)
+
+    def test_when_a_record_exceeds_the_capacity_then_it_has_its_own_transaction(self):
+        """
+        Given a RecordPacker when a record exceeds the capacity then it is packed alone
+        """
+
+        with self.assertLogs(self.__logger, level='INFO'):
+            transactions, _ = self.record_packer.pack([20, 5], 16)
+
+        self.assertEqual([[0], [1]], transactions)
@@ -0,0 +1,117 @@
+"""
+This is a class-containing module.
+
+It contains the GivenASamplePacker class, which inherits from TestCase and performs all the
+SamplePacker tests.
+"""
+
+from unittest import TestCase
+
+from bcubed.blockchain.sample_packer import SamplePacker
+from bcubed.constants.records.fields.generic_system_data_fields import GenericSystemDataFields
+from bcubed.constants.records.fields.id_value_fields import IdValueFields
+from bcubed.constants.records.fields.system_data_fields import SystemDataFields
+from bcubed.records.generic_system_data_record import GenericSystemDataRecord
+from bcubed.records.system_data_record import SystemDataRecord
+from bcubed.utilities.parse_help import (
+    from_contract_tuple_to_system_data_records,
+    from_record_to_contract_tuple
+)
+
+
+class GivenASamplePacker(TestCase):
+    """
+    It contains the test suite related with SamplePacker class.
+    Add tests as required.
+    """
+
+    def setUp(self) -> None:
+        self.sample_packer = SamplePacker(3)
+
+        return super().setUp()
+
+    def tearDown(self) -> None:
+        del self.sample_packer
+
+        return super().tearDown()
+
+    def __add_sample(self, field: str, sys_t: int, values: list):
+        system_data_record = SystemDataRecord()
+        system_data_record[SystemDataFields.FIELD_SYS_T] = sys_t
+        system_data_record[field][IdValueFields.FIELD_ID] = 1
+
+        if len(values) == 1:
+            system_data_record[field][IdValueFields.FIELD_VALUE] = values[0]
+        else:
+            system_data_record[field][IdValueFields.FIELD_VALUE_1] = values[0]
+            system_data_record[field][IdValueFields.FIELD_VALUE_2] = values[1]
+            system_data_record[field][IdValueFields.FIELD_VALUE_3] = values[2]
+
+        return self.sample_packer.add(
+            system_data_record, GenericSystemDataRecord(system_data_record))
+
+    def test_when_adding_the_samples_then_one_record_is_packed_and_unpacked_to_the_samples(self):
+        """
+        Given a SamplePacker when adding the number of samples then they are packed into one record
+        which is unpacked to the original samples
+        """
+
+        samples = [(1000000, [21.5]), (1000010, [21.75]), (1000025, [-3.0])]
+
+        self.assertEqual([], self.__add_sample(SystemDataFields.FIELD_TMP_V, *samples[0]))
+        self.assertEqual([], self.__add_sample(SystemDataFields.FIELD_TMP_V, *samples[1]))
+        packed_groups = self.__add_sample(SystemDataFields.FIELD_TMP_V, *samples[2])
+
+        self.assertEqual(1, len(packed_groups))
+        self.assertEqual([None, None, None], packed_groups[0][1])
+        self.assertEqual([None, None, None], packed_groups[0][2])
+
+        contract_tuple = from_record_to_contract_tuple(packed_groups[0][0])
+        system_data_records = from_contract_tuple_to_system_data_records(
+            [tuple(contract_tuple.values())])
+
+        self.assertEqual(
+            samples,
+            [(record[SystemDataFields.FIELD_SYS_T],
+              [record[SystemDataFields.FIELD_TMP_V][IdValueFields.FIELD_VALUE]])
+             for record in system_data_records])
+        self.assertEqual(
+            [1, 1, 1],
+            [record[SystemDataFields.FIELD_TMP_V][IdValueFields.FIELD_ID]
+             for record in system_data_records])
+
+    def test_when_a_sample_of_another_bucket_arrives_then_the_previous_samples_are_packed(self):
+        """
+        Given a SamplePacker when adding a sample of another timestamp bucket then the previous
+        samples of the field are packed
+        """
+
+        self.__add_sample(SystemDataFields.FIELD_GYR_V, 1000000, [1, 2, 3])
+        self.__add_sample(SystemDataFields.FIELD_GYR_V, 1000001, [4, 5, 6])
+        packed_groups = self.__add_sample(SystemDataFields.FIELD_GYR_V, 2000000, [7, 8, 9])
+
+        self.assertEqual(1, len(packed_groups))
+        self.assertEqual(
+            1000000, packed_groups[0][0][SystemDataFields.FIELD_SYS_T])
+        self.assertEqual(
+            b'', packed_groups[0][0][GenericSystemDataFields.FIELD_VALUE_2_FOU])
+
+        drained_groups = self.sample_packer.drain()
+
+        self.assertEqual(1, len(drained_groups))
+        self.assertEqual(
+            2000000, drained_groups[0][0][SystemDataFields.FIELD_SYS_T])
+        self.assertEqual([], self.sample_packer.drain())
+
+    def test_when_adding_a_record_of_a_field_not_packable_then_it_returns_none(self):
+        """
+        Given a SamplePacker when adding a record of a field that is not packable then it returns
+        None
+        """
+
+        system_data_record = SystemDataRecord()
+        system_data_record[SystemDataFields.FIELD_SYS_T] = 1000000
+        system_data_record[SystemDataFields.FIELD_BAT_L] = 30
+
+        self.assertIsNone(self.sample_packer.add(
+            system_data_record, GenericSystemDataRecord(system_data_record)))
@@ -0,0 +1,57 @@
+"""
+This is a class-containing module.
+
+It contains the GivenASegmentStore class, which inherits from TestCase and performs all the
+SegmentStore tests.
+"""
+
+import tempfile
+
+from unittest import TestCase
+
+from bcubed.blockchain.segment_store import SegmentStore
+
+
+ROOT = bytes(range(32))
+OTHER_ROOT = bytes(32)
+
+
+class GivenASegmentStore(TestCase):
+    """
+    It contains the test suite related with SegmentStore class.
+    Add tests as required.
+    """
+
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.segment_store = SegmentStore(self.directory.name)
+
+        return super().setUp()
+
+    def tearDown(self) -> None:
+        del self.segment_store
+        self.directory.cleanup()
+
+        return super().tearDown()
+
+    def test_when_writing_a_segment_then_its_records_are_read_by_its_root(self):
+        """
+        Given a SegmentStore when writing a segment then its encoded records are read by its root
+        """
+
+        encoded_records = [b'first', b'', b'third record']
+
+        self.segment_store.write(ROOT, encoded_records)
+
+        self.assertEqual(encoded_records, self.segment_store.read(ROOT))
+        self.assertEqual(
+            encoded_records, SegmentStore(self.directory.name).read(ROOT))
+
+    def test_when_reading_a_segment_that_is_not_written_then_it_returns_none(self):
+        """
+        Given a SegmentStore when reading a segment that is not written then it returns None
+        """
+
+        self.segment_store.write(ROOT, [b'record'])
+
+        self.assertIsNone(self.segment_store.read(OTHER_ROOT))
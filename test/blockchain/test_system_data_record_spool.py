@@ -0,0 +1,125 @@
+"""
+This is a class-containing module.
+
+It contains the GivenASystemDataRecordSpool class, which inherits from TestCase and performs all the
+SystemDataRecordSpool tests.
+"""
+
+import logging
+import os
+import tempfile
+
+from unittest import TestCase
+
+from bcubed.blockchain.system_data_record_spool import SystemDataRecordSpool
+
+
+CLASS_PATH = 'bcubed.blockchain.system_data_record_spool'
+
+
+class GivenASystemDataRecordSpool(TestCase):
+    """
+    It contains the test suite related with SystemDataRecordSpool class.
+    Add tests as required.
+    """
+
+    __logger = logging.getLogger(CLASS_PATH)
+
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.path = os.path.join(self.directory.name, 'spool.bin')
+
+        self.spool = SystemDataRecordSpool(self.path, 1)
+
+        return super().setUp()
+
+    def tearDown(self) -> None:
+        self.spool.close()
+        self.directory.cleanup()
+
+        return super().tearDown()
+
+    def __get_contract_tuple(self, system_timestamp: int):
+        return {
+            'recT': 1729062217,
+            'sysT': system_timestamp,
+            'namF': 'batL',
+            'valF': b'x\x9c3\x06\x00\x004\x004',
+            'idTwo': 0,
+            'valueTwo': b'',
+        }
+
+    def test_when_reopening_the_spool_then_the_pending_records_are_recovered(self):
+        """
+        Given a SystemDataRecordSpool when reopening it then the records that were not committed
+        are recovered
+        """
+
+        first_sequence = self.spool.append(self.__get_contract_tuple(1))
+        second_sequence = self.spool.append(self.__get_contract_tuple(2))
+        self.spool.append(self.__get_contract_tuple(3))
+
+        self.spool.commit([first_sequence])
+        self.spool.close()
+
+        self.spool = SystemDataRecordSpool(self.path, 1)
+
+        pending_records = self.spool.get_pending_records()
+
+        self.assertEqual([1, 2], [sequence for sequence, _ in pending_records])
+        self.assertEqual((second_sequence, self.__get_contract_tuple(2)), pending_records[0])
+        self.assertEqual(3, self.spool.append(self.__get_contract_tuple(4)))
+
+    def test_when_every_record_is_committed_then_the_spool_is_truncated(self):
+        """
+        Given a SystemDataRecordSpool when every record is committed then the spool file is
+        truncated
+        """
+
+        sequences = [self.spool.append(self.__get_contract_tuple(index)) for index in range(3)]
+
+        self.assertGreater(os.path.getsize(self.path), 0)
+
+        self.spool.commit(sequences)
+
+        self.assertEqual(0, os.path.getsize(self.path))
+        self.assertEqual([], self.spool.get_pending_records())
+
+    def test_when_the_last_entry_is_torn_then_it_is_discarded(self):
+        """
+        Given a SystemDataRecordSpool when the last entry was not completely written then it is
+        discarded and the previous records are recovered
+        """
+
+        self.spool.append(self.__get_contract_tuple(1))
+        self.spool.append(self.__get_contract_tuple(2))
+        self.spool.close()
+
+        size = os.path.getsize(self.path)
+        with open(self.path, 'r+b') as file:
+            file.truncate(size - 5)
+
+        with self.assertLogs(self.__logger, level='WARNING'):
+            self.spool = SystemDataRecordSpool(self.path, 1)
+
+        self.assertEqual([0], [sequence for sequence, _ in self.spool.get_pending_records()])
+
+    def test_when_the_spool_is_bigger_than_compact_size_then_it_is_compacted(self):
+        """
+        Given a SystemDataRecordSpool when it grows over the compact size then only the pending
+        records are kept
+        """
+
+        self.spool.close()
+        self.spool = SystemDataRecordSpool(self.path, 1, 512)
+
+        sequences = [self.spool.append(self.__get_contract_tuple(index)) for index in range(10)]
+
+        with self.assertLogs(self.__logger, level='INFO'):
+            self.spool.commit(sequences[:-1])
+
+        self.spool.close()
+        self.spool = SystemDataRecordSpool(self.path, 1)
+
+        self.assertEqual([9], [sequence for sequence, _ in self.spool.get_pending_records()])
+        self.assertLess(os.path.getsize(self.path), 512)
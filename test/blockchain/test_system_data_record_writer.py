@@ -0,0 +1,142 @@
+"""
+This is a class-containing module.
+
+It contains the GivenASystemDataRecordWriter class, which inherits from TestCase and performs all
+the SystemDataRecordWriter tests.
+"""
+
+import logging
+import threading
+
+from unittest import TestCase
+from unittest.mock import MagicMock
+
+from bcubed.blockchain.system_data_record_writer import SystemDataRecordWriter
+from bcubed.records.system_data_record import SystemDataRecord
+
+
+CLASS_PATH = 'bcubed.blockchain.system_data_record_writer'
+
+
+class GivenASystemDataRecordWriter(TestCase):
+    """
+    It contains the test suite related with SystemDataRecordWriter class.
+    Add tests as required.
+    """
+
+    __logger = logging.getLogger(CLASS_PATH)
+
+    def setUp(self) -> None:
+        self.node = MagicMock()
+        self.node.flush = MagicMock(return_value=True)
+
+        self.callbacks = []
+
+        def store_system_data_record(_, callback=None):
+            self.callbacks.append(callback)
+            return True
+
+        self.node.store_system_data_record = MagicMock(
+            side_effect=store_system_data_record)
+
+        self.writer = SystemDataRecordWriter(self.node, 10)
+
+        return super().setUp()
+
+    def tearDown(self) -> None:
+        self.writer.close(5)
+
+        return super().tearDown()
+
+    def test_when_storing_sd_record_then_the_worker_sends_it_to_the_node(self):
+        """
+        Given a SystemDataRecordWriter when storing a SystemData record then the worker sends it to
+        the Node
+        """
+
+        system_data_record = SystemDataRecord()
+        self.writer.store_system_data_record(system_data_record)
+
+        self.assertTrue(self.writer.flush(5))
+
+        self.node.store_system_data_record.assert_called_once()
+        self.assertIs(
+            system_data_record, self.node.store_system_data_record.call_args[0][0])
+
+    def test_when_the_node_stores_the_transaction_then_the_future_is_resolved(self):
+        """
+        Given a SystemDataRecordWriter when the Node stores the transaction then the Future is
+        resolved with the result
+        """
+
+        stored = []
+        future = self.writer.store_system_data_record(
+            SystemDataRecord(), stored.append)
+        self.writer.flush(5)
+
+        self.assertFalse(future.done())
+
+        self.callbacks[0](True)
+
+        self.assertTrue(future.result(5))
+        self.assertEqual([True], stored)
+
+    def test_when_the_node_fails_then_the_future_is_resolved_with_false(self):
+        """
+        Given a SystemDataRecordWriter when the Node raises an exception then the Future is
+        resolved with False
+        """
+
+        self.node.store_system_data_record = MagicMock(
+            side_effect=ValueError('Mocked exception'))
+
+        with self.assertLogs(self.__logger, level='ERROR') as log:
+            future = self.writer.store_system_data_record(SystemDataRecord())
+
+            self.assertFalse(future.result(5))
+            self.assertEqual(
+                log.output[0],
+                'ERROR:' + CLASS_PATH + ':Exception when writing SD record: Mocked exception')
+
+    def test_when_the_queue_is_full_then_the_future_is_resolved_with_false(self):
+        """
+        Given a SystemDataRecordWriter when the queue is full and it does not block then the Future
+        is resolved with False
+        """
+
+        started = threading.Event()
+        release = threading.Event()
+
+        def store_system_data_record(*_):
+            started.set()
+            release.wait(5)
+
+        self.node.store_system_data_record = MagicMock(
+            side_effect=store_system_data_record)
+
+        # The worker is blocked with the first record, so the queue is full after 10 more
+        self.writer.store_system_data_record(SystemDataRecord())
+        started.wait(5)
+
+        futures = [self.writer.store_system_data_record(SystemDataRecord(), block=False)
+                   for _ in range(11)]
+
+        self.assertFalse(futures[-1].result(5))
+
+        release.set()
+
+    def test_when_closing_then_the_node_is_flushed_and_new_records_are_rejected(self):
+        """
+        Given a SystemDataRecordWriter when closing then the Node is flushed and new records are
+        rejected
+        """
+
+        with SystemDataRecordWriter(self.node) as writer:
+            writer.store_system_data_record(SystemDataRecord())
+
+        self.assertTrue(writer.is_closed())
+        self.node.flush.assert_called()
+
+        future = writer.store_system_data_record(SystemDataRecord())
+
+        self.assertFalse(future.result(5))
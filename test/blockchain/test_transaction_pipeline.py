@@ -0,0 +1,202 @@
+"""
+This is a class-containing module.
+
+It contains the GivenATransactionPipeline class, which inherits from TestCase and performs all the
+TransactionPipeline tests.
+"""
+
+import logging
+
+from unittest import TestCase
+from unittest.mock import MagicMock
+
+from bcubed.blockchain.transaction_pipeline import TransactionPipeline
+
+
+CLASS_PATH = 'bcubed.blockchain.transaction_pipeline'
+
+WAIT_TIMEOUT = 5
+
+
+class GivenATransactionPipeline(TestCase):
+    """
+    It contains the test suite related with TransactionPipeline class.
+    Add tests as required.
+    """
+
+    __logger = logging.getLogger(CLASS_PATH)
+
+    def setUp(self) -> None:
+        self.web3 = MagicMock()
+        self.nonce_manager = MagicMock()
+
+        self.pipeline = TransactionPipeline(
+            self.web3, self.nonce_manager, 2, 0.01, 0.05)
+
+        return super().setUp()
+
+    def tearDown(self) -> None:
+        self.pipeline.close(WAIT_TIMEOUT)
+
+        return super().tearDown()
+
+    def __get_batch_request(self, send_responses: list, receipt_responses: list):
+        def make_batch_request(requests: list):
+            method = requests[0][0]
+
+            if method == 'eth_sendRawTransaction':
+                return [send_responses.pop(0) for _ in requests]
+
+            return [receipt_responses.pop(0) if len(receipt_responses) > 0 else {'result': None}
+                    for _ in requests]
+
+        return make_batch_request
+
+    def test_when_transactions_are_mined_then_the_callbacks_are_notified_with_true(self):
+        """
+        Given a TransactionPipeline when the transactions are mined then the callbacks are notified
+        with True and nothing is left in flight
+        """
+
+        self.web3.provider.make_batch_request = MagicMock(side_effect=self.__get_batch_request(
+            [{'result': '0x1'}, {'result': '0x2'}],
+            [{'result': {'status': '0x1'}}, {'result': {'status': 1}}]))
+
+        stored = []
+        self.pipeline.submit(b'\x01', 1, stored.append)
+        self.pipeline.submit(b'\x02', 2, stored.append)
+
+        self.assertTrue(self.pipeline.wait(WAIT_TIMEOUT))
+        self.assertEqual([True, True], stored)
+        self.assertEqual(0, self.pipeline.get_in_flight_number())
+
+    def test_when_transaction_is_reverted_then_the_callback_is_notified_with_false(self):
+        """
+        Given a TransactionPipeline when the transaction is reverted then the callback is notified
+        with False
+        """
+
+        self.web3.provider.make_batch_request = MagicMock(side_effect=self.__get_batch_request(
+            [{'result': '0x1'}], [{'result': {'status': '0x0'}}]))
+
+        stored = []
+        with self.assertLogs(self.__logger, level='ERROR') as log:
+            self.pipeline.submit(b'\x01', 1, stored.append)
+            self.assertTrue(self.pipeline.wait(WAIT_TIMEOUT))
+
+            self.assertEqual(
+                log.output[0], 'ERROR:' + CLASS_PATH + ':Transaction 0x1 was reverted')
+
+        self.assertEqual([False], stored)
+
+    def test_when_transaction_is_rejected_then_its_nonce_is_released(self):
+        """
+        Given a TransactionPipeline when the transaction is rejected then its nonce is released and
+        the callback is notified with False
+        """
+
+        self.web3.provider.make_batch_request = MagicMock(side_effect=self.__get_batch_request(
+            [{'error': {'message': 'insufficient funds'}}], []))
+
+        stored = []
+        with self.assertLogs(self.__logger, level='ERROR'):
+            self.pipeline.submit(b'\x01', 7, stored.append)
+            self.assertTrue(self.pipeline.wait(WAIT_TIMEOUT))
+
+        self.nonce_manager.release.assert_called_once_with(7)
+        self.nonce_manager.resync.assert_not_called()
+        self.assertEqual([False], stored)
+
+    def test_when_transaction_has_a_nonce_error_then_the_nonces_are_resynchronized(self):
+        """
+        Given a TransactionPipeline when the transaction is rejected by a nonce error then the
+        nonces are resynchronized
+        """
+
+        self.web3.provider.make_batch_request = MagicMock(side_effect=self.__get_batch_request(
+            [{'error': {'message': 'nonce too low'}}], []))
+
+        stored = []
+        with self.assertLogs(self.__logger, level='ERROR'):
+            self.pipeline.submit(b'\x01', 7, stored.append)
+            self.assertTrue(self.pipeline.wait(WAIT_TIMEOUT))
+
+        self.nonce_manager.resync.assert_called_once()
+        self.nonce_manager.release.assert_not_called()
+        self.assertEqual([False], stored)
+
+    def test_when_receipt_is_not_available_before_the_timeout_then_it_is_sent_again(self):
+        """
+        Given a TransactionPipeline when the receipt is not available before the receipt timeout
+        and its nonce is not mined then the same transaction is sent again, the nonces are not
+        resynchronized and the callback is notified once it is mined
+        """
+
+        receipt_responses = [{'result': None}] * 10 + [{'result': {'status': '0x1'}}]
+        self.web3.provider.make_batch_request = MagicMock(side_effect=self.__get_batch_request(
+            [{'result': '0x1'}], receipt_responses))
+        self.web3.provider.make_request = MagicMock(
+            return_value={'error': {'message': 'already known'}})
+        self.nonce_manager.is_nonce_mined = MagicMock(return_value=False)
+
+        stored = []
+        with self.assertLogs(self.__logger, level='WARNING') as log:
+            self.pipeline.submit(b'\x01', 1, stored.append)
+            self.assertTrue(self.pipeline.wait(WAIT_TIMEOUT))
+
+            self.assertEqual(
+                log.output[0],
+                'WARNING:' + CLASS_PATH +
+                ':Transaction 0x1 was not mined in 0.05 seconds. It is sent again')
+
+        self.web3.provider.make_request.assert_called_with('eth_sendRawTransaction', ['0x01'])
+        self.nonce_manager.is_nonce_mined.assert_called_with(1)
+        self.nonce_manager.resync.assert_not_called()
+        self.assertEqual([True], stored)
+
+    def test_when_the_nonce_is_mined_by_another_transaction_then_the_transaction_fails(self):
+        """
+        Given a TransactionPipeline when the receipt is not available before the receipt timeout
+        and another transaction with its nonce is mined then the callback is notified with False
+        and the nonces are not resynchronized
+        """
+
+        self.web3.provider.make_batch_request = MagicMock(side_effect=self.__get_batch_request(
+            [{'result': '0x1'}], []))
+        self.web3.provider.make_request = MagicMock(return_value={'result': None})
+        self.nonce_manager.is_nonce_mined = MagicMock(return_value=True)
+
+        stored = []
+        with self.assertLogs(self.__logger, level='ERROR') as log:
+            self.pipeline.submit(b'\x01', 1, stored.append)
+            self.assertTrue(self.pipeline.wait(WAIT_TIMEOUT))
+
+            self.assertEqual(
+                log.output[0],
+                'ERROR:' + CLASS_PATH +
+                ':Transaction 0x1 was replaced by another transaction with nonce 1')
+
+        self.web3.provider.make_request.assert_called_once_with(
+            'eth_getTransactionReceipt', ['0x1'])
+        self.nonce_manager.resync.assert_not_called()
+        self.assertEqual([False], stored)
+
+    def test_when_a_nonce_error_happens_with_transactions_in_flight_then_resync_waits(self):
+        """
+        Given a TransactionPipeline when a transaction has a nonce error while another one is in
+        flight then the nonces are only resynchronized once the other one is confirmed
+        """
+
+        receipt_responses = [{'result': None}, {'result': {'status': '0x1'}}]
+        self.web3.provider.make_batch_request = MagicMock(side_effect=self.__get_batch_request(
+            [{'result': '0x1'}, {'error': {'message': 'nonce too low'}}], receipt_responses))
+
+        stored = []
+        self.nonce_manager.resync = MagicMock(side_effect=lambda: stored.append('resync'))
+
+        with self.assertLogs(self.__logger, level='ERROR'):
+            self.pipeline.submit(b'\x01', 1, stored.append)
+            self.pipeline.submit(b'\x02', 2, stored.append)
+            self.assertTrue(self.pipeline.wait(WAIT_TIMEOUT))
+
+        self.assertEqual([False, True, 'resync'], stored)
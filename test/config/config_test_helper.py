@@ -56,10 +56,38 @@ class ConfigTestHelper():
 
         config_dict = {
 
+            ConfigCategories.ANCHORING: {
+                ConfigKeys.ENABLED: False
+            },
+            ConfigCategories.COMPRESSION: {
+                ConfigKeys.ENABLED: False
+            },
             ConfigCategories.CONTRACT: {
                 ConfigKeys.COMPILED_NAME: "BCubedContract",
                 ConfigKeys.COMPILED_PATH: "../../../test/blockchain/solidity/"
             },
+            ConfigCategories.EVENT_LOG: {
+                ConfigKeys.ENABLED: False
+            },
+            ConfigCategories.FLUSH: {
+                ConfigKeys.ADAPTIVE: False
+            },
+            ConfigCategories.KEY_CACHE: {
+                ConfigKeys.ENABLED: False
+            },
+            ConfigCategories.PACKING: {
+                ConfigKeys.WINDOW: 0,
+                ConfigKeys.MULTI_FIELD: False
+            },
+            ConfigCategories.PIPELINE: {
+                ConfigKeys.ENABLED: False
+            },
+            ConfigCategories.READ_CACHE: {
+                ConfigKeys.ENABLED: False
+            },
+            ConfigCategories.SPOOL: {
+                ConfigKeys.ENABLED: False
+            },
             ConfigCategories.SOLIDITY: {
                 ConfigKeys.CONTRACT_FILE: "BCubedContract.sol",
                 ConfigKeys.PATH: "solidity/abstract/"
@@ -0,0 +1,111 @@
+"""
+This is a class-containing module.
+
+It contains the GivenACompactSystemDataRecord class, which inherits from TestCase and performs all
+the CompactSystemDataRecord tests.
+"""
+
+import tracemalloc
+
+from unittest import TestCase
+
+from bcubed.constants.records.fields.common_data_fields import CommonDataFields
+from bcubed.constants.records.fields.id_value_fields import IdValueFields
+from bcubed.constants.records.fields.system_data_fields import SystemDataFields
+from bcubed.records.compact_system_data_record import CompactSystemDataRecord
+from bcubed.utilities.compression_help import compress_value
+from bcubed.utilities.parse_help import from_contract_tuple_to_system_data_records
+from bcubed.utilities.sample_packing_help import pack_samples
+
+
+class GivenACompactSystemDataRecord (TestCase):
+    """
+    It contains the test suite related with CompactSystemDataRecord class.
+    Add tests as required.
+    """
+
+    RECORDS_NUMBER = 1000
+
+    def setUp(self) -> None:
+        self.contract_tuples = [
+            (1, 1000000, SystemDataFields.FIELD_BAT_L, compress_value("50"),
+             0, b'', 0, b'', b'', b''),
+            (1, 1000001, SystemDataFields.FIELD_SYS_X, b'',
+             1, compress_value("value"), 0, b'', b'', b''),
+            (1, 1000002, SystemDataFields.FIELD_GYR_V, b'',
+             0, b'', 1, compress_value("1"), compress_value("2"), compress_value("3")),
+            (1, 1000003, SystemDataFields.FIELD_TMP_V, b'',
+             1, pack_samples(1000003, [(1000003, [20.5]), (1000004, [21.25])]),
+             0, b'', b'', b'')
+        ]
+
+        return super().setUp()
+
+    def tearDown(self) -> None:
+        del self.contract_tuples
+
+        return super().tearDown()
+
+    def test_when_parsing_contract_tuples_then_the_records_are_the_same_as_system_data_records(self):
+        """
+        Given a CompactSystemDataRecord when parsing contract tuples then the records have the same
+        keys and values as the SystemDataRecord ones, and the same string
+        """
+
+        system_data_records = from_contract_tuple_to_system_data_records(self.contract_tuples)
+        compact_system_data_records = from_contract_tuple_to_system_data_records(
+            self.contract_tuples, compact=True)
+
+        self.assertEqual(5, len(compact_system_data_records))
+
+        for system_data_record, compact_system_data_record in zip(
+                system_data_records, compact_system_data_records):
+            self.assertEqual(CompactSystemDataRecord, type(compact_system_data_record))
+
+            self.assertEqual(system_data_record, compact_system_data_record)
+            self.assertEqual(system_data_record[CommonDataFields.FIELD_FIE_N],
+                             compact_system_data_record[CommonDataFields.FIELD_FIE_N])
+            self.assertEqual(system_data_record.to_string(), compact_system_data_record.to_string())
+
+        self.assertEqual(
+            "value",
+            compact_system_data_records[1][SystemDataFields.FIELD_SYS_X][IdValueFields.FIELD_VALUE])
+
+    def test_when_updating_a_value_then_an_exception_raises(self):
+        """
+        Given a CompactSystemDataRecord when updating a value then an exception raises, because it
+        is read-only
+        """
+
+        compact_system_data_record = CompactSystemDataRecord(1, 1000000)
+
+        with self.assertRaises(TypeError):
+            compact_system_data_record[SystemDataFields.FIELD_SYS_T] = 1
+
+        with self.assertRaises(AttributeError):
+            compact_system_data_record.field = 1
+
+    def test_when_parsing_contract_tuples_then_the_records_take_less_memory(self):
+        """
+        Given a CompactSystemDataRecord when parsing contract tuples then the records take less
+        than a quarter of the memory of the SystemDataRecord ones
+        """
+
+        contract_tuples = [
+            (1, 1000000 + index, SystemDataFields.FIELD_SYS_X, b'',
+             1, compress_value(f"value {index}"), 0, b'', b'', b'')
+            for index in range(self.RECORDS_NUMBER)]
+
+        memory = []
+        for compact in (False, True):
+            tracemalloc.start()
+
+            system_data_records = from_contract_tuple_to_system_data_records(
+                contract_tuples, compact=compact)
+            memory.append(tracemalloc.get_traced_memory()[0])
+
+            tracemalloc.stop()
+
+            del system_data_records
+
+        self.assertLess(memory[1] * 4, memory[0])
@@ -33,6 +33,13 @@ from bcubed.records.fields.id_uint8_value_uint16_field import IdUint8ValueUint16
 from bcubed.enumerates.record_type import RecordType
 from bcubed.records.generic_system_data_record import GenericSystemDataRecord
 from bcubed.records.system_data_record import SystemDataRecord
+from bcubed.utilities.compression_help import ENCODING_DEFLATE, decompress_value
+from bcubed.utilities.encoding_help import (
+    encode_system_data_contract_tuple,
+    from_field_to_contract_tuple,
+    from_system_data_record_to_contract_tuple
+)
+from bcubed.utilities.parse_help import from_record_to_contract_tuple
 
 
 class GivenAGenericSystemDataRecord (TestCase):
@@ -117,7 +124,7 @@ class GivenAGenericSystemDataRecord (TestCase):
         self.assertEqual(
             self.generic_system_data_record[GenericSystemDataFields.FIELD_NAM_F], SystemDataFields.FIELD_BAT_L)
         self.assertEqual(
-            self.generic_system_data_record[GenericSystemDataFields.FIELD_VAL_F], b'x\x9c3\x02\x00\x003\x003')
+            self.generic_system_data_record[GenericSystemDataFields.FIELD_VAL_F], b'\x002')
         self.assertEqual(
             self.generic_system_data_record[GenericSystemDataFields.FIELD_ID_TWO], 0)
         self.assertEqual(
@@ -164,7 +171,7 @@ class GivenAGenericSystemDataRecord (TestCase):
         self.assertEqual(
             self.generic_system_data_record[GenericSystemDataFields.FIELD_ID_TWO], 1)
         self.assertEqual(
-            self.generic_system_data_record[GenericSystemDataFields.FIELD_VALUE_TWO], b'x\x9c340\x00\x00\x01&\x00\x92')
+            self.generic_system_data_record[GenericSystemDataFields.FIELD_VALUE_TWO], b'\x00100')
         self.assertEqual(
             self.generic_system_data_record[GenericSystemDataFields.FIELD_ID_FOU], 0)
         self.assertEqual(
@@ -214,11 +221,11 @@ class GivenAGenericSystemDataRecord (TestCase):
         self.assertEqual(
             self.generic_system_data_record[GenericSystemDataFields.FIELD_ID_FOU], 1)
         self.assertEqual(
-            self.generic_system_data_record[GenericSystemDataFields.FIELD_VALUE_1_FOU], b'x\x9c3\x02\x00\x003\x003')
+            self.generic_system_data_record[GenericSystemDataFields.FIELD_VALUE_1_FOU], b'\x002')
         self.assertEqual(
-            self.generic_system_data_record[GenericSystemDataFields.FIELD_VALUE_2_FOU], b'x\x9c3\x06\x00\x004\x004')
+            self.generic_system_data_record[GenericSystemDataFields.FIELD_VALUE_2_FOU], b'\x003')
         self.assertEqual(
-            self.generic_system_data_record[GenericSystemDataFields.FIELD_VALUE_3_FOU], b'x\x9c3\x01\x00\x005\x005')
+            self.generic_system_data_record[GenericSystemDataFields.FIELD_VALUE_3_FOU], b'\x004')
 
     def test_when_adding_new_key_then_it_is_not_added_and_an_exception_raises(self):
         """
@@ -404,3 +411,73 @@ class GivenAGenericSystemDataRecord (TestCase):
 
         self.assertEqual(
             to_string, self.generic_system_data_record.to_string())
+
+    def test_when_setting_repetitive_string_value_then_it_is_deflated(self):
+        """
+        Given a GenericSystemDataRecord when setting a repetitive string value then it is deflated
+        """
+
+        value = TEST_STRING * 20
+
+        self.generic_system_data_record[GenericSystemDataFields.FIELD_VAL_F] = value
+
+        self.assertEqual(
+            self.generic_system_data_record[GenericSystemDataFields.FIELD_VAL_F][0], ENCODING_DEFLATE)
+        self.assertEqual(
+            decompress_value(self.generic_system_data_record[GenericSystemDataFields.FIELD_VAL_F]), value)
+
+    def test_when_getting_encoded_size_then_it_is_the_abi_encoding_length(self):
+        """
+        Given a GenericSystemDataRecord when getting its encoded size then it is the length of its
+        ABI encoding, also after a value changes
+        """
+
+        self.generic_system_data_record[GenericSystemDataFields.FIELD_NAM_F] = SystemDataFields.FIELD_SYS_X
+        self.generic_system_data_record[GenericSystemDataFields.FIELD_ID_TWO] = 1
+
+        for value in ["", TEST_STRING, TEST_STRING * 20]:
+            self.generic_system_data_record[GenericSystemDataFields.FIELD_VALUE_TWO] = value
+
+            self.assertEqual(
+                len(encode_system_data_contract_tuple(
+                    from_record_to_contract_tuple(self.generic_system_data_record))),
+                self.generic_system_data_record.get_encoded_size())
+
+    def test_when_encoding_sd_record_directly_then_the_contract_tuple_is_the_generic_record_one(self):
+        """
+        Given a GenericSystemDataRecord when encoding a SystemDataRecord directly to a contract
+        tuple then it is the same as the contract tuple of its GenericSystemDataRecord, for each
+        field type and for the default values
+        """
+
+        system_data_records = [SystemDataRecord() for _ in range(5)]
+
+        system_data_records[1][SystemDataFields.FIELD_BAT_L] = 50
+        system_data_records[2][SystemDataFields.FIELD_AUT_B] = True
+
+        system_data_records[3][SystemDataFields.FIELD_SYS_X][IdValueFields.FIELD_ID] = 1
+        system_data_records[3][SystemDataFields.FIELD_SYS_X][IdValueFields.FIELD_VALUE] = TEST_STRING * 20
+
+        system_data_records[4][SystemDataFields.FIELD_GYR_V][IdValueFields.FIELD_ID] = 2
+        system_data_records[4][SystemDataFields.FIELD_GYR_V][IdValueFields.FIELD_VALUE_1] = 1
+        system_data_records[4][SystemDataFields.FIELD_GYR_V][IdValueFields.FIELD_VALUE_2] = 2
+        system_data_records[4][SystemDataFields.FIELD_GYR_V][IdValueFields.FIELD_VALUE_3] = 3
+
+        for system_data_record in system_data_records:
+            contract_tuple = from_system_data_record_to_contract_tuple(system_data_record)
+
+            self.assertEqual(
+                from_record_to_contract_tuple(GenericSystemDataRecord(system_data_record)),
+                contract_tuple)
+            self.assertEqual(
+                list(from_record_to_contract_tuple(self.generic_system_data_record)),
+                list(contract_tuple))
+
+        self.assertEqual(
+            from_system_data_record_to_contract_tuple(system_data_records[3]),
+            from_field_to_contract_tuple(
+                system_data_records[3][CommonDataFields.FIELD_REC_T], 0, SystemDataFields.FIELD_SYS_X,
+                system_data_records[3][SystemDataFields.FIELD_SYS_X]))
+
+        with self.assertRaises(ValueError):
+            from_field_to_contract_tuple(1, 0, CommonDataFields.FIELD_REC_T, 1)
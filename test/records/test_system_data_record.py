@@ -441,3 +441,32 @@ class GivenASystemDataRecord (TestCase):
 
         self.assertEqual(context.exception.args[0], self.CLASS_ID + VALUE_NOT_VALID_ERROR.format(
             SystemDataFields.FIELD_SIGNS, VALID_NUMBER_VALUE))
+
+    def test_when_updating_fields_at_once_then_the_fields_number_is_the_same_as_one_by_one(self):
+        """
+        Given a SystemDataRecord when updating several fields at once then the values and the fieN
+        value are the same as when they are updated one by one, also after an id-value field is
+        updated in place
+        """
+
+        fields = {
+            SystemDataFields.FIELD_SYS_T: VALID_NUMBER_VALUE,
+            SystemDataFields.FIELD_BAT_L: VALID_NUMBER_VALUE,
+            SystemDataFields.FIELD_TXT_C: VALID_STRING_VALUE
+        }
+
+        system_data_record = SystemDataRecord()
+        for field, field_value in fields.items():
+            system_data_record[field] = field_value
+
+        self.system_data_record.update_fields(fields)
+
+        for field in list(fields) + [CommonDataFields.FIELD_FIE_N]:
+            self.assertEqual(system_data_record[field], self.system_data_record[field])
+
+        fields_number = self.system_data_record[CommonDataFields.FIELD_FIE_N]
+
+        self.system_data_record[SystemDataFields.FIELD_SYS_X][IdValueFields.FIELD_ID] = VALID_NUMBER_VALUE
+        self.system_data_record[SystemDataFields.FIELD_BAT_L] = DEFAULT_NUMBER_VALUE
+
+        self.assertEqual(fields_number, self.system_data_record[CommonDataFields.FIELD_FIE_N])
@@ -0,0 +1,124 @@
+"""
+This is a class-containing module.
+
+It contains the GivenColumnarData class, which inherits from TestCase and performs all the
+columnar_help tests.
+"""
+
+from unittest import TestCase
+
+from bcubed.constants.records.fields.common_data_fields import CommonDataFields
+from bcubed.constants.records.fields.id_value_fields import IdValueFields
+from bcubed.constants.records.fields.system_data_fields import SystemDataFields
+from bcubed.records.generic_system_data_record import GenericSystemDataRecord
+from bcubed.records.system_data_record import SystemDataRecord
+from bcubed.utilities.columnar_help import from_columns_to_contract_tuples
+from bcubed.utilities.parse_help import from_record_to_contract_tuple
+
+
+REC_T = 1741007821
+
+
+class GivenColumnarData(TestCase):
+    """
+    It contains the test suite related with columnar_help functions.
+    Add tests as required.
+    """
+
+    def __get_record_contract_tuple(self, sys_t: int, field: str, value):
+        system_data_record = SystemDataRecord()
+        system_data_record[SystemDataFields.FIELD_SYS_T] = sys_t
+        system_data_record[field] = value
+
+        contract_tuple = from_record_to_contract_tuple(GenericSystemDataRecord(system_data_record))
+        contract_tuple[CommonDataFields.FIELD_REC_T] = REC_T
+
+        return contract_tuple
+
+    def test_when_converting_columns_then_each_value_is_the_contract_tuple_of_a_record(self):
+        """
+        Given columnar data when converting it to contract tuples then each value is the contract
+        tuple of a SystemDataRecord with only that value, in row order
+        """
+
+        columns = {
+            SystemDataFields.FIELD_SYS_T: [1000000, 1000001],
+            SystemDataFields.FIELD_BAT_L: [50, 49],
+            SystemDataFields.FIELD_OPE_S: ['linux', 'linux']
+        }
+
+        self.assertEqual(
+            [self.__get_record_contract_tuple(1000000, SystemDataFields.FIELD_BAT_L, 50),
+             self.__get_record_contract_tuple(1000000, SystemDataFields.FIELD_OPE_S, 'linux'),
+             self.__get_record_contract_tuple(1000001, SystemDataFields.FIELD_BAT_L, 49),
+             self.__get_record_contract_tuple(1000001, SystemDataFields.FIELD_OPE_S, 'linux')],
+            from_columns_to_contract_tuples(columns, REC_T))
+
+    def test_when_a_value_is_the_default_one_then_it_is_skipped(self):
+        """
+        Given columnar data when a value of a field without id is the default one then its row
+        does not have that field, as a SystemDataRecord does not store it
+        """
+
+        columns = {
+            SystemDataFields.FIELD_SYS_T: [1000000, 1000001, 1000002],
+            SystemDataFields.FIELD_BAT_L: [0, 49, 0],
+            SystemDataFields.FIELD_OPE_S: ['', '', 'linux'],
+            SystemDataFields.FIELD_AUT_B: [False, True, False]
+        }
+
+        self.assertEqual(
+            [self.__get_record_contract_tuple(1000001, SystemDataFields.FIELD_BAT_L, 49),
+             self.__get_record_contract_tuple(1000001, SystemDataFields.FIELD_AUT_B, True),
+             self.__get_record_contract_tuple(1000002, SystemDataFields.FIELD_OPE_S, 'linux')],
+            from_columns_to_contract_tuples(columns, REC_T))
+
+    def test_when_an_id_value_field_has_the_id_0_then_an_exception_raises(self):
+        """
+        Given columnar data when an id-value field has the id 0, as one value or in its column,
+        then a ValueError raises
+        """
+
+        for ids in (0, [1, 0]):
+            with self.subTest(ids=ids):
+                columns = {
+                    SystemDataFields.FIELD_SYS_T: [1000000, 1000001],
+                    SystemDataFields.FIELD_TCH_S: {IdValueFields.FIELD_ID: ids,
+                                                   IdValueFields.FIELD_VALUE: [1, 2]}
+                }
+
+                with self.assertRaises(ValueError):
+                    from_columns_to_contract_tuples(columns, REC_T)
+
+    def test_when_a_column_is_not_valid_then_an_exception_raises(self):
+        """
+        Given columnar data when a column is out of range, has another type or another number of
+        rows then a ValueError raises
+        """
+
+        for touch_values, battery_values in (([1, 65536], [1, 2]), ([1, 2], [1, 'a']),
+                                             ([1, 2], [1])):
+            with self.subTest(touch_values=touch_values, battery_values=battery_values):
+                columns = {
+                    SystemDataFields.FIELD_SYS_T: [1000000, 1000001],
+                    SystemDataFields.FIELD_TCH_S: {IdValueFields.FIELD_ID: 1,
+                                                   IdValueFields.FIELD_VALUE: touch_values},
+                    SystemDataFields.FIELD_BAT_L: battery_values
+                }
+
+                with self.assertRaises(ValueError):
+                    from_columns_to_contract_tuples(columns, REC_T)
+
+    def test_when_a_value_is_out_of_the_field_range_then_the_exception_names_its_row(self):
+        """
+        Given columnar data when a value of a field without id is out of its range then a
+        ValueError raises with the field and the row of the value
+        """
+
+        columns = {
+            SystemDataFields.FIELD_SYS_T: [1000000, 1000001, 1000002],
+            SystemDataFields.FIELD_BAT_L: [50, 256, -1]
+        }
+
+        with self.assertRaisesRegex(ValueError, f"{SystemDataFields.FIELD_BAT_L} value of row 1"):
+            from_columns_to_contract_tuples(columns, REC_T)
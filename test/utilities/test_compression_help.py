@@ -0,0 +1,68 @@
+"""
+This is a class-containing module.
+
+It contains the GivenCompressionDictionaries class, which inherits from TestCase and performs all
+the compression_help dictionary tests.
+"""
+
+from unittest import TestCase
+
+from bcubed.constants.records.fields.system_data_fields import SystemDataFields
+from bcubed.utilities.compression_help import (
+    ENCODING_DICTIONARY_DEFLATE,
+    clear_compression_dictionaries,
+    compress_value,
+    compression_dictionary_scope,
+    decompress_value,
+    get_compression_dictionary_ids,
+    register_compression_dictionary
+)
+
+
+ADDRESS = '0x' + '01' * 20
+OTHER_ADDRESS = '0x' + '02' * 20
+
+VALUE = '{"process": "ros2 launch bcubed", "state": "running"}'
+
+
+class GivenCompressionDictionaries(TestCase):
+    """
+    It contains the test suite related with the compression dictionaries of compression_help.
+    Add tests as required.
+    """
+
+    def tearDown(self) -> None:
+        for contract_address in (ADDRESS, OTHER_ADDRESS):
+            with compression_dictionary_scope(contract_address):
+                clear_compression_dictionaries()
+
+        return super().tearDown()
+
+    def test_when_two_contracts_register_the_same_id_then_each_one_uses_its_dictionary(self):
+        """
+        Given the compression dictionaries of two contracts with the same identifier when
+        compressing and decompressing values in the scope of each contract then each one uses its
+        own dictionary, and none of them is used out of their scopes
+        """
+
+        with compression_dictionary_scope(ADDRESS):
+            register_compression_dictionary(0, SystemDataFields.FIELD_TXT_C, VALUE.encode())
+            value = compress_value(VALUE, SystemDataFields.FIELD_TXT_C)
+
+        with compression_dictionary_scope(OTHER_ADDRESS):
+            register_compression_dictionary(0, SystemDataFields.FIELD_TXT_C, b'other dictionary')
+            other_value = compress_value(VALUE, SystemDataFields.FIELD_TXT_C)
+
+        self.assertEqual(ENCODING_DICTIONARY_DEFLATE, value[0])
+        self.assertNotEqual(value, other_value)
+
+        with compression_dictionary_scope(ADDRESS):
+            self.assertEqual(VALUE, decompress_value(value))
+
+        with compression_dictionary_scope(OTHER_ADDRESS):
+            self.assertEqual({0}, get_compression_dictionary_ids())
+            self.assertEqual(VALUE, decompress_value(other_value))
+
+        self.assertEqual(set(), get_compression_dictionary_ids())
+        with self.assertRaises(ValueError):
+            decompress_value(value)